@@ -0,0 +1,58 @@
+"""Command line interface of the benchmark suite.
+
+Usage::
+
+    python -m benchmarks                      # run all cases
+    python -m benchmarks -k chain             # run cases matching a regex
+    python -m benchmarks --save               # store results as the baseline
+    python -m benchmarks --compare            # fail on regressions
+"""
+import argparse
+import os
+import sys
+
+from .cases import get_cases
+from .runner import compare, load, report, run, save
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run(get_cases(), pattern=args.pattern, repeat=args.repeat)
+    baseline = load(args.baseline) if os.path.exists(args.baseline) else {}
+    print(report(baseline, results))
+
+    if args.save:
+        save(args.baseline, {**baseline, **results})
+        print(f"\nSaved baseline to {args.baseline}")
+
+    if args.compare:
+        if not baseline:
+            print(f"\nNo baseline at {args.baseline}", file=sys.stderr)
+            return 2
+        regressions = compare(baseline, results, threshold=args.threshold)
+        if regressions:
+            print("\nREGRESSIONS:", file=sys.stderr)
+            for regression in regressions:
+                print(
+                    f"  {regression.name}: {regression.ratio:.2f}x slower "
+                    "than baseline",
+                    file=sys.stderr,
+                )
+            return 1
+        print("\nNo regressions.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""Benchmark cases.
+
+Each case is a function that takes no arguments. Cases are grouped by
+prefix, e.g. ``converter/...`` or ``chain/...``.
+"""
+import contextvars
+import decimal
+import tempfile
+import urllib.parse
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List
+
+import limier
+from limier import (
+    Bounds,
+    Cached,
+    Chain,
+    ConversionError,
+    Converter,
+    Equiv,
+    Filter,
+    OneOf,
+    Range,
+    Regex,
+    RegexSet,
+    Transform,
+    converted,
+)
+from limier import codecache
+from limier.aliases import ALIASES
+
+# Candidate inputs for `str.is*` filters: the first valid one is used.
+_STRINGS = ("abc", "ABC", "Abc", "123", "a1", "abc_1", " ", "²")
+
+# Inputs of the other default aliases.
+_SAMPLES = {
+    bin: "101",
+    oct: "17",
+    decimal.Decimal: "1.5",
+    bool: "yes",
+    None: "null",
+    range: "1:3",
+}
+
+
+def _positive(value: int) -> int:
+    if value < 0:
+        raise ValueError("Expected positive value")
+    return value
+
+
+def _add(x, y):
+    return x + y
+
+
+def _call_cases() -> Dict[str, Callable]:
+    @converted
+    def add(x: int, y: int):
+        return x + y
+
+    @converted(typed=True)
+    def add_typed(x: int, y: int = 0):
+        return x + y
+
+    # Wrappers of registries that can be modified check their version.
+    @converted(registry=limier.Registry.default())
+    def add_watched(x: int, y: int):
+        return x + y
+
+    class Service:
+        @converted
+        def add(self, x: int, y: int):
+            return x + y
+
+        @classmethod
+        @converted
+        def add_class(cls, x: int, y: int):
+            return x + y
+
+    service = Service()
+
+    @converted(bypass=True)
+    def add_bypass(x: int, y: int):
+        return x + y
+
+    # A trusted context, entered once (`Context.run` costs little).
+    context = contextvars.copy_context()
+    context.run(limier.trusted().__enter__)
+
+    @converted(lazy={"amount"})
+    def pay(amount: decimal.Decimal, dry_run):
+        return None if dry_run else amount.value
+
+    @converted
+    def pay_eager(amount: decimal.Decimal, dry_run):
+        return None if dry_run else amount
+
+    return {
+        "call/raw": lambda: _add(1, 2),
+        "call/converted": lambda: add("1", "2"),
+        "call/converted-kwargs": lambda: add(x="1", y="2"),
+        "call/converted-watched": lambda: add_watched("1", "2"),
+        "call/converted-bypass": lambda: add_bypass("1", "2"),
+        "call/converted-bypass-trusted": lambda: context.run(
+            add_bypass, 1, 2
+        ),
+        "call/raw-attribute": lambda: add.raw(1, 2),
+        "call/lazy-unused": lambda: pay("1.5", True),
+        "call/lazy-used": lambda: pay("1.5", False),
+        "call/eager": lambda: pay_eager("1.5", True),
+        "call/method": lambda: service.add("1", "2"),
+        "call/classmethod": lambda: Service.add_class("1", "2"),
+        "call/converted-typed": lambda: add_typed(1, 2),
+        "call/converted-typed-default": lambda: add_typed(1),
+    }
+
+
+def _converter_cases() -> Dict[str, Callable]:
+    converters = {
+        "Filter": (Filter(str.isdigit), "123"),
+        "Transform": (Transform(int), "123"),
+        "OneOf": (OneOf("apple", "orange", "banana"), "orange"),
+        "Equiv": (Equiv({("yes", "y"): True, ("no", "n"): False}), "no"),
+        "Regex": (Regex(r"\w+"), "hello"),
+        "Range": (Range(), "1:3"),
+        "RegexSet": (RegexSet(Regex(r"[a-z]+$"), Range()), "1:3"),
+        "Cached": (Cached(Range()), "1:3"),
+        "Chain": (limier.chain(int, _positive), "123"),
+    }
+    cases = {
+        f"converter/{name}": (lambda c=converter, v=value: c(v))
+        for name, (converter, value) in converters.items()
+    }
+
+    for alias, converter in ALIASES.items():
+        if alias in _SAMPLES:
+            value = _SAMPLES[alias]
+        else:
+            value = next(
+                sample for sample in _STRINGS if converter.test(sample)
+            )
+        name = getattr(alias, "__name__", repr(alias))
+        cases[f"alias/{name}"] = lambda c=converter, v=value: c(v)
+
+    return cases
+
+
+def _chain_cases() -> Dict[str, Callable]:
+    cases = {}
+    for depth in (1, 2, 4, 8, 16):
+        converter = limier.chain(int, *[_positive] * (depth - 1))
+        cases[f"chain/depth-{depth:02}"] = lambda c=converter: c("123")
+    # Fused into `Int(min=0)` by the registry.
+    unfused = Chain(int, Bounds(min=0))
+    fused = limier.chain(int, Bounds(min=0))
+    cases["chain/int-bounds"] = lambda: unfused("123")
+    cases["chain/int-bounds-fused"] = lambda: fused("123")
+    return cases
+
+
+def _signature_cases() -> Dict[str, Callable]:
+    cases = {}
+    for count in (1, 4, 16, 64):
+        params = [f"p{index}" for index in range(count)]
+        namespace: dict = {}
+        exec(  # pylint: disable=exec-used
+            f"def func({', '.join(p + ': int' for p in params)}): pass",
+            namespace,
+        )
+        func = converted(namespace["func"])
+        args = ["1"] * count
+        cases[f"signature/params-{count:02}"] = (
+            lambda f=func, a=args: f(*a)
+        )
+    return cases
+
+
+@dataclass
+class _Address:
+    zip: int
+    city: str
+
+
+@dataclass
+class _User:
+    name: str
+    age: int
+    address: _Address
+    tags: List[str]
+
+
+def _structure_cases() -> Dict[str, Callable]:
+    payload = {
+        "name": "alice",
+        "age": "42",
+        "address": {"zip": "75001", "city": "Paris"},
+        "tags": ["admin", "staff"],
+    }
+    to_user = limier.Registry.shared().get(_User)
+
+    @converted
+    def make_address(zip: int, city: str):  # pylint: disable=redefined-builtin
+        return _Address(zip, city)
+
+    def to_address(value: dict) -> _Address:
+        return make_address(**value)
+
+    @converted
+    def make_user(name: str, age: int, address: to_address, tags: List[str]):
+        return _User(name, age, address, tags)
+
+    return {
+        "structure/compiled": lambda: to_user(payload),
+        "structure/converted-constructors": lambda: make_user(
+            payload["name"],
+            payload["age"],
+            payload["address"],
+            payload["tags"],
+        ),
+    }
+
+
+def _failure_cases() -> Dict[str, Callable]:
+    @converted
+    def add(x: int, y: int):
+        return x + y
+
+    one_of = OneOf(*map(str, range(1000)))
+
+    def fail(func, *args):
+        try:
+            func(*args)
+        except (ConversionError, ValueError):
+            pass
+
+    return {
+        "failure/converted-one": lambda: fail(add, "foo", "1"),
+        "failure/converted-all": lambda: fail(add, "foo", "bar"),
+        "failure/one-of-1000": lambda: fail(one_of, "foo"),
+        "failure/transform": lambda: fail(Transform(int), "foo"),
+        "failure/regex": lambda: fail(Range(), "foo"),
+    }
+
+
+def _decoration_cases() -> Dict[str, Callable]:
+    def add(x: int, y: int, z: float = 0.0):
+        return x + y + z
+
+    directory = tempfile.mkdtemp(prefix="limier-bench-")
+
+    def decorate(memory: bool, disk: bool):
+        if not memory:
+            codecache._memory.clear()  # pylint: disable=protected-access
+        if disk:
+            codecache.enable(directory)
+        try:
+            converted(add)
+        finally:
+            codecache.disable()
+
+    return {
+        "decorate/compile": lambda: decorate(memory=False, disk=False),
+        "decorate/disk-cache": lambda: decorate(memory=False, disk=True),
+        "decorate/memory-cache": lambda: decorate(memory=True, disk=False),
+    }
+
+
+def _query_cases() -> Dict[str, Callable]:
+    @converted
+    def search(q: str, page: int = 1, size: int = 20, tag: List[str] = ()):
+        return q, page, size, tag
+
+    query = "q=caf%C3%A9&page=2&size=50&tag=a&tag=b&utm_source=mail"
+    parser = limier.QueryParser(search)
+
+    def parse_qs():
+        params = urllib.parse.parse_qs(query)
+        tags = params.pop("tag", [])
+        params.pop("utm_source", None)
+        last = {name: values[-1] for name, values in params.items()}
+        return search(**last, tag=tags)
+
+    return {
+        "query/parse-qs-converted": parse_qs,
+        "query/parser": lambda: parser(query),
+        "query/parser-bytes": lambda: parser(query.encode()),
+    }
+
+
+def _batch_cases() -> Dict[str, Callable]:
+    # Vectorized conversions, and value-by-value ones for comparison.
+    size = 10000
+    converters = {
+        "int": (int, [str(index) for index in range(size)]),
+        "float": (float, [f"{index}.5" for index in range(size)]),
+        "bool": (limier.get(bool), ["yes", "no", "true", "0"] * (size // 4)),
+        "one-of": (OneOf(*"abcdefgh"), list("abcdefghij" * (size // 10))),
+        "isdigit": (Filter(str.isdigit), ["123", "12a"] * (size // 2)),
+    }
+    cases = {}
+    for name, (converter, values) in converters.items():
+        cases[f"batch/{name}"] = partial(
+            limier.convert_many, converter, values
+        )
+        if isinstance(converter, Filter):
+            cases[f"batch/{name}-loop"] = partial(
+                Converter.convert_many, converter, values
+            )
+    return cases
+
+
+def get_cases() -> Dict[str, Callable]:
+    """Build all benchmark cases, by name."""
+    return {
+        **_call_cases(),
+        **_converter_cases(),
+        **_chain_cases(),
+        **_signature_cases(),
+        **_structure_cases(),
+        **_failure_cases(),
+        **_decoration_cases(),
+        **_query_cases(),
+        **_batch_cases(),
+    }
@@ -0,0 +1,107 @@
+"""Run benchmark cases and compare results against a baseline."""
+import json
+import re
+import timeit
+from typing import Callable, Dict, List, NamedTuple
+
+# Case that other timings are normalized by, so that results
+# of different machines can be compared.
+REFERENCE = "call/raw"
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def measure(case: Callable, repeat: int = 5) -> float:
+    """Return the best time of a call to ``case``, in nanoseconds."""
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(
+    cases: Dict[str, Callable], pattern: str = "", repeat: int = 5
+) -> Dict[str, float]:
+    """Measure cases whose name matches ``pattern``.
+
+    Returns
+    -------
+    results : dict
+        Mapping of case names to timings, in nanoseconds.
+        The reference case is always measured.
+    """
+    regex = re.compile(pattern)
+    return {
+        name: measure(case, repeat=repeat)
+        for name, case in cases.items()
+        if name == REFERENCE or regex.search(name)
+    }
+
+
+def normalize(results: Dict[str, float]) -> Dict[str, float]:
+    """Express timings relatively to the reference case."""
+    reference = results[REFERENCE]
+    return {name: value / reference for name, value in results.items()}
+
+
+def compare(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    threshold: float = 1.25,
+) -> List[Regression]:
+    """Find cases that are slower than in the baseline.
+
+    Timings are normalized by the reference case first.
+
+    Parameters
+    ----------
+    baseline, current : dict
+        Mapping of case names to timings.
+    threshold : float
+        Maximum accepted ratio of current to baseline timings.
+
+    Returns
+    -------
+    regressions : list
+    """
+    baseline = normalize(baseline)
+    current = normalize(current)
+    return [
+        Regression(name, baseline[name], value)
+        for name, value in current.items()
+        if name in baseline and value > baseline[name] * threshold
+    ]
+
+
+def report(
+    baseline: Dict[str, float], current: Dict[str, float]
+) -> str:
+    """Format a table of timings, with ratios to the baseline if any."""
+    normalized = normalize(baseline) if baseline else {}
+    relative = normalize(current)
+    width = max(map(len, current))
+    lines = [f"{'case':<{width}}  {'ns':>10}  {'x raw':>7}  {'vs base':>8}"]
+    for name, value in current.items():
+        line = f"{name:<{width}}  {value:>10.1f}  {relative[name]:>7.2f}"
+        if name in normalized:
+            line += f"  {relative[name] / normalized[name]:>8.2f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def load(path: str) -> Dict[str, float]:
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(path: str, results: Dict[str, float]):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
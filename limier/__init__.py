@@ -1,14 +1,38 @@
+from functools import wraps
+from typing import Callable
+
+from .batch import convert_many, parallel_convert
 from .converters import *
 from .decorators import converted
-from .exceptions import ConversionError
+from .exceptions import (
+    ConversionError,
+    InvalidFields,
+    InvalidValue,
+    RowConversionError,
+)
+from .instrumentation import Recorder
+from .lazy import Lazy
 from .registry import Registry
+from .routing import PathTemplate, QueryParser, RouteTable
+from .sets import MappedValues, SortedValues
+from .stream import Stream
+from .trust import trusted
 
 __version__ = "0.0.2"
 
-_REGISTRY = Registry.default()
 
-# Pre-bound methods
+def _bind(method: Callable, registry: Callable[[], Registry]) -> Callable:
+    @wraps(method)
+    def bound(*args, **kwargs):
+        return method(registry(), *args, **kwargs)
+
+    return bound
+
+
+# Pre-bound methods. Modifications apply to the global registry, which
+# decorators use by default from then on.
 # pylint: disable=invalid-name
-converter = _REGISTRY.converter
-get = _REGISTRY.get
-chain = _REGISTRY.chain
+converter = _bind(Registry.converter, Registry.global_registry)
+get = _bind(Registry.get, Registry.current)
+cache = _bind(Registry.cache, Registry.global_registry)
+chain = _bind(Registry.chain, Registry.current)
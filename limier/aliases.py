@@ -5,6 +5,16 @@ from typing import Any, Dict
 from .converters import Converter, Equiv, Filter, Range, Transform
 
 
+class _Bool(Equiv):
+    """``Equiv`` for ``bool`` that also accepts actual booleans, e.g. from
+    JSON documents."""
+
+    def __call__(self, value: Any) -> Any:
+        if type(value) is bool:
+            return value
+        return super().__call__(value)
+
+
 ALIASES: Dict[Any, Converter] = {
     # `str` filters
     **{
@@ -20,14 +30,22 @@ ALIASES: Dict[Any, Converter] = {
         decimal.Decimal, raised_if_invalid=decimal.InvalidOperation
     ),
     # Equivalents
-    bool: Equiv(
+    bool: _Bool(
         {
-            True: {"true", "True", "yes", "y", "1"},
-            False: {"false", "False", "no", "n", "0"},
+            ("true", "True", "yes", "y", "1"): True,
+            ("false", "False", "no", "n", "0"): False,
         }
     ),
-    None: Equiv({None: {"null", "none"}}),
+    None: Equiv({("null", "none"): None}),
     # Other
     range: Range(),
 }
-"""Default aliases that are recorded when using :func:`Registry.default <limier.registry.Registry.default>`."""
+"""Default aliases that are recorded in :func:`Registry.shared <limier.registry.Registry.shared>`."""
+
+BYTES_ALIASES: Dict[Any, Converter] = {
+    str: Transform(partial(str, encoding="utf-8")),
+}
+"""Default aliases for bytes-like input values.
+
+Other aliases use the ``for_bytes()`` variant of their converter.
+"""
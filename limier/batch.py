@@ -0,0 +1,171 @@
+from functools import partial, wraps
+from inspect import Parameter, signature
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .converters import Converter, Transform
+from .registry import Registry
+from .typevars import T
+
+
+def convert_many(
+    converter: Callable, values: Iterable[Any]
+) -> Tuple[List[Any], Dict[int, str]]:
+    """Convert a batch of values using any converter.
+
+    ``Converter`` objects use their ``convert_many`` method. Other
+    callables are applied value by value.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+    values : iterable
+
+    Returns
+    -------
+    converted : list
+        The converted values. Values that failed to convert
+        are replaced by ``None``.
+    errors : dict
+        Mapping of the indices of values that failed to convert
+        to the error message.
+    """
+    if isinstance(converter, Converter):
+        return converter.convert_many(values)
+
+    return Transform(converter).convert_many(values)
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    iterator = iter(values)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def parallel_convert(
+    converter: Callable,
+    values: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = 10000,
+) -> Tuple[List[Any], Dict[int, str]]:
+    """Convert a batch of values using a pool of processes.
+
+    Values are split into chunks which are converted in worker processes
+    using :func:`convert_many`. This pays off for CPU-heavy converters
+    only, since values and results are pickled to and from workers.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+        Must be picklable. All built-in converters are.
+    values : iterable
+    workers : int, optional
+        Number of processes. Defaults to the number of CPUs.
+    chunksize : int, optional
+        Number of values sent to a worker at once. Defaults to 10000.
+
+    Returns
+    -------
+    converted : list
+        The converted values, in the order of ``values``. Values that
+        failed to convert are replaced by ``None``.
+    errors : dict
+        Mapping of the indices of values that failed to convert
+        to the error message.
+    """
+    if chunksize <= 0:
+        raise ValueError(f"`chunksize` must be positive, got {chunksize}")
+
+    # `concurrent.futures.process` is slow to import.
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    converted: List[Any] = []
+    errors: Dict[int, str] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            partial(convert_many, converter), _chunks(values, chunksize)
+        )
+        for chunk, chunk_errors in results:
+            offset = len(converted)
+            converted += chunk
+            for index, message in chunk_errors.items():
+                errors[offset + index] = message
+
+    return converted, errors
+
+
+def batch(func: T = None, registry: Registry = None) -> T:
+    """Wrap a function over columns that converts them in batches.
+
+    Annotated arguments are expected to be columns, i.e. sequences of
+    values of the same length. They are converted using
+    :func:`convert_many`, and rows that failed to convert in any column
+    are left out before calling ``func``. Other arguments are passed
+    unchanged.
+
+    This is also available as ``converted.batch``.
+
+    Parameters
+    ----------
+    func : callable
+    registry : Registry, optional
+        Defaults to ``Registry.current()``.
+
+    Returns
+    -------
+    batched : callable
+        Wrapper of ``func`` which returns a tuple made of the return value
+        of ``func`` and a mapping of row indices to errors, each error
+        being a mapping of parameter names to messages.
+
+    Example
+    -------
+    >>> @converted.batch
+    ... def total(x: int, y: int):
+    ...     return sum(x) + sum(y)
+    >>> total(["1", "2", "foo"], ["3", "4", "5"])
+    (10, {2: {'x': "invalid literal for int() with base 10: 'foo'"}})
+    """
+    if func is None:
+        return partial(batch, registry=registry)
+
+    if registry is None:
+        registry = Registry.current()
+
+    sig = signature(func)
+
+    converters: Dict[str, Callable] = {
+        name: registry.get(param.annotation) or param.annotation
+        for name, param in sig.parameters.items()
+        if param.annotation is not Parameter.empty
+    }
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        errors: Dict[int, Dict[str, str]] = {}
+
+        for name, converter in converters.items():
+            column, column_errors = convert_many(
+                converter, bound.arguments[name]
+            )
+            bound.arguments[name] = column
+            for index, message in column_errors.items():
+                errors.setdefault(index, {})[name] = message
+
+        if errors:
+            for name in converters:
+                bound.arguments[name] = [
+                    value
+                    for index, value in enumerate(bound.arguments[name])
+                    if index not in errors
+                ]
+
+        return func(*bound.args, **bound.kwargs), errors
+
+    return wrapper
@@ -0,0 +1,142 @@
+"""Cache of the code generated for wrappers, chains and structures.
+
+Compiling generated source is most of the work done when decorating
+a function. Code objects are cached by source, in memory and optionally
+on disk, so that processes which decorate the same functions, e.g. the
+workers of a server, load them instead of compiling them again.
+
+The disk cache is enabled by :func:`enable`, or by setting the
+``LIMIER_CACHE_DIR`` environment variable. It can be populated ahead of
+time for the modules of a package, e.g. when building a deployment::
+
+    python -m limier.codecache --directory /app/.limier mypackage
+
+Converters are not cached: they are still resolved when decorating,
+and cached code does not depend on them.
+"""
+import importlib
+import marshal
+import os
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+from typing import Dict, List, Optional, Tuple
+
+_directory: Optional[str] = os.environ.get("LIMIER_CACHE_DIR") or None
+
+# Code objects by `(filename, source)`.
+_memory: Dict[Tuple[str, str], CodeType] = {}
+
+
+def enable(directory: str):
+    """Cache code objects in a directory.
+
+    Parameters
+    ----------
+    directory : str
+        Created if it does not exist.
+    """
+    global _directory  # pylint: disable=global-statement
+    os.makedirs(directory, exist_ok=True)
+    _directory = directory
+
+
+def disable():
+    """Stop using the disk cache. Code is still cached in memory."""
+    global _directory  # pylint: disable=global-statement
+    _directory = None
+
+
+def _path(directory: str, filename: str, source: str) -> str:
+    # `hashlib` is only imported when the disk cache is used.
+    # pylint: disable=import-outside-toplevel
+    from hashlib import sha256
+
+    # Bytecode is specific to the version of Python.
+    key = sha256(MAGIC_NUMBER + f"{filename}\0{source}".encode()).hexdigest()
+    return os.path.join(directory, f"{key}.code")
+
+
+def _load(path: str) -> Optional[CodeType]:
+    try:
+        with open(path, "rb") as file:
+            return marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        # Missing or corrupted: compiled again.
+        return None
+
+
+def _store(path: str, code: CodeType):
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    directory = os.path.dirname(path)
+    try:
+        # Written atomically, for concurrent readers and writers.
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            marshal.dump(code, file)
+        os.replace(temporary, path)
+    except OSError:
+        # The cache is an optimization: failing to write it is not fatal.
+        pass
+
+
+def compile_source(source: str, filename: str) -> CodeType:
+    """Compile generated source, using the cache.
+
+    Parameters
+    ----------
+    source : str
+        Source of a module, e.g. defining a function.
+    filename : str
+        Shown in tracebacks, e.g. ``"<limier wrapper of f>"``.
+
+    Returns
+    -------
+    code : code object
+        To be executed using ``exec()``.
+    """
+    key = (filename, source)
+    code = _memory.get(key)
+    if code is not None:
+        return code
+    directory = _directory
+    path = None if directory is None else _path(directory, filename, source)
+    if path is not None:
+        code = _load(path)
+    if code is None:
+        code = compile(source, filename, "exec")
+        if path is not None:
+            _store(path, code)
+    _memory[key] = code
+    return code
+
+
+def precompile(*names: str) -> List[str]:
+    """Import modules so that the code they generate is cached.
+
+    Enable the disk cache first for the code to be persisted.
+
+    Parameters
+    ----------
+    *names : str
+        Names of modules. The modules of packages are also imported.
+
+    Returns
+    -------
+    modules : list of str
+        The names of the imported modules.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pkgutil
+
+    imported = []
+    for name in names:
+        module = importlib.import_module(name)
+        imported.append(name)
+        for info in pkgutil.walk_packages(
+            getattr(module, "__path__", []), prefix=f"{name}."
+        ):
+            importlib.import_module(info.name)
+            imported.append(info.name)
+    return imported
@@ -0,0 +1,37 @@
+"""Command line interface of the code cache.
+
+Run as ``python -m limier.codecache``, see :mod:`limier.codecache`.
+"""
+import argparse
+import os
+from typing import Sequence
+
+from . import enable, precompile
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m limier.codecache",
+        description="Cache the code generated by modules on disk.",
+    )
+    parser.add_argument("modules", nargs="+", help="modules or packages")
+    parser.add_argument(
+        "--directory",
+        default=os.environ.get("LIMIER_CACHE_DIR") or None,
+        help="defaults to the LIMIER_CACHE_DIR environment variable",
+    )
+    args = parser.parse_args(argv)
+    if args.directory is None:
+        parser.error("--directory or LIMIER_CACHE_DIR is required")
+    enable(args.directory)
+    before = len(os.listdir(args.directory))
+    modules = precompile(*args.modules)
+    written = len(os.listdir(args.directory)) - before
+    print(
+        f"Imported {len(modules)} modules, "
+        f"cached {written} new code objects in {args.directory}"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,17 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Import NumPy on first use, so that it does not slow down imports.
+
+    Returns
+    -------
+    numpy : module or None
+        ``None`` if NumPy is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
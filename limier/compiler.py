@@ -0,0 +1,345 @@
+from inspect import Parameter, Signature, iscoroutinefunction
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .codecache import compile_source
+from .converters import Converter, is_async
+from .exceptions import ConversionError
+from .trust import TRUSTED
+
+_MISSING = object()
+
+
+async def _gather(
+    tasks: Dict[str, Awaitable]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    # Run async converters concurrently and split their outcomes into
+    # converted values and conversion errors.
+    # `asyncio` is slow to import and only needed by async wrappers.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, outcome in zip(tasks, outcomes):
+        if isinstance(outcome, ValueError):
+            errors[name] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[name] = outcome
+    return results, errors
+
+
+class Plan:
+    """Conversion plan of a function, derived from its signature.
+
+    The plan generates the source of a wrapper that has the same parameter
+    layout as the function, so that Python itself takes care of binding
+    arguments and applying defaults. Only the parameters that have
+    a converter are processed on each call.
+
+    If ``func`` is a coroutine function, the wrapper is one too, and
+    ``async`` converters of different parameters are awaited concurrently.
+
+    Parameters
+    ----------
+    func : callable
+    sig : inspect.Signature
+    converters : dict
+        Mapping of parameter names to converters.
+    defaults : dict, optional
+        Mapping of parameter names to already converted defaults.
+        These are passed as-is when the argument is omitted.
+    types : dict, optional
+        Mapping of parameter names to the type their converter outputs.
+        Arguments that already are an instance of it are not converted.
+    fail_fast : bool, optional
+        Whether to raise ``ConversionError`` as soon as an argument fails
+        to convert, instead of converting all arguments to report all errors.
+        ``async`` converters are always awaited together.
+    registry : Registry, optional
+        The registry converters were resolved with, if it can be modified.
+        Once it is, the wrapper calls ``refresh()`` instead of converting,
+        and calls the wrapper it returns with the same arguments.
+    snapshot : optional
+        The snapshot of ``registry`` read before resolving converters.
+    refresh : callable, optional
+        Required if ``registry`` is given.
+    bypass : bool, optional
+        Whether conversions are skipped in :class:`~limier.trust.trusted`
+        contexts. Defaults to ``False``.
+    lazy : collection of str, optional
+        Names of parameters whose converter builds a
+        :class:`~limier.lazy.Lazy` argument. These are still built
+        in trusted contexts.
+    input_type : type, optional
+        The type of the arguments the converters were chosen for, if not
+        ``str``. See :meth:`Registry.get <limier.registry.Registry.get>`.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        sig: Signature,
+        converters: Mapping[str, Converter],
+        defaults: Optional[Mapping[str, Any]] = None,
+        types: Optional[Mapping[str, type]] = None,
+        fail_fast: bool = False,
+        registry: Any = None,
+        snapshot: Any = None,
+        refresh: Callable[[], Callable] = None,
+        bypass: bool = False,
+        lazy: Collection[str] = (),
+        input_type: Optional[type] = None,
+    ):
+        self.func = func
+        self.sig = sig
+        self.converters = converters
+        self.defaults = defaults or {}
+        self.types = types or {}
+        self.fail_fast = fail_fast
+        self.registry = registry
+        self.snapshot = snapshot
+        self.refresh = refresh
+        self.bypass = bypass
+        self.lazy = frozenset(lazy)
+        self.input_type = input_type
+        self.is_async = iscoroutinefunction(func)
+        self.awaited = {
+            name
+            for name, converter in self.converters.items()
+            if is_async(converter)
+        }
+        if self.awaited and not self.is_async:
+            raise TypeError(
+                "async converters can only be used on coroutine functions "
+                f"(parameters: {', '.join(sorted(self.awaited))})"
+            )
+
+    def namespace(self) -> Dict[str, Any]:
+        """Build the globals the generated wrapper is executed with."""
+        namespace: Dict[str, Any] = {
+            "_limier_func": self.func,
+            "_limier_error": ConversionError,
+            "_limier_missing": _MISSING,
+            "_limier_gather": _gather,
+            # Built-ins are bound too, since parameters may shadow them.
+            "_limier_isinstance": isinstance,
+            "_limier_value_error": ValueError,
+        }
+        if self.bypass:
+            # pylint: disable=import-outside-toplevel
+            from random import random
+
+            namespace["_limier_trusted"] = TRUSTED
+            namespace["_limier_random"] = random
+        if self.registry is not None:
+            namespace["_limier_registry"] = self.registry
+            namespace["_limier_snapshot"] = self.snapshot
+            namespace["_limier_refresh"] = self.refresh
+        for index, param in enumerate(self.sig.parameters.values()):
+            if param.name in self.defaults:
+                namespace[f"_limier_default_{index}"] = self.defaults[
+                    param.name
+                ]
+                namespace[f"_limier_declared_{index}"] = param.default
+            elif param.default is not Parameter.empty:
+                namespace[f"_limier_default_{index}"] = param.default
+            if param.name in self.converters:
+                namespace[f"_limier_convert_{index}"] = self.converters[
+                    param.name
+                ]
+            if param.name in self.types:
+                namespace[f"_limier_type_{index}"] = self.types[param.name]
+        return namespace
+
+    def _convert(self, index: int, name: str) -> List[str]:
+        # Lines that convert the argument, or store the conversion error.
+        # Async conversions are only scheduled here.
+        if name in self.awaited:
+            lines = [
+                f"_limier_tasks[{name!r}] = _limier_convert_{index}({name})"
+            ]
+        elif self.fail_fast:
+            lines = [
+                "try:",
+                f"    {name} = _limier_convert_{index}({name})",
+                "except _limier_value_error as _limier_exc:",
+                f"    raise _limier_error(**{{{name!r}: _limier_exc}})",
+            ]
+        else:
+            # Tracebacks are dropped: they would reference this frame,
+            # which references the errors, making a reference cycle.
+            lines = [
+                "try:",
+                f"    {name} = _limier_convert_{index}({name})",
+                "except _limier_value_error as _limier_exc:",
+                "    if _limier_errors is None:",
+                "        _limier_errors = {}",
+                f"    _limier_errors[{name!r}] = "
+                "_limier_exc.with_traceback(None)",
+            ]
+        if name in self.types:
+            condition = (
+                f"not _limier_isinstance({name}, _limier_type_{index})"
+            )
+            if name in self.defaults:
+                lines = [
+                    f"if {name} is _limier_missing:",
+                    f"    {name} = _limier_default_{index}",
+                    f"elif {condition}:",
+                    *("    " + line for line in lines),
+                ]
+            else:
+                lines = [f"if {condition}:", *("    " + line for line in lines)]
+        elif name in self.defaults:
+            lines = [
+                f"if {name} is _limier_missing:",
+                f"    {name} = _limier_default_{index}",
+                "else:",
+                *("    " + line for line in lines),
+            ]
+        return ["    " + line for line in lines]
+
+    def source(self) -> str:
+        """Generate the source code of the wrapper.
+
+        Returns
+        -------
+        source : str
+            Definition of a ``wrapper`` function.
+        """
+        params: List[str] = []
+        call: List[str] = []
+        body: List[str] = []
+        # Async conversions are scheduled after sync conversions, so that
+        # no coroutine is left unawaited if a sync conversion fails fast.
+        scheduled: List[str] = []
+        seen_keyword_only = False
+        parameters = list(self.sig.parameters.values())
+
+        for index, param in enumerate(parameters):
+            name = param.name
+            if param.kind is Parameter.VAR_POSITIONAL:
+                params.append(f"*{name}")
+                call.append(f"*{name}")
+                seen_keyword_only = True
+            elif param.kind is Parameter.VAR_KEYWORD:
+                params.append(f"**{name}")
+                call.append(f"**{name}")
+            else:
+                if param.kind is Parameter.KEYWORD_ONLY:
+                    if not seen_keyword_only:
+                        params.append("*")
+                        seen_keyword_only = True
+                    call.append(f"{name}={name}")
+                else:
+                    call.append(name)
+                if param.default is Parameter.empty:
+                    params.append(name)
+                elif name in self.defaults:
+                    params.append(f"{name}=_limier_missing")
+                else:
+                    params.append(f"{name}=_limier_default_{index}")
+
+            if param.kind is Parameter.POSITIONAL_ONLY and (
+                index + 1 == len(parameters)
+                or parameters[index + 1].kind is not Parameter.POSITIONAL_ONLY
+            ):
+                params.append("/")
+
+            if name in self.awaited:
+                scheduled += self._convert(index, name)
+            elif name in self.converters:
+                body += self._convert(index, name)
+
+        prefix = "async " if self.is_async else ""
+        await_ = "await " if self.is_async else ""
+        lines = [f"{prefix}def wrapper({', '.join(params)}):"]
+        if self.bypass:
+            lines += [
+                "    _limier_sample = _limier_trusted.get()",
+                "    if _limier_sample is not None and ("
+                "not _limier_sample or _limier_random() >= _limier_sample):",
+            ]
+            for index, name in enumerate(self.sig.parameters):
+                if name in self.defaults:
+                    lines += [
+                        f"        if {name} is _limier_missing:",
+                        f"            {name} = _limier_default_{index}",
+                    ]
+                if name in self.lazy:
+                    # Building a lazy argument does not convert it.
+                    lines.append(
+                        f"        {name} = _limier_convert_{index}({name})"
+                    )
+            lines.append(
+                f"        return {await_}_limier_func({', '.join(call)})"
+            )
+        if self.registry is not None:
+            lines.append(
+                "    if _limier_registry._snapshot is not _limier_snapshot:"
+            )
+            # The new wrapper may not have converted the same defaults:
+            # it is passed the declared ones instead of placeholders.
+            for index, name in enumerate(self.sig.parameters):
+                if name in self.defaults:
+                    lines += [
+                        f"        if {name} is _limier_missing:",
+                        f"            {name} = _limier_declared_{index}",
+                    ]
+            lines.append(
+                f"        return {await_}_limier_refresh()({', '.join(call)})"
+            )
+        if body or scheduled:
+            lines.append("    _limier_errors = None")
+            lines += body
+            if scheduled:
+                lines.append("    _limier_tasks = {}")
+                lines += scheduled
+                lines += [
+                    "    if _limier_tasks:",
+                    "        _limier_results, _limier_failures = "
+                    "await _limier_gather(_limier_tasks)",
+                    "        if _limier_failures:",
+                    "            _limier_errors = "
+                    "{**(_limier_errors or {}), **_limier_failures}",
+                ]
+                lines += [
+                    f"        {name} = _limier_results.get({name!r}, {name})"
+                    for name in self.sig.parameters
+                    if name in self.awaited
+                ]
+            lines += [
+                "    if _limier_errors:",
+                "        raise _limier_error(**_limier_errors)",
+            ]
+        lines.append(f"    return {await_}_limier_func({', '.join(call)})")
+        return "\n".join(lines) + "\n"
+
+    def compile(self) -> Callable:
+        """Compile the wrapper.
+
+        Returns
+        -------
+        wrapper : callable
+            A function that applies the converters to its arguments
+            before calling the planned function.
+        """
+        namespace = self.namespace()
+        name = getattr(self.func, "__qualname__", repr(self.func))
+        filename = f"<limier wrapper of {name}>"
+        exec(  # pylint: disable=exec-used
+            compile_source(self.source(), filename), namespace
+        )
+        return namespace["wrapper"]
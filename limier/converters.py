@@ -1,16 +1,35 @@
+import copy
+import dataclasses
+import decimal
 import re
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from inspect import iscoroutinefunction
+from collections.abc import Mapping
 from typing import (
+    Any,
     Callable,
+    Container,
     Dict,
     Generic,
+    Iterable,
+    List,
     Match,
+    NamedTuple,
     Optional,
     Pattern,
+    Sequence,
     Tuple,
     Type,
     Union,
+    get_type_hints,
 )
 
+from .codecache import compile_source
+from .compat import get_numpy
+from .exceptions import InvalidFields, InvalidValue
 from .typevars import T, U, V, W  # pylint: disable=unused-import
 
 __all__ = (
@@ -21,8 +40,76 @@ __all__ = (
     "OneOf",
     "Regex",
     "Range",
+    "Bounds",
+    "Int",
+    "Float",
+    "DecimalRange",
+    "Cached",
+    "CacheInfo",
+    "Chain",
+    "RegexSet",
+    "UnionOf",
+    "ListOf",
+    "TupleOf",
+    "DictOf",
+    "Structure",
+    "for_bytes",
+    "fuse",
 )
 
+_MISSING = object()
+
+# Input types for which converters use their bytes variant.
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _to_bytes(value: Any) -> Any:
+    # Hashable version of a bytes-like value. Only memoryviews and
+    # bytearrays are copied.
+    if isinstance(value, (memoryview, bytearray)):
+        return bytes(value)
+    return value
+
+
+def _encode(value: Any) -> Any:
+    return value.encode() if isinstance(value, str) else value
+
+
+def is_async(converter: Callable) -> bool:
+    """Return whether a converter is an ``async`` callable."""
+    return iscoroutinefunction(converter) or iscoroutinefunction(
+        getattr(converter, "__call__", None)
+    )
+
+
+def _str_array(values: List[Any]) -> Optional["numpy.ndarray"]:
+    # Array of values for vectorized conversions, if they are all strings.
+    # NumPy converts mixed values to strings, which would accept values
+    # that converters reject, e.g. `1` for `OneOf("1")`.
+    if set(map(type, values)) != {str}:
+        return None
+    return get_numpy().asarray(values)
+
+
+def for_bytes(converter: Callable) -> Callable:
+    """Return the variant of a converter that accepts bytes-like values.
+
+    Bytes-like values are ``bytes``, ``bytearray`` and ``memoryview``.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+
+    Returns
+    -------
+    variant : callable
+        The result of ``converter.for_bytes()`` for ``Converter`` objects,
+        otherwise the converter itself.
+    """
+    if isinstance(converter, Converter):
+        return converter.for_bytes()
+    return converter
+
 
 class Converter(Generic[T, V]):  # pylint: disable=unsubscriptable-object
     """Class-style definition of the base converter interface.
@@ -37,11 +124,68 @@ class Converter(Generic[T, V]):  # pylint: disable=unsubscriptable-object
 
     .. note::
         Concrete subclasses should implement ``__call__(self, value)``.
+        They may also override ``convert_many(self, values)`` with
+        a faster implementation, and ``for_bytes(self)`` if they
+        need a different implementation for bytes-like values.
     """
 
     def __call__(self, value: T) -> V:
         raise NotImplementedError
 
+    def for_bytes(self) -> "Converter":
+        """Return a variant of the converter for bytes-like values.
+
+        Returns
+        -------
+        variant : Converter
+            The converter itself by default.
+        """
+        return self
+
+    def convert_many(
+        self, values: Iterable[T]
+    ) -> Tuple[List[Optional[V]], Dict[int, str]]:
+        """Convert a batch of values.
+
+        Parameters
+        ----------
+        values : iterable
+
+        Returns
+        -------
+        converted : list
+            The converted values. Values that failed to convert
+            are replaced by ``None``.
+        errors : dict
+            Mapping of the indices of values that failed to convert
+            to the error message.
+        """
+        converted: List[Optional[V]] = []
+        errors: Dict[int, str] = {}
+        for index, value in enumerate(values):
+            try:
+                converted.append(self(value))
+            except ValueError as exc:
+                converted.append(None)
+                errors[index] = str(exc)
+        return converted, errors
+
+    def _collect_errors(
+        self, converted: List[Optional[V]], values: Sequence[T], indices
+    ) -> Dict[int, str]:
+        # Build the error map of a vectorized conversion out of the indices
+        # of failed values. This is the slow path: messages are generated
+        # by converting the value again.
+        errors: Dict[int, str] = {}
+        for index in indices:
+            index = int(index)
+            converted[index] = None
+            try:
+                self(values[index])
+            except ValueError as exc:
+                errors[index] = str(exc)
+        return errors
+
 
 class Filter(Converter[T, T]):
     """Raise ``ValueError`` if ``test(value)`` evaluates to ``False``.
@@ -73,9 +217,71 @@ class Filter(Converter[T, T]):
 
     def __call__(self, value: T) -> T:
         if not self.test(value):
-            raise ValueError(self.get_failure_message(value))
+            raise InvalidValue(self, value)
         return value
 
+    def for_bytes(self) -> "Filter":
+        # `str` methods are replaced by their `bytes` counterpart.
+        name = getattr(self.test, "__name__", "")
+        if getattr(str, name, None) is not self.test:
+            return self
+        return Filter(_BytesTest(name))
+
+    def mask(self, array) -> Optional["numpy.ndarray"]:
+        """Vectorized version of ``test`` used by ``convert_many``.
+
+        Returns
+        -------
+        mask : numpy.ndarray or None
+            Boolean array that is ``True`` for valid values,
+            or ``None`` if the test cannot be vectorized.
+        """
+        name = getattr(self.test, "__name__", "")
+        if array.dtype.kind == "U" and getattr(str, name, None) is self.test:
+            vectorized = getattr(get_numpy().char, name, None)
+            if vectorized is not None:
+                return vectorized(array)
+        return None
+
+    def convert_many(
+        self, values: Iterable[T]
+    ) -> Tuple[List[Optional[T]], Dict[int, str]]:
+        numpy = get_numpy()
+        if numpy is None:
+            return super().convert_many(values)
+        values = list(values)
+        array = _str_array(values)
+        mask = None if array is None else self.mask(array)
+        if mask is None:
+            return super().convert_many(values)
+        converted: List[Optional[T]] = list(values)
+        errors = self._collect_errors(
+            converted, values, numpy.flatnonzero(~mask)
+        )
+        return converted, errors
+
+
+class _BytesTest:
+    """The ``bytes`` counterpart of a ``str`` test method, e.g. ``isdigit``.
+
+    Other bytes-like values are copied to ``bytes`` first. Values are
+    decoded as UTF-8 for methods that ``bytes`` lacks, e.g. ``isdecimal``.
+    """
+
+    def __init__(self, name: str):
+        self.__name__ = name
+        method = getattr(bytes, name, None)
+        self.decode = method is None
+        self.method = getattr(str, name) if self.decode else method
+
+    def __call__(self, value: Any) -> bool:
+        if self.decode:
+            try:
+                return self.method(str(value, "utf-8"))
+            except UnicodeDecodeError:
+                return False
+        return self.method(value if type(value) is bytes else bytes(value))
+
 
 class Transform(Converter[T, V]):
     """Transform the input value using a function.
@@ -114,7 +320,9 @@ class Transform(Converter[T, V]):
         try:
             return self.transformation(value)
         except self.raised_if_invalid as exc:
-            raise ValueError(str(exc)) from exc
+            if isinstance(exc, ValueError):
+                raise
+            raise InvalidValue(None, value) from exc
 
 
 class OneOf(Filter[T]):
@@ -127,6 +335,10 @@ class OneOf(Filter[T]):
         Must be hashable since a `set` is built out of
         them for faster `in` lookup.
 
+    .. tip::
+        For very large sets of values, use :meth:`using` with a compact
+        container from :mod:`limier.sets`.
+
     Example
     -------
     >>> accepted_fruits = OneOf("apple", "orange", "strawberrie")
@@ -136,19 +348,91 @@ class OneOf(Filter[T]):
     ValueError: expected one of 'orange, apple', got 'watermelon'
     """
 
+    # Above this number of values, failure messages do not list them.
+    max_listed = 20
+
     def __init__(self, *values: T):
-        self.values = set(values)
+        self.values: Container[T] = set(values)
+        self._bytes_variant: Optional["_BytesOneOf"] = None
+        super().__init__(test=self._contains)
+
+    @classmethod
+    def using(cls, values: Container[T]) -> "OneOf":
+        """Build from an existing container of values, without copying it.
 
-        def test(value: T) -> bool:
-            return value in self.values
+        Parameters
+        ----------
+        values : container
+            Any object that supports ``in`` and ``len()``, e.g.
+            a ``frozenset`` or a container from :mod:`limier.sets`.
+        """
+        one_of = cls()
+        one_of.values = values
+        return one_of
+
+    def reload(self, values: Container[T] = None):
+        """Replace the accepted values.
+
+        Functions already decorated with this converter use the new values
+        from then on.
+
+        Parameters
+        ----------
+        values : container, optional
+            The new container of values. If not given, the current
+            container is reloaded using its ``reload()`` method, e.g.
+            :meth:`MappedValues.reload <limier.sets.MappedValues.reload>`.
+        """
+        if values is None:
+            self.values.reload()  # type: ignore
+        else:
+            self.values = values
+            if self._bytes_variant is not None:
+                self._bytes_variant.values = _encode_values(values)
+
+    def _contains(self, value: T) -> bool:
+        return value in self.values
+
+    def mask(self, array) -> Optional["numpy.ndarray"]:
+        if array.dtype.kind != "U" or not isinstance(
+            self.values, (set, frozenset)
+        ):
+            return None
+        if set(map(type, self.values)) != {str}:
+            # NumPy would compare other values as strings.
+            return None
+        return get_numpy().isin(array, list(self.values))
 
-        super().__init__(test=test)
+    def for_bytes(self) -> "OneOf":
+        # Built once, so that reloads also apply to it.
+        if self._bytes_variant is None:
+            variant = _BytesOneOf()
+            variant.values = _encode_values(self.values)
+            self._bytes_variant = variant
+        return self._bytes_variant
 
     def get_failure_message(self, value: T) -> str:
-        values = ", ".join(map(str, self.values))
+        if len(self.values) > self.max_listed:  # type: ignore
+            count = len(self.values)  # type: ignore
+            return f"expected one of {count} values, got '{value}'"
+        values = ", ".join(sorted(map(str, self.values)))  # type: ignore
         return f"expected one of '{values}', got '{value}'"
 
 
+def _encode_values(values: Container[Any]) -> Container[Any]:
+    if not isinstance(values, (set, frozenset)):
+        # Compact containers accept bytes-like values.
+        return values
+    return set(map(_encode, values))
+
+
+class _BytesOneOf(OneOf[T]):
+    """Variant of ``OneOf`` for bytes-like values."""
+
+    def _contains(self, value: T) -> bool:
+        return _to_bytes(value) in self.values
+
+
 class Equiv(Converter[T, V]):
     """Map input values to equivalents.
 
@@ -196,11 +480,27 @@ class Equiv(Converter[T, V]):
 
         self.mapping = _mapping
 
+    def get_failure_message(self, value: T) -> str:
+        """The message to bundle with ``ValueError`` on failure."""
+        return f"no equivalent for '{value}'"
+
     def __call__(self, value: T) -> V:
-        try:
-            return self.mapping[value]
-        except KeyError as exc:
-            raise ValueError(f"no equivalent for '{value}'") from exc
+        result = self.mapping.get(value, _MISSING)
+        if result is _MISSING:
+            raise InvalidValue(self, value)
+        return result
+
+    def for_bytes(self) -> "Equiv":
+        return _BytesEquiv(
+            {_encode(key): value for key, value in self.mapping.items()}
+        )
+
+
+class _BytesEquiv(Equiv[T, V]):
+    """Variant of ``Equiv`` for bytes-like values."""
+
+    def __call__(self, value: T) -> V:
+        return super().__call__(_to_bytes(value))
 
 
 class Regex(Converter[str, V]):
@@ -240,12 +540,25 @@ class Regex(Converter[str, V]):
         """
         return match.string
 
+    def for_bytes(self) -> "Regex":
+        # Bytes-like values can be matched without being copied,
+        # using a bytes version of the pattern.
+        if isinstance(self._pattern.pattern, bytes):
+            return self
+        variant = copy.copy(self)
+        variant._pattern = re.compile(
+            self._pattern.pattern.encode(), self._pattern.flags & ~re.UNICODE
+        )
+        return variant
+
+    def get_failure_message(self, value: str) -> str:
+        """The message to bundle with ``ValueError`` on failure."""
+        return f"did not match '{self._pattern.pattern}': '{value}'"
+
     def __call__(self, value: str) -> V:
         match = self._pattern.match(value)
         if match is None:
-            raise ValueError(
-                f"did not match '{self._pattern.pattern}': '{value}'"
-            )
+            raise InvalidValue(self, value)
         return self.convert(match)
 
 
@@ -263,3 +576,1312 @@ class Range(Regex[range]):
 
     def convert(self, match: Match) -> range:
         return range(int(match.group(1)), int(match.group(2)))
+
+
+class _Bounded:
+    """Failure messages of converters that check bounds."""
+
+    min: Any = None
+    max: Any = None
+
+    def get_failure_message(self, value: Any) -> str:
+        if self.min is not None and self.max is not None:
+            expected = f"between {self.min} and {self.max}"
+        elif self.min is not None:
+            expected = f">= {self.min}"
+        else:
+            expected = f"<= {self.max}"
+        return f"expected a value {expected}, got '{value}'"
+
+
+class Bounds(_Bounded, Filter[T]):
+    """Require that the input value is within inclusive bounds.
+
+    Chains of a numeric converter followed by ``Bounds`` are fused into
+    :class:`Int`, :class:`Float` or :class:`DecimalRange` by the registry,
+    see :func:`fuse`.
+
+    Parameters
+    ----------
+    min : any, optional
+    max : any, optional
+        Omitted bounds are not checked.
+
+    Example
+    -------
+    >>> positive = chain(int, Bounds(min=0))
+    >>> positive("-1")
+    ValueError: expected a value >= 0, got '-1'
+    """
+
+    def __init__(self, min: Any = None, max: Any = None):
+        # pylint: disable=redefined-builtin
+        self.min = min
+        self.max = max
+        super().__init__(test=self._contains)
+
+    def _contains(self, value: Any) -> bool:
+        return (self.min is None or value >= self.min) and (
+            self.max is None or value <= self.max
+        )
+
+    def __reduce__(self):
+        return (type(self), (self.min, self.max))
+
+
+class Int(_Bounded, Converter[Any, int]):
+    """Parse an integer and check its bounds in one step.
+
+    Parameters
+    ----------
+    min : int, optional
+    max : int, optional
+        Inclusive bounds. Omitted bounds are not checked.
+    base : int, optional
+        Base of strings, as for ``int()``. Defaults to 10.
+
+    Example
+    -------
+    >>> to_port = Int(min=1, max=65535)
+    >>> to_port("8000")
+    8000
+    >>> to_port("0")
+    ValueError: expected a value between 1 and 65535, got '0'
+    """
+
+    def __init__(
+        self, min: int = None, max: int = None, base: int = 10
+    ):
+        # pylint: disable=redefined-builtin
+        self.min = min
+        self.max = max
+        self.base = base
+
+    def __reduce__(self):
+        return (type(self), (self.min, self.max, self.base))
+
+    def for_bytes(self) -> "Int":
+        return _BytesInt(self.min, self.max, self.base)
+
+    def __call__(self, value: Any) -> int:
+        result = int(value) if self.base == 10 else int(value, self.base)
+        if (self.min is not None and result < self.min) or (
+            self.max is not None and result > self.max
+        ):
+            raise InvalidValue(self, result)
+        return result
+
+
+class _BytesInt(Int):
+    """Variant of ``Int`` for bytes-like values."""
+
+    def __call__(self, value: Any) -> int:
+        return super().__call__(_to_bytes(value))
+
+
+class Float(_Bounded, Converter[Any, float]):
+    """Parse a float and check its bounds in one step.
+
+    Parameters
+    ----------
+    min : float, optional
+    max : float, optional
+        Inclusive bounds. Omitted bounds are not checked.
+    allow_nan : bool, optional
+        Whether to accept "nan". Defaults to ``True``, as ``float()``.
+        NaN is not subject to bounds.
+
+    Example
+    -------
+    >>> to_ratio = Float(min=0, max=1, allow_nan=False)
+    >>> to_ratio("0.5")
+    0.5
+    """
+
+    def __init__(
+        self, min: float = None, max: float = None, allow_nan: bool = True
+    ):
+        # pylint: disable=redefined-builtin
+        self.min = min
+        self.max = max
+        self.allow_nan = allow_nan
+
+    def __reduce__(self):
+        return (type(self), (self.min, self.max, self.allow_nan))
+
+    def for_bytes(self) -> "Float":
+        return _BytesFloat(self.min, self.max, self.allow_nan)
+
+    def get_failure_message(self, value: Any) -> str:
+        if value != value:  # pylint: disable=comparison-with-itself
+            return "expected a number, got 'nan'"
+        return super().get_failure_message(value)
+
+    def __call__(self, value: Any) -> float:
+        result = float(value)
+        # Comparisons with NaN are false, so it passes bounds checks.
+        if (
+            (self.min is not None and result < self.min)
+            or (self.max is not None and result > self.max)
+            or (not self.allow_nan and result != result)
+        ):
+            raise InvalidValue(self, result)
+        return result
+
+
+class _BytesFloat(Float):
+    """Variant of ``Float`` for bytes-like values."""
+
+    def __call__(self, value: Any) -> float:
+        return super().__call__(_to_bytes(value))
+
+
+class DecimalRange(_Bounded, Converter[Any, decimal.Decimal]):
+    """Parse a ``Decimal`` and check its bounds in one step.
+
+    Parameters
+    ----------
+    min : Decimal or int, optional
+    max : Decimal or int, optional
+        Inclusive bounds. Omitted bounds are not checked.
+    allow_nan : bool, optional
+        Whether to accept "NaN". Defaults to ``True``, as ``Decimal()``.
+        NaN is not subject to bounds.
+
+    Example
+    -------
+    >>> to_price = DecimalRange(min=0)
+    >>> to_price("9.99")
+    Decimal('9.99')
+    """
+
+    def __init__(
+        self, min: Any = None, max: Any = None, allow_nan: bool = True
+    ):
+        # pylint: disable=redefined-builtin
+        self.min = min
+        self.max = max
+        self.allow_nan = allow_nan
+
+    def __reduce__(self):
+        return (type(self), (self.min, self.max, self.allow_nan))
+
+    def for_bytes(self) -> "DecimalRange":
+        return _BytesDecimalRange(self.min, self.max, self.allow_nan)
+
+    def get_failure_message(self, value: Any) -> str:
+        if value.is_nan():
+            return f"expected a number, got '{value}'"
+        return super().get_failure_message(value)
+
+    def __call__(self, value: Any) -> decimal.Decimal:
+        try:
+            result = decimal.Decimal(value)
+        except decimal.InvalidOperation as exc:
+            raise InvalidValue(None, value) from exc
+        if result.is_nan():
+            if not self.allow_nan:
+                raise InvalidValue(self, result)
+        elif (self.min is not None and result < self.min) or (
+            self.max is not None and result > self.max
+        ):
+            raise InvalidValue(self, result)
+        return result
+
+
+class _BytesDecimalRange(DecimalRange):
+    """Variant of ``DecimalRange`` for bytes-like values."""
+
+    def __call__(self, value: Any) -> decimal.Decimal:
+        return super().__call__(bytes(value).decode("ascii"))
+
+
+# Flags of a sub-pattern that can be kept using a scoped inline group.
+_INLINE_FLAGS = {
+    re.ASCII: "a",
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+
+# Global inline flags at the start of a pattern, e.g. `(?i)`. These are
+# already in the flags of the compiled pattern.
+_GLOBAL_FLAGS = re.compile(r"\A(?:\(\?[aiLmsux]+\))+")
+
+
+class _SubMatch:
+    """View of a ``re.Match`` restricted to one alternative of a pattern.
+
+    Group numbers and names are those of the alternative's own pattern.
+    """
+
+    def __init__(self, match: Match, offset: int, pattern: Pattern):
+        self._match = match
+        self._offset = offset
+        self._groupindex = pattern.groupindex
+        self.re = pattern
+        self.string = match.string
+        self.pos = match.pos
+        self.endpos = match.endpos
+
+    def _index(self, group: Union[int, str]) -> int:
+        if isinstance(group, str):
+            group = self._groupindex[group]
+        if not 0 <= group <= self.re.groups:
+            raise IndexError("no such group")
+        return self._offset + group
+
+    def group(self, *groups: Union[int, str]):
+        if not groups:
+            groups = (0,)
+        values = tuple(self._match.group(self._index(g)) for g in groups)
+        return values[0] if len(values) == 1 else values
+
+    __getitem__ = group
+
+    def groups(self, default=None) -> tuple:
+        return tuple(
+            default if value is None else value
+            for value in (
+                self._match.group(self._offset + index)
+                for index in range(1, self.re.groups + 1)
+            )
+        )
+
+    def groupdict(self, default=None) -> dict:
+        return {
+            name: self._match.group(self._offset + index)
+            if self._match.group(self._offset + index) is not None
+            else default
+            for name, index in self._groupindex.items()
+        }
+
+    def start(self, group: Union[int, str] = 0) -> int:
+        return self._match.start(self._index(group))
+
+    def end(self, group: Union[int, str] = 0) -> int:
+        return self._match.end(self._index(group))
+
+    def span(self, group: Union[int, str] = 0) -> Tuple[int, int]:
+        return self._match.span(self._index(group))
+
+
+class RegexSet(Converter[str, Any]):
+    """Dispatch to the first of many ``Regex`` converters that matches.
+
+    The patterns are combined into a single alternation, so that the input
+    value is scanned once whatever the number of converters. The ``convert()``
+    method of the converter whose pattern matched is then called with
+    a match object that behaves as if its own pattern had matched.
+
+    Parameters
+    ----------
+    *converters : Regex
+        Tried in order. Named groups must not be shared between patterns,
+        and patterns must not use numbered backreferences.
+
+    Example
+    -------
+    >>> converter = RegexSet(Range(), Regex(r"\\d+"))
+    >>> converter("1:3")
+    range(1, 3)
+    >>> converter("12")
+    '12'
+    """
+
+    def __init__(self, *converters: Regex):
+        flattened: List[Regex] = []
+        for converter in converters:
+            if isinstance(converter, RegexSet):
+                flattened.extend(converter.converters)
+            else:
+                flattened.append(converter)
+        if not flattened:
+            raise ValueError("at least one converter is required")
+
+        self.converters: Tuple[Regex, ...] = tuple(flattened)
+        self._dispatch: Dict[int, Tuple[Regex, Pattern]] = {}
+        alternatives: List[str] = []
+        names: Dict[str, Regex] = {}
+        offset = 1
+
+        for converter in self.converters:
+            pattern = converter._pattern  # pylint: disable=protected-access
+            for name in pattern.groupindex:
+                if name in names:
+                    raise ValueError(
+                        f"group name '{name}' is used by several patterns"
+                    )
+                names[name] = converter
+            flags = "".join(
+                letter
+                for flag, letter in _INLINE_FLAGS.items()
+                if pattern.flags & flag
+            )
+            source = pattern.pattern
+            if isinstance(source, bytes):
+                source = source.decode("latin-1")
+            # Global flags are only allowed at the start of the combined
+            # pattern: they are applied to the alternative instead.
+            source = _GLOBAL_FLAGS.sub("", source)
+            if flags:
+                source = f"(?{flags}:{source})"
+            alternatives.append(f"({source})")
+            self._dispatch[offset] = (converter, pattern)
+            offset += pattern.groups + 1
+
+        combined = "|".join(alternatives)
+        if isinstance(self._dispatch[1][1].pattern, bytes):
+            self._pattern: Pattern = re.compile(combined.encode("latin-1"))
+        else:
+            self._pattern = re.compile(combined)
+
+    @property
+    def pattern(self) -> Pattern:
+        return self._pattern
+
+    def for_bytes(self) -> "RegexSet":
+        return RegexSet(*(conv.for_bytes() for conv in self.converters))
+
+    def get_failure_message(self, value: str) -> str:
+        """The message to bundle with ``ValueError`` on failure."""
+        patterns = ", ".join(
+            f"'{pattern.pattern}'" for _, pattern in self._dispatch.values()
+        )
+        return f"did not match any of {patterns}: '{value}'"
+
+    def __call__(self, value: str) -> Any:
+        match = self._pattern.match(value)
+        if match is None:
+            raise InvalidValue(self, value)
+        # The group of the alternative closes last.
+        converter, pattern = self._dispatch[match.lastindex]
+        return converter.convert(_SubMatch(match, match.lastindex, pattern))
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`Cached` converter."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class Cached(Converter[T, V]):
+    """Memoize the results of a converter.
+
+    Both converted values and failures (the ``ValueError`` message) are
+    cached. The cache is bounded: the least recently used entries are
+    evicted first, so that hostile inputs cannot make it grow indefinitely.
+    Values that are not hashable are converted without using the cache.
+
+    This converter is thread-safe. For ``async`` converters, it is
+    an ``async`` converter too, which caches the awaited results.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+    maxsize : int, optional
+        Maximum number of entries in the cache. Defaults to 128.
+    ttl : float, optional
+        Number of seconds after which an entry expires.
+        Defaults to ``None`` (entries never expire).
+
+    Example
+    -------
+    >>> from decimal import Decimal
+    >>> to_decimal = Cached(Transform(Decimal), maxsize=1024)
+    >>> to_decimal("1.5")
+    Decimal('1.5')
+    >>> to_decimal("1.5")
+    Decimal('1.5')
+    >>> to_decimal.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=1024, currsize=1)
+    """
+
+    def __new__(cls, converter: Callable[[T], V], *args, **kwargs):
+        # pylint: disable=unused-argument
+        if cls is Cached and is_async(converter):
+            cls = _AsyncCached
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        converter: Callable[[T], V],
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError(f"`maxsize` must be positive, got {maxsize}")
+        self.converter = converter
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Maps keys to `(expires_at, failed, value_or_error)`.
+        self._cache: "OrderedDict[Any, Tuple[Optional[float], bool, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_variant: Optional["Cached"] = None
+
+    def __reduce__(self):
+        # The cache and its lock are not carried over.
+        return (type(self), (self.converter, self.maxsize, self.ttl))
+
+    def for_bytes(self) -> "Cached":
+        # Built once, so that it is shared by all users of the variant.
+        if self._bytes_variant is None:
+            variant = for_bytes(self.converter)
+            if variant is self.converter:
+                self._bytes_variant = self
+            else:
+                self._bytes_variant = Cached(
+                    variant, maxsize=self.maxsize, ttl=self.ttl
+                )
+        return self._bytes_variant
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction statistics about the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._cache),
+            )
+
+    def cache_clear(self):
+        """Empty the cache and reset its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key: Any) -> Optional[Tuple[Any, bool, Any]]:
+        # The cached entry of a key, if it has not expired.
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (
+                entry[0] is None or entry[0] > time.monotonic()
+            ):
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+            return None
+
+    def _store(self, key: Any, failed: bool, result: Any):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._cache[key] = (expires_at, failed, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def __call__(self, value: T) -> V:
+        # Values that compare equal across types (e.g. `1` and `True`)
+        # may not convert the same way.
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return self.converter(value)
+
+        found = self._lookup(key)
+        if found is not None:
+            _, failed, result = found
+            if failed:
+                raise InvalidValue(None, value) from result
+            return result
+
+        # Convert outside of the lock so that slow converters
+        # do not block other threads.
+        try:
+            result = self.converter(value)
+            failed = False
+        except ValueError as exc:
+            # The traceback would keep the frames of the call alive.
+            result = exc.with_traceback(None)
+            failed = True
+        self._store(key, failed, result)
+
+        if failed:
+            raise InvalidValue(None, value) from result
+        return result
+
+
+class _AsyncCached(Cached[T, V]):
+    """Variant of ``Cached`` for ``async`` converters.
+
+    Results are cached once awaited, rather than the coroutines.
+    """
+
+    async def __call__(self, value: T) -> V:  # type: ignore
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return await self.converter(value)  # type: ignore
+
+        found = self._lookup(key)
+        if found is not None:
+            _, failed, result = found
+            if failed:
+                raise InvalidValue(None, value) from result
+            return result
+
+        try:
+            result = await self.converter(value)  # type: ignore
+            failed = False
+        except ValueError as exc:
+            result = exc.with_traceback(None)
+            failed = True
+        self._store(key, failed, result)
+
+        if failed:
+            raise InvalidValue(None, value) from result
+        return result
+
+
+class _FilterGroup:
+    """Adjacent filters of a chain, which are tested in one condition."""
+
+    def __init__(self, filters: Sequence[Filter]):
+        self.filters = filters
+
+    def get_failure_message(self, value: Any) -> str:
+        # Message of the first filter that rejects the value.
+        for stage in self.filters:
+            if not stage.test(value):
+                return stage.get_failure_message(value)
+        raise AssertionError("no filter rejected the value")  # pragma: no cover
+
+
+class Chain(Converter[T, V]):
+    """Apply converters one after the other.
+
+    Nested chains are flattened, and the stages are compiled into
+    a single function: adjacent ``Filter`` tests are evaluated in one
+    condition, and the exceptions that ``Transform`` stages translate
+    into ``ValueError`` are caught by a single ``try`` block.
+
+    Parameters
+    ----------
+    *converters : callable or ``Converter``
+
+    Attributes
+    ----------
+    stages : tuple
+        The flattened list of converters, in order.
+
+    Example
+    -------
+    >>> to_positive = Chain(int, Filter(lambda value: value > 0))
+    >>> to_positive("2")
+    2
+    >>> to_positive.stages
+    (<class 'int'>, <limier.converters.Filter object at ...>)
+    """
+
+    def __init__(self, *converters: Callable):
+        stages: List[Callable] = []
+        for converter in converters:
+            if isinstance(converter, Chain):
+                stages.extend(converter.stages)
+            else:
+                stages.append(converter)
+        self.stages: Tuple[Callable, ...] = tuple(stages)
+        self._convert = self._compile()
+
+    def _compile(self) -> Callable:
+        namespace: Dict[str, Any] = {"_limier_invalid": InvalidValue}
+        guard: List[Type[BaseException]] = []
+        body: List[str] = []
+        index = 0
+
+        while index < len(self.stages):
+            stage = self.stages[index]
+            name = f"_limier_stage_{index}"
+
+            if type(stage).__call__ is Filter.__call__:
+                # Gather adjacent filters into a single condition.
+                group = [stage]
+                while (
+                    index + len(group) < len(self.stages)
+                    and type(self.stages[index + len(group)]).__call__
+                    is Filter.__call__
+                ):
+                    group.append(self.stages[index + len(group)])
+                tests = []
+                for offset, member in enumerate(group):
+                    namespace[f"{name}_{offset}"] = member.test
+                    tests.append(f"{name}_{offset}(value)")
+                namespace[name] = _FilterGroup(group)
+                body += [
+                    f"if not ({' and '.join(tests)}):",
+                    f"    raise _limier_invalid({name}, value)",
+                ]
+                index += len(group)
+                continue
+
+            if type(stage).__call__ is Transform.__call__:
+                namespace[name] = stage.transformation
+                if not issubclass(stage.raised_if_invalid, ValueError):
+                    guard.append(stage.raised_if_invalid)
+            else:
+                namespace[name] = stage
+            body.append(f"value = {name}(value)")
+            index += 1
+
+        lines = ["def convert(value):"]
+        if guard:
+            namespace["_limier_guard"] = tuple(guard)
+            lines.append("    try:")
+            lines += ["        " + line for line in body]
+            lines += [
+                "    except _limier_guard as exc:",
+                "        raise _limier_invalid(None, value) from exc",
+            ]
+        else:
+            lines += ["    " + line for line in body]
+        lines.append("    return value")
+
+        exec(  # pylint: disable=exec-used
+            compile_source("\n".join(lines) + "\n", "<limier chain>"),
+            namespace,
+        )
+        return namespace["convert"]
+
+    def __reduce__(self):
+        # The compiled function is built again when unpickling.
+        return (type(self), self.stages)
+
+    def for_bytes(self) -> "Chain":
+        # Filters pass bytes-like values on to the next stage, which
+        # also receives them.
+        stages = list(self.stages)
+        for index, stage in enumerate(stages):
+            stages[index] = for_bytes(stage)
+            if not isinstance(stage, Filter):
+                break
+        if all(new is old for new, old in zip(stages, self.stages)):
+            return self
+        return Chain(*stages)
+
+    def __call__(self, value: T) -> V:
+        return self._convert(value)
+
+    def __repr__(self) -> str:
+        stages = ", ".join(map(repr, self.stages))
+        return f"{type(self).__name__}({stages})"
+
+
+# Iterables that are not converted item by item.
+_NOT_SEQUENCES = (str, dict, *BYTES_TYPES)
+
+
+# Exceptions that fused converters translate like a `Transform` would.
+_PARSE_ERRORS = (ValueError, decimal.InvalidOperation)
+
+
+def _parser(stage: Callable) -> Optional[Callable[..., Converter]]:
+    # Factory of the bounded converter that parses values like `stage`,
+    # if any, called with the `min` and `max` bounds.
+    if isinstance(stage, Transform):
+        if stage.raised_if_invalid not in _PARSE_ERRORS:
+            return None
+        stage = stage.transformation
+    # pylint: disable=unidiomatic-typecheck
+    if type(stage) in (Int, Float, DecimalRange):
+
+        def bounded(low: Any, high: Any) -> Converter:
+            fused = copy.copy(stage)
+            fused.min, fused.max = low, high
+            return fused
+
+        return bounded
+    if stage is int:
+        return Int
+    if (
+        isinstance(stage, partial)
+        and stage.func is int
+        and not stage.args
+        and list(stage.keywords) == ["base"]
+    ):
+        return partial(Int, base=stage.keywords["base"])
+    if stage is float:
+        return Float
+    if stage is decimal.Decimal:
+        return DecimalRange
+    return None
+
+
+def _tighten(bound: Any, other: Any, pick: Callable) -> Any:
+    if bound is None:
+        return other
+    if other is None:
+        return bound
+    return pick(bound, other)
+
+
+def fuse(converter: Callable) -> Callable:
+    """Rewrite a chain into equivalent but faster converters.
+
+    A numeric stage (``int``, ``float``, ``Decimal``, their ``Transform``
+    and the ``bin`` and ``oct`` aliases) followed by :class:`Bounds`
+    is fused into an :class:`Int`, :class:`Float` or :class:`DecimalRange`
+    converter, which parses and checks bounds in a single call. As with
+    ``Bounds``, NaN is rejected if either bound is set.
+
+    This is applied by :meth:`Registry.chain <limier.registry.Registry.chain>`
+    and to chains registered with
+    :meth:`Registry.converter <limier.registry.Registry.converter>`.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+
+    Returns
+    -------
+    fused : callable or ``Converter``
+        The converter itself if it cannot be fused, or the only stage
+        left if the whole chain was fused.
+    """
+    if not isinstance(converter, Chain):
+        return converter
+    stages: List[Callable] = []
+    for stage in converter.stages:
+        # pylint: disable=unidiomatic-typecheck
+        if type(stage) is Bounds and stages:
+            factory = _parser(stages[-1])
+            if factory is not None:
+                previous = stages[-1]
+                low = getattr(previous, "min", None)
+                high = getattr(previous, "max", None)
+                fused = factory(
+                    _tighten(low, stage.min, max),
+                    _tighten(high, stage.max, min),
+                )
+                # `Bounds` rejects NaN as soon as it has a bound,
+                # whatever the previous stage allows.
+                if hasattr(fused, "allow_nan") and (
+                    stage.min is not None or stage.max is not None
+                ):
+                    fused.allow_nan = False
+                stages[-1] = fused
+                continue
+        stages.append(stage)
+    if len(stages) == len(converter.stages):
+        return converter
+    if len(stages) == 1:
+        return stages[0]
+    return Chain(*stages)
+
+
+def _name(converter: Any) -> str:
+    return getattr(converter, "__name__", None) or repr(converter)
+
+
+class UnionOf(Converter[Any, Any]):
+    """Try converters in order and return the result of the first one
+    that succeeds.
+
+    This is what ``Union[...]`` and ``Optional[...]`` annotations
+    are compiled into.
+
+    A converter that raises ``TypeError`` is also considered to have
+    failed, e.g. ``int`` given a list.
+
+    Parameters
+    ----------
+    *converters : callable or ``Converter``
+    optional : bool, optional
+        If ``True``, ``None`` is returned as-is. Defaults to ``False``.
+    names : sequence of str, optional
+        Names of the converters in failure messages, e.g. the members
+        of the annotation. Defaults to the names of the converters.
+
+    Example
+    -------
+    >>> to_number = UnionOf(int, float)
+    >>> to_number("1"), to_number("1.5")
+    (1, 1.5)
+    """
+
+    def __init__(
+        self,
+        *converters: Callable,
+        optional: bool = False,
+        names: Sequence[str] = None,
+    ):
+        self.converters = converters
+        self.optional = optional
+        self.names = names
+
+    def get_failure_message(self, value: Any) -> str:
+        names = self.names or [_name(conv) for conv in self.converters]
+        return f"expected one of {', '.join(names)}, got '{value}'"
+
+    def __call__(self, value: Any) -> Any:
+        if value is None and self.optional:
+            return None
+        for converter in self.converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeError):
+                pass
+        raise InvalidValue(self, value)
+
+    def for_bytes(self) -> "UnionOf":
+        return UnionOf(
+            *map(for_bytes, self.converters),
+            optional=self.optional,
+            names=self.names,
+        )
+
+
+class ListOf(Converter[Iterable, Any]):
+    """Convert each item of an iterable.
+
+    This is what ``List[...]``, ``Set[...]``, ``Sequence[...]`` and
+    ``Tuple[..., ...]`` annotations are compiled into. Strings,
+    bytes-like values and mappings are rejected.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``, optional
+        Applied to each item. If ``None``, items are kept as-is.
+    container : type, optional
+        The type of the result, e.g. ``tuple`` or ``set``.
+        Defaults to ``list``.
+
+    Example
+    -------
+    >>> to_ints = ListOf(int)
+    >>> to_ints(["1", "2"])
+    [1, 2]
+    >>> to_ints(["1", "foo"])
+    ValueError: [1]: invalid literal for int() with base 10: 'foo'
+    """
+
+    def __init__(self, converter: Callable = None, container: type = list):
+        self.converter = converter
+        self.container = container
+
+    def get_failure_message(self, value: Any) -> str:
+        return f"expected a sequence, got '{value}'"
+
+    def __call__(self, value: Iterable) -> Any:
+        # pylint: disable=unidiomatic-typecheck
+        if type(value) is not list and type(value) is not tuple:
+            if isinstance(value, _NOT_SEQUENCES) or not hasattr(
+                value, "__iter__"
+            ):
+                raise InvalidValue(self, value)
+            value = list(value)
+        convert = self.converter
+        if convert is None:
+            items = value
+        else:
+            try:
+                items = [convert(item) for item in value]
+            except ValueError:
+                # Convert items again, to locate the one that failed.
+                for index, item in enumerate(value):
+                    try:
+                        convert(item)
+                    except ValueError as exc:
+                        raise InvalidValue.located(exc, f"[{index}]")
+                raise
+        if type(items) is self.container:
+            return items
+        return self.container(items)
+
+
+class TupleOf(Converter[Iterable, tuple]):
+    """Convert each item of a fixed-length iterable using its own converter.
+
+    This is what ``Tuple[...]`` annotations are compiled into.
+
+    Parameters
+    ----------
+    *converters : callable or ``Converter``
+        ``None`` keeps the corresponding item as-is.
+
+    Example
+    -------
+    >>> to_point = TupleOf(int, int)
+    >>> to_point(["1", "2"])
+    (1, 2)
+    """
+
+    def __init__(self, *converters: Optional[Callable]):
+        self.converters = converters
+
+    def get_failure_message(self, value: Any) -> str:
+        count = len(self.converters)
+        return f"expected a sequence of {count} items, got '{value}'"
+
+    def __call__(self, value: Iterable) -> tuple:
+        if isinstance(value, _NOT_SEQUENCES) or not hasattr(
+            value, "__iter__"
+        ):
+            raise InvalidValue(self, value)
+        items = tuple(value)
+        if len(items) != len(self.converters):
+            raise InvalidValue(self, value)
+        result = []
+        for index, (convert, item) in enumerate(zip(self.converters, items)):
+            try:
+                result.append(item if convert is None else convert(item))
+            except ValueError as exc:
+                raise InvalidValue.located(exc, f"[{index}]")
+        return tuple(result)
+
+
+class DictOf(Converter[Any, dict]):
+    """Convert the keys and values of a mapping.
+
+    This is what ``Dict[...]`` and ``Mapping[...]`` annotations
+    are compiled into.
+
+    Parameters
+    ----------
+    key : callable or ``Converter``, optional
+    value : callable or ``Converter``, optional
+        ``None`` keeps keys or values as-is.
+
+    Example
+    -------
+    >>> to_scores = DictOf(str, int)
+    >>> to_scores({"alice": "3"})
+    {'alice': 3}
+    """
+
+    def __init__(self, key: Callable = None, value: Callable = None):
+        self.key = key
+        self.value = value
+
+    def get_failure_message(self, value: Any) -> str:
+        return f"expected a mapping, got '{value}'"
+
+    def __call__(self, value: Any) -> dict:
+        if not hasattr(value, "items"):
+            raise InvalidValue(self, value)
+        convert_key = self.key
+        convert_value = self.value
+        result = {}
+        for key, item in value.items():
+            try:
+                if convert_key is not None:
+                    key = convert_key(key)
+            except ValueError as exc:
+                raise InvalidValue.located(exc, f"[{key!r}]")
+            try:
+                if convert_value is not None:
+                    item = convert_value(item)
+            except ValueError as exc:
+                raise InvalidValue.located(exc, f"[{key!r}]")
+            result[key] = item
+        return result
+
+
+def is_structure(cls: Any) -> bool:
+    """Return whether a class can be converted to using ``Structure``.
+
+    These are dataclasses, ``NamedTuple`` classes, and classes that define
+    ``__slots__`` and annotations but no ``__init__``.
+    """
+    if not isinstance(cls, type):
+        return False
+    if dataclasses.is_dataclass(cls):
+        return True
+    if issubclass(cls, tuple):
+        return hasattr(cls, "_fields") and bool(
+            getattr(cls, "__annotations__", None)
+        )
+    return (
+        "__slots__" in vars(cls)
+        and "__init__" not in vars(cls)
+        and bool(vars(cls).get("__annotations__"))
+    )
+
+
+def _unwrap(converter: Callable) -> Callable:
+    # Nested structures are called through their generated function,
+    # unless they are being generated (i.e. recursive structures).
+    if isinstance(converter, Structure):
+        convert = converter.prepare()
+        if convert != converter._compile_and_convert:
+            return convert
+    return converter
+
+
+# Types which are converted by calling them, and return their own
+# instances unchanged.
+_SCALARS = (int, float, str)
+
+
+# Held while generating the functions of structures. A single lock is
+# shared so that threads generating nested structures cannot deadlock.
+_GENERATING = threading.RLock()
+
+
+class _Required:
+    """Failure message of a missing field."""
+
+    @staticmethod
+    def get_failure_message(value: Any) -> str:
+        # pylint: disable=unused-argument
+        return "this field is required"
+
+
+class Structure(Converter[Any, Any]):
+    """Build an instance of a structured class from a mapping.
+
+    Structured classes are dataclasses, ``NamedTuple`` classes and
+    classes with ``__slots__`` (see :func:`is_structure`). Fields are read
+    from the mapping and converted according to their annotation, e.g.
+    a nested structure. Fields with a default may be omitted, and
+    unknown keys are ignored. Instances of the class are passed as-is.
+
+    On first use, a function specialized for the fields of the class
+    is generated, so that forward references can be resolved by then.
+
+    This is what structured classes are compiled into when used
+    as annotations.
+
+    Parameters
+    ----------
+    cls : type
+    resolve : callable, optional
+        Returns the converter of a field annotation, e.g.
+        :meth:`Registry.get <limier.registry.Registry.get>`.
+        Defaults to that of ``Registry.current()``.
+
+    Raises
+    ------
+    InvalidFields:
+        With the errors of all fields that failed to convert.
+
+    Example
+    -------
+    >>> @dataclass
+    ... class Address:
+    ...     zip: int
+    >>> @dataclass
+    ... class User:
+    ...     name: str
+    ...     address: Address
+    >>> to_user = Structure(User)
+    >>> to_user({"name": "alice", "address": {"zip": "75001"}})
+    User(name='alice', address=Address(zip=75001))
+    """
+
+    def __init__(self, cls: type, resolve: Callable = None):
+        if resolve is None:
+            # pylint: disable=import-outside-toplevel,cyclic-import
+            from .registry import Registry
+
+            resolve = Registry.current().get
+        self.cls = cls
+        self.resolve = resolve
+        self._convert: Callable = self._compile_and_convert
+        # Whether the function is being generated, e.g. for fields
+        # of the same class.
+        self._busy = False
+
+    def __reduce__(self):
+        # The generated function is built again when unpickling.
+        return (type(self), (self.cls, self.resolve))
+
+    def _fields(self) -> List[Tuple[str, Any, Any, Any, bool]]:
+        # `(name, annotation, default, factory, keyword_only)` of fields,
+        # in the order of the constructor.
+        hints = get_type_hints(self.cls)
+        missing = dataclasses.MISSING
+        if dataclasses.is_dataclass(self.cls):
+            # `fields()` leaves out `InitVar` pseudo-fields, which are
+            # also passed to the constructor.
+            names = {field.name for field in dataclasses.fields(self.cls)}
+            fields = []
+            for field in self.cls.__dataclass_fields__.values():
+                hint = hints.get(field.name, Any)
+                if hint is dataclasses.InitVar:
+                    hint = Any
+                elif isinstance(hint, dataclasses.InitVar):
+                    hint = getattr(hint, "type", Any)
+                elif field.name not in names:
+                    # Class variables.
+                    continue
+                if field.init:
+                    fields.append(
+                        (
+                            field.name,
+                            hint,
+                            field.default,
+                            field.default_factory,
+                            getattr(field, "kw_only", False) is True,
+                        )
+                    )
+            return fields
+        if issubclass(self.cls, tuple):
+            defaults = getattr(self.cls, "_field_defaults", {})
+            return [
+                (
+                    name,
+                    hints.get(name, Any),
+                    defaults.get(name, missing),
+                    missing,
+                    False,
+                )
+                for name in self.cls._fields  # type: ignore
+            ]
+        # Slots of base classes are also set, base classes first.
+        names: List[str] = []
+        for klass in reversed(self.cls.__mro__):
+            slots = vars(klass).get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names += [
+                name
+                for name in slots
+                if name not in ("__dict__", "__weakref__")
+                and name not in names
+            ]
+        return [
+            (name, hints.get(name, Any), missing, missing, True)
+            for name in names
+        ]
+
+    def _compile(self) -> Callable:
+        namespace: Dict[str, Any] = {
+            "_limier_cls": self.cls,
+            "_limier_new": object.__new__,
+            "_limier_mapping": Mapping,
+            "_limier_missing": _MISSING,
+            "_limier_invalid": InvalidValue,
+            "_limier_fields": InvalidFields,
+            "_limier_required": _Required,
+            "_limier_self": self,
+        }
+        lines = [
+            "def convert(value):",
+            "    if type(value) is not dict:",
+            "        if isinstance(value, _limier_cls):",
+            "            return value",
+            "        if not isinstance(value, _limier_mapping):",
+            "            raise _limier_invalid(_limier_self, value)",
+            "    _limier_errors = None",
+        ]
+        args: List[str] = []
+        kwargs: List[str] = []
+
+        for index, (name, annotation, default, factory, keyword) in enumerate(
+            self._fields()
+        ):
+            var = f"_limier_field_{index}"
+            (kwargs if keyword else args).append((name, var))
+            lines += [
+                f"    {var} = value.get({name!r}, _limier_missing)",
+                f"    if {var} is _limier_missing:",
+            ]
+            if default is not dataclasses.MISSING:
+                namespace[f"{var}_default"] = default
+                lines.append(f"        {var} = {var}_default")
+            elif factory is not dataclasses.MISSING:
+                namespace[f"{var}_factory"] = factory
+                lines.append(f"        {var} = {var}_factory()")
+            else:
+                lines += [
+                    "        if _limier_errors is None:",
+                    "            _limier_errors = {}",
+                    f"        _limier_errors[{name!r}] = "
+                    "_limier_invalid(_limier_required, None)",
+                ]
+            if annotation is Any:
+                continue
+            converter = self.resolve(annotation)
+            namespace[f"{var}_convert"] = _unwrap(converter)
+            # Built-in scalar types return values of that type as-is.
+            condition = (
+                f"type({var}) is not {var}_convert"
+                if converter in _SCALARS
+                else "True"
+            )
+            lines += [
+                f"    elif {condition}:",
+                "        try:",
+                f"            {var} = {var}_convert({var})",
+                "        except ValueError as _limier_exc:",
+                "            if _limier_errors is None:",
+                "                _limier_errors = {}",
+                f"            _limier_errors[{name!r}] = "
+                "_limier_exc.with_traceback(None)",
+            ]
+
+        lines += [
+            "    if _limier_errors is not None:",
+            "        raise _limier_fields(value, _limier_errors)",
+        ]
+        if dataclasses.is_dataclass(self.cls) or issubclass(self.cls, tuple):
+            call = [var for _, var in args]
+            call += [f"{name}={var}" for name, var in kwargs]
+            lines.append(f"    return _limier_cls({', '.join(call)})")
+        else:
+            # Classes with `__slots__` have no constructor for fields.
+            lines.append("    instance = _limier_new(_limier_cls)")
+            lines += [f"    instance.{name} = {var}" for name, var in kwargs]
+            lines.append("    return instance")
+
+        qualname = getattr(self.cls, "__qualname__", repr(self.cls))
+        exec(  # pylint: disable=exec-used
+            compile_source(
+                "\n".join(lines) + "\n", f"<limier structure of {qualname}>"
+            ),
+            namespace,
+        )
+        return namespace["convert"]
+
+    def _compile_and_convert(self, value: Any) -> Any:
+        self.prepare()
+        return self._convert(value)
+
+    def prepare(self) -> Callable:
+        """Generate the conversion function if it was not yet.
+
+        Returns
+        -------
+        convert : callable
+            The generated function, which converts values like
+            the structure itself.
+        """
+        if self._convert == self._compile_and_convert:
+            # Other threads wait for the function. In the generating thread,
+            # `_busy` marks structures that are nested in themselves.
+            with _GENERATING:
+                if (
+                    self._convert == self._compile_and_convert
+                    and not self._busy
+                ):
+                    self._busy = True
+                    try:
+                        self._convert = self._compile()
+                    finally:
+                        self._busy = False
+        return self._convert
+
+    def get_failure_message(self, value: Any) -> str:
+        return f"expected a mapping, got '{value}'"
+
+    def __call__(self, value: Any) -> Any:
+        return self._convert(value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.cls.__qualname__})"
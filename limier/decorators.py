@@ -1,55 +1,253 @@
-from functools import wraps
-from inspect import Parameter, signature
-from typing import Mapping
+from functools import partial, wraps
+from inspect import Parameter, Signature, isclass, signature
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Optional,
+)
 
-from .converters import Converter
-from .exceptions import ConversionError
+from .batch import batch
+from .compiler import Plan, is_async
+from .instrumentation import Recorder, instrument
+from .converters import Converter, Structure, Transform
+from .lazy import Lazy
 from .registry import Registry
+from .stream import Stream
 from .typevars import T
 
 
-def converted(func: T, registry: Registry = None) -> T:
+def _output_type(annotation: Any, converter: Converter) -> Optional[type]:
+    # The type of values that can skip the converter. Only converters that
+    # construct the annotated type are skipped: others, e.g. `Int(min=0)`,
+    # may reject values of their own output type.
+    if not isclass(annotation) or annotation is Any:
+        return None
+    if converter is annotation:
+        return annotation
+    if type(converter) is Transform and converter.transformation is annotation:
+        return annotation
+    if type(converter) is Structure and converter.cls is annotation:
+        return annotation
+    return None
+
+
+def converted(
+    func: T = None,
+    registry: Registry = None,
+    typed: bool = False,
+    input_type: type = None,
+    recorder: Recorder = None,
+    fail_fast: bool = False,
+    lazy: Collection[str] = (),
+    bypass: bool = False,
+) -> T:
     """Wrap a function that applies converters to its arguments.
 
+    The wrapper is generated at decoration time from the signature of
+    ``func``, so calling it costs little more than a direct call.
+
+    This can be used as a decorator with or without arguments.
+
     Parameters
     ----------
     func : callable
     registry : Registry, optional
         A ``Registry`` object which has aliases to available converters.
-        Defaults to ``Registry.default``.
+        Defaults to ``Registry.current()``.
+    typed : bool, optional
+        If ``True``, defaults are converted once at decoration time, and
+        arguments which already are an instance of the annotated class
+        are passed as-is if their converter only constructs it, e.g.
+        ``int`` or ``Transform(Decimal)``, but not ``Int(min=0)``.
+        Defaults to ``False``.
+    input_type : type, optional
+        The type of the arguments, e.g. ``bytes`` or ``memoryview`` for
+        raw ASGI paths. Converters are chosen accordingly, see
+        :meth:`Registry.get <limier.registry.Registry.get>`.
+    recorder : Recorder, optional
+        Records statistics about the conversions of the wrapper.
+        Defaults to the recorder of the registry, if any.
+        When there is none, the wrapper has no instrumentation overhead.
+    fail_fast : bool, optional
+        If ``True``, ``ConversionError`` is raised as soon as an argument
+        fails to convert, and only reports this argument.
+        Defaults to ``False``.
+    lazy : collection of str, optional
+        Names of parameters to convert only when they are accessed:
+        the function receives a :class:`~limier.lazy.Lazy` argument
+        for them. Parameters annotated with ``Lazy[...]`` are also lazy.
+    bypass : bool, optional
+        If ``True``, conversions are skipped when the wrapper is called
+        in a :class:`~limier.trust.trusted` context. This costs a context
+        variable lookup per call. Lazy parameters still receive a
+        :class:`~limier.lazy.Lazy` argument. Defaults are passed as
+        declared, unless ``typed`` converted them once when decorating.
+        Defaults to ``False``.
+
+    Methods are supported, including classmethods and staticmethods
+    whichever the order of decorators. The wrapper of a method is
+    a plain function, so that Python binds ``self`` or ``cls`` to it,
+    and leading parameters without annotation are passed through as-is.
+
+    .. note::
+        If ``registry`` is not frozen, converters are resolved again on
+        the first call after it was modified, e.g. by a plugin that
+        registers converters after the function was decorated.
 
     Returns
     -------
     converted : callable
         Wrapper of ``func`` that applies converters to parameters
-        that have a type annotation.
+        that have a type annotation. ``func`` itself is available as
+        its ``raw`` attribute, for callers that pass converted values.
+        For methods, ``self`` must then be passed explicitly.
+
+    Raises
+    ------
+    TypeError:
+        If ``func`` is not a coroutine function but some converters
+        are ``async``.
     """
+    options = dict(
+        typed=typed,
+        input_type=input_type,
+        recorder=recorder,
+        fail_fast=fail_fast,
+        lazy=lazy,
+        bypass=bypass,
+    )
+
+    if func is None:
+        return partial(converted, registry=registry, **options)
+
+    if isinstance(func, (classmethod, staticmethod)):
+        # Convert the underlying function and wrap it again, so that
+        # `@converted` can be stacked with these in any order.
+        return type(func)(
+            converted(func.__func__, registry=registry, **options)
+        )
+
     if registry is None:
-        registry = Registry.default()
+        registry = Registry.current()
 
     sig = signature(func)
+    unknown = set(lazy) - set(sig.parameters)
+    if unknown:
+        raise TypeError(f"unknown lazy parameters: {sorted(unknown)}")
 
-    converters: Mapping[str, Converter] = {
-        name: registry.get(param.annotation) or param.annotation
-        for name, param in sig.parameters.items()
-        if param.annotation is not Parameter.empty
-    }
+    def refresh() -> Callable:
+        # Plan the function again using the current snapshot of the
+        # registry, and update the wrapper in place.
+        plan = _plan(func, sig, registry, refresh, **options)
+        compiled = plan.compile()
+        namespace = compiled.__globals__
+        snapshot = namespace.pop("_limier_snapshot")
+        wrapper.__globals__.update(namespace)
+        wrapper.__code__ = compiled.__code__
+        wrapper.__defaults__ = compiled.__defaults__
+        wrapper.__kwdefaults__ = compiled.__kwdefaults__
+        wrapper.__limier_plan__ = plan  # type: ignore
+        # Set last, so that the wrapper is only considered up to date
+        # once it is.
+        wrapper.__globals__["_limier_snapshot"] = snapshot
+        return wrapper
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        errors = {}
+    plan = _plan(func, sig, registry, refresh, **options)
+    wrapper = wraps(func)(plan.compile())
+    wrapper.__limier_plan__ = plan  # type: ignore
+    wrapper.raw = func  # type: ignore
+    return wrapper
+
+
+def _plan(
+    func: Callable,
+    sig: Signature,
+    registry: Registry,
+    refresh: Callable[[], Callable],
+    typed: bool,
+    input_type: Optional[type],
+    recorder: Optional[Recorder],
+    fail_fast: bool,
+    lazy: Collection[str],
+    bypass: bool,
+) -> Plan:
+    # Resolve converters using the current snapshot of the registry.
+    snapshot = registry._snapshot  # pylint: disable=protected-access
+
+    converters: Dict[str, Converter] = {}
+    deferred = set(lazy)
+    for name, param in sig.parameters.items():
+        annotation = param.annotation
+        if annotation is Parameter.empty:
+            continue
+        if getattr(annotation, "__origin__", None) is Lazy:
+            (annotation,) = annotation.__args__
+            deferred.add(name)
+        converters[name] = (
+            registry.get(annotation, input_type=input_type) or annotation
+        )
+
+    defaults: Dict[str, Any] = {}
+    types: Dict[str, type] = {}
 
+    if typed:
         for name, converter in converters.items():
-            try:
-                bound.arguments[name] = converter(bound.arguments[name])
-            except ValueError as exc:
-                errors[name] = str(exc)
+            if name in deferred:
+                continue
+            param = sig.parameters[name]
+            output_type = _output_type(param.annotation, converter)
+            if output_type is not None:
+                types[name] = output_type
+            if param.default is not Parameter.empty and not is_async(
+                converter
+            ):
+                try:
+                    defaults[name] = converter(param.default)
+                except ValueError:
+                    # Let the error be reported when the default is used.
+                    pass
 
-        if errors:
-            raise ConversionError(**errors)
+    if recorder is None:
+        recorder = registry.recorder
 
-        return func(*bound.args, **bound.kwargs)
+    if recorder is not None:
+        qualname = getattr(func, "__qualname__", repr(func))
+        converters = {
+            name: instrument(
+                converter,
+                recorder,
+                alias=sig.parameters[name].annotation,
+                parameter=(qualname, name),
+            )
+            for name, converter in converters.items()
+        }
 
-    return wrapper
+    for name in deferred:
+        if name not in converters:
+            raise TypeError(f"lazy parameter without annotation: '{name}'")
+        if is_async(converters[name]):
+            raise TypeError(f"lazy parameter with async converter: '{name}'")
+        converters[name] = partial(Lazy, converters[name], name=name)
+
+    # Frozen registries cannot change: their wrappers do not check them.
+    watched = not registry.frozen
+    return Plan(
+        func,
+        sig,
+        converters,
+        defaults,
+        types,
+        fail_fast=fail_fast,
+        registry=registry if watched else None,
+        snapshot=snapshot if watched else None,
+        refresh=refresh if watched else None,
+        bypass=bypass,
+        lazy=deferred,
+        input_type=input_type,
+    )
+
+
+converted.batch = batch  # type: ignore
+converted.stream = Stream  # type: ignore
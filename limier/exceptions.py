@@ -1,10 +1,198 @@
-from typing import Dict
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+
+def _format_path(path: Tuple[str, ...]) -> str:
+    # E.g. `("items", "[0]", "name")` -> `items[0].name`.
+    parts = []
+    for key in path:
+        if parts and not key.startswith("["):
+            parts.append(".")
+        parts.append(key)
+    return "".join(parts)
+
+
+class InvalidValue(ValueError):
+    """A ``ValueError`` whose message is only formatted when it is read.
+
+    Parameters
+    ----------
+    converter : Converter or None
+        Its ``get_failure_message(value)`` method builds the message.
+        If ``None``, the message is that of the exception this one
+        was raised from.
+    value : any
+        The value that failed to convert.
+    path : tuple of str, optional
+        Location of ``value`` within the converted value, e.g.
+        ``("[2]",)`` for the third item of a list. Shown before the message.
+    """
+
+    def __init__(
+        self, converter: Any, value: Any, path: Tuple[str, ...] = ()
+    ):
+        super().__init__()
+        self.converter = converter
+        self.value = value
+        self.path = path
+        self._message: Optional[str] = None
+
+    @property
+    def reason(self) -> str:
+        """The message, without the path."""
+        if self.converter is None:
+            return str(self.__cause__)
+        return self.converter.get_failure_message(self.value)
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            message = self.reason
+            if self.path:
+                message = f"{_format_path(self.path)}: {message}"
+            self._message = message
+        return self._message
+
+    @classmethod
+    def located(cls, error: ValueError, key: str) -> "InvalidValue":
+        """Locate the error of an item within its container.
+
+        Parameters
+        ----------
+        error : ValueError
+            The error raised when converting the item.
+        key : str
+            The location of the item, e.g. ``"[0]"`` or an attribute name.
+
+        Returns
+        -------
+        error : InvalidValue
+            An error whose path starts with ``key``. Errors that are
+            ``InvalidValue`` keep their type.
+        """
+        if isinstance(error, InvalidValue):
+            located = type(error).__new__(type(error))
+            located.__dict__.update(error.__dict__)
+            located.path = (key,) + error.path
+            located._message = None
+        else:
+            located = cls(None, None, (key,))
+        located.__cause__ = (
+            error.__cause__ if isinstance(error, InvalidValue) else error
+        )
+        return located
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __reduce__(self):
+        # Rebuilt from its attributes, with the exception it was raised
+        # from, which holds the message when `converter` is `None`.
+        state = dict(self.__dict__)
+        state["__cause__"] = self.__cause__
+        return (_rebuild, (type(self),), state)
+
+
+def _rebuild(cls: type) -> InvalidValue:
+    return cls.__new__(cls)
+
+
+def _leaves(
+    error: ValueError, path: Tuple[str, ...]
+) -> Iterator[Tuple[Tuple[str, ...], str]]:
+    # Paths and messages of the errors of individual values.
+    if isinstance(error, InvalidValue):
+        path += error.path
+        if isinstance(error, InvalidFields):
+            for key, field_error in error.errors.items():
+                yield from _leaves(field_error, path + (key,))
+            return
+        yield path, error.reason
+    else:
+        yield path, str(error)
+
+
+class InvalidFields(InvalidValue):
+    """Conversion failures of fields of a structured value.
+
+    Parameters
+    ----------
+    value : any
+        The value that failed to convert, e.g. a mapping.
+    errors : dict
+        Errors by field name.
+    """
+
+    def __init__(self, value: Any, errors: Dict[str, ValueError]):
+        super().__init__(None, value)
+        self.errors = errors
+
+    @property
+    def reason(self) -> str:
+        return "; ".join(
+            f"{_format_path(path)}: {message}"
+            for key, error in self.errors.items()
+            for path, message in _leaves(error, (key,))
+        )
 
 
 class ConversionError(Exception):
-    def __init__(self, **errors):
+    """Conversion failures of one or more arguments.
+
+    Parameters
+    ----------
+    **errors : str or ValueError
+        Errors by parameter name. Messages of exceptions are only
+        formatted when ``errors`` is first read. Errors of fields of
+        structured values (see :class:`InvalidFields`) are reported
+        by path, e.g. ``"user.address.zip"``.
+
+    Attributes
+    ----------
+    causes : dict
+        The errors as given, by parameter name.
+    """
+
+    def __init__(self, **errors: Union[str, ValueError]):
         super().__init__()
-        self.errors: Dict[str, str] = errors
+        self.causes = errors
+        self._errors: Optional[Dict[str, str]] = None
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Error messages by parameter name."""
+        if self._errors is None:
+            errors = {}
+            for name, error in self.causes.items():
+                if isinstance(error, InvalidFields):
+                    for path, message in _leaves(error, (name,)):
+                        errors[_format_path(path)] = message
+                else:
+                    errors[name] = str(error)
+            self._errors = errors
+        return self._errors
 
     def __str__(self) -> str:
         return f"ConversionError: {self.errors}"
+
+
+class RowConversionError(ConversionError):
+    """Conversion error of a row of a :class:`~limier.stream.Stream`.
+
+    Attributes
+    ----------
+    index : int
+        The index of the row in the input rows.
+    """
+
+    def __init__(self, index: int, errors: Dict[str, Union[str, ValueError]]):
+        super().__init__(**errors)
+        self.index = index
+
+    def __reduce__(self):
+        return (type(self), (self.index, self.causes))
+
+    def __str__(self) -> str:
+        return f"RowConversionError: row {self.index}: {self.errors}"
@@ -0,0 +1,165 @@
+"""Compile ``typing`` annotations into converters.
+
+Annotations are introspected once, when they are looked up in a registry,
+so that calls only run the resulting converters.
+"""
+import collections.abc
+import types
+import typing
+from typing import Any, Callable, Optional
+
+from .converters import (
+    DictOf,
+    Equiv,
+    ListOf,
+    Structure,
+    TupleOf,
+    UnionOf,
+    is_structure,
+)
+
+# `typing.get_origin()` and `Literal` are not available before Python 3.8,
+# nor `X | Y` unions before Python 3.10.
+_get_origin = getattr(typing, "get_origin", None)
+_LITERAL = getattr(typing, "Literal", None)
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+_SEQUENCES = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+    # Origins of `typing` generics before Python 3.7.
+    typing.List: list,
+    typing.Set: set,
+    typing.FrozenSet: frozenset,
+    typing.Sequence: list,
+    typing.Iterable: list,
+}
+
+_MAPPINGS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+    typing.Dict,
+    typing.Mapping,
+)
+
+
+def _origin(annotation: Any) -> Any:
+    if _get_origin is not None:
+        return _get_origin(annotation)
+    return getattr(annotation, "__origin__", None)  # pragma: no cover
+
+
+def _name(annotation: Any) -> str:
+    if _origin(annotation) is not None:
+        return repr(annotation).replace("typing.", "")
+    return getattr(annotation, "__name__", repr(annotation))
+
+
+def sequence_annotation(annotation: Any) -> Optional[Any]:
+    """Find the annotation of sequences within an annotation.
+
+    Parameters
+    ----------
+    annotation : any
+
+    Returns
+    -------
+    sequence : any
+        The annotation if it is compiled into a converter of sequences,
+        e.g. ``List[int]`` or ``Tuple[int, ...]``, or its member if it is
+        an optional one, e.g. ``List[int]`` for ``Optional[List[int]]``.
+        ``None`` otherwise.
+    """
+    origin = _origin(annotation)
+    args = getattr(annotation, "__args__", ())
+    if origin in _UNION_TYPES:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return sequence_annotation(members[0])
+        return None
+    if origin in (tuple, typing.Tuple):
+        if len(args) == 2 and args[1] is Ellipsis:
+            return annotation
+        return None
+    return annotation if origin in _SEQUENCES else None
+
+
+def compile_annotation(
+    annotation: Any, resolve: Callable[[Any], Any]
+) -> Optional[Callable]:
+    """Build the converter of a ``typing`` annotation.
+
+    Supported annotations are ``Optional``, ``Union`` (members are tried
+    in order), ``List``, ``Set``, ``FrozenSet``, ``Sequence``, ``Tuple``,
+    ``Dict``, ``Mapping`` and ``Literal``, as well as their built-in and
+    ``collections.abc`` equivalents. Structured classes, e.g. dataclasses,
+    are compiled into a :class:`~limier.converters.Structure`.
+
+    Parameters
+    ----------
+    annotation : any
+    resolve : callable
+        Returns the converter of a member of the annotation,
+        e.g. :meth:`Registry.get <limier.registry.Registry.get>`.
+
+    Returns
+    -------
+    converter : callable or None
+        ``None`` if ``annotation`` is not supported.
+    """
+    if is_structure(annotation):
+        return Structure(annotation, resolve)
+
+    origin = _origin(annotation)
+    if origin is None:
+        return None
+    args = getattr(annotation, "__args__", ())
+
+    def member(arg: Any) -> Optional[Callable]:
+        # Members annotated with `Any` are not converted.
+        if arg is Any or isinstance(arg, typing.TypeVar):
+            return None
+        return resolve(arg)
+
+    if origin in _UNION_TYPES:
+        optional = type(None) in args
+        converters = [
+            # `None` members also accept aliases of `None`, e.g. "null".
+            resolve(None if arg is type(None) else arg)
+            for arg in args
+        ]
+        names = [
+            "None" if arg is type(None) else _name(arg) for arg in args
+        ]
+        return UnionOf(*converters, optional=optional, names=names)
+
+    if _LITERAL is not None and origin is _LITERAL:
+        # Values can also be given as strings, e.g. from a query string.
+        mapping = {str(value): value for value in args}
+        mapping.update((value, value) for value in args)
+        return Equiv(mapping)
+
+    if origin in (tuple, typing.Tuple):
+        if len(args) == 2 and args[1] is Ellipsis:
+            return ListOf(member(args[0]), container=tuple)
+        if not args or args == ((),):
+            return ListOf(None, container=tuple)
+        return TupleOf(*map(member, args))
+
+    if origin in _SEQUENCES:
+        converter = member(args[0]) if args else None
+        return ListOf(converter, container=_SEQUENCES[origin])
+
+    if origin in _MAPPINGS:
+        key, value = args if len(args) == 2 else (Any, Any)
+        return DictOf(member(key), member(value))
+
+    return None
@@ -0,0 +1,250 @@
+import threading
+from collections import deque
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+from .compiler import is_async
+from .converters import Converter
+
+# Called with `(alias, parameter, duration, failed)` after each conversion.
+Hook = Callable[[Hashable, Tuple[str, str], float, bool], Any]
+
+
+def _log_hook_failure(hook: Hook):
+    # `logging` is only imported when a hook fails.
+    import logging  # pylint: disable=import-outside-toplevel
+
+    logging.getLogger("limier").exception(
+        "instrumentation hook %r failed", hook
+    )
+
+
+class StatsSnapshot(NamedTuple):
+    """Statistics about the conversions of an alias or a parameter.
+
+    Durations are in seconds. Percentiles are computed over the most
+    recent conversions only.
+    """
+
+    calls: int
+    failures: int
+    total: float
+    p50: float
+    p90: float
+    p99: float
+
+
+class Snapshot(NamedTuple):
+    """Statistics of a :class:`Recorder` at a point in time."""
+
+    aliases: Dict[Hashable, StatsSnapshot]
+    parameters: Dict[Tuple[str, str], StatsSnapshot]
+
+
+class _Stats:
+    """Mutable statistics about the conversions of an alias or a parameter."""
+
+    __slots__ = ("calls", "failures", "total", "samples")
+
+    def __init__(self, samples: int):
+        self.calls = 0
+        self.failures = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=samples)
+
+    def add(self, duration: float, failed: bool):
+        self.calls += 1
+        self.failures += failed
+        self.total += duration
+        self.samples.append(duration)
+
+    def snapshot(self) -> StatsSnapshot:
+        samples = sorted(self.samples)
+
+        def percentile(rank: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(int(rank * len(samples)), len(samples) - 1)]
+
+        return StatsSnapshot(
+            self.calls,
+            self.failures,
+            self.total,
+            percentile(0.5),
+            percentile(0.9),
+            percentile(0.99),
+        )
+
+
+class Recorder:
+    """Collect statistics about conversions.
+
+    Statistics are aggregated per alias (i.e. per annotation) and per
+    parameter of decorated functions.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Number of recent durations kept to compute percentiles.
+        Defaults to 1024.
+    """
+
+    def __init__(self, samples: int = 1024):
+        self.samples = samples
+        self.hooks: List[Hook] = []
+        self._aliases: Dict[Hashable, _Stats] = {}
+        self._parameters: Dict[Tuple[str, str], _Stats] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Hook) -> Hook:
+        """Register a function called after each conversion.
+
+        This can be used as a decorator, e.g. to feed a metrics exporter.
+
+        Parameters
+        ----------
+        hook : callable
+            Called with the alias, the parameter as a
+            ``(function name, parameter name)`` tuple, the duration
+            in seconds and whether the conversion failed. Exceptions
+            raised by hooks are logged to the ``limier`` logger,
+            and do not affect conversions.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def record(
+        self,
+        alias: Hashable,
+        parameter: Tuple[str, str],
+        duration: float,
+        failed: bool,
+    ):
+        """Record a conversion."""
+        with self._lock:
+            for stats, key in (
+                (self._aliases, alias),
+                (self._parameters, parameter),
+            ):
+                try:
+                    stats[key].add(duration, failed)
+                except KeyError:
+                    stats[key] = _Stats(self.samples)
+                    stats[key].add(duration, failed)
+        for hook in self.hooks:
+            # Hooks must not change the outcome of conversions.
+            try:
+                hook(alias, parameter, duration, failed)
+            except Exception:  # pylint: disable=broad-except
+                _log_hook_failure(hook)
+
+    def snapshot(self) -> Snapshot:
+        """Return the current statistics.
+
+        Returns
+        -------
+        snapshot : Snapshot
+        """
+        with self._lock:
+            return Snapshot(
+                {key: stats.snapshot() for key, stats in self._aliases.items()},
+                {
+                    key: stats.snapshot()
+                    for key, stats in self._parameters.items()
+                },
+            )
+
+    def reset(self):
+        """Forget all statistics."""
+        with self._lock:
+            self._aliases.clear()
+            self._parameters.clear()
+
+
+class Instrumented(Converter[Any, Any]):
+    """Record the duration and outcome of each conversion of a converter.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+    recorder : Recorder
+    alias : hashable
+    parameter : tuple
+        The ``(function name, parameter name)`` the converter is used for.
+    """
+
+    def __init__(
+        self,
+        converter: Callable,
+        recorder: Recorder,
+        alias: Hashable,
+        parameter: Tuple[str, str],
+    ):
+        self.converter = converter
+        self.recorder = recorder
+        self.alias = alias
+        self.parameter = parameter
+
+    def __call__(self, value: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = self.converter(value)
+        except ValueError:
+            self.recorder.record(
+                self.alias, self.parameter, perf_counter() - start, True
+            )
+            raise
+        self.recorder.record(
+            self.alias, self.parameter, perf_counter() - start, False
+        )
+        return result
+
+
+class _AsyncInstrumented(Instrumented):
+    """Variant of ``Instrumented`` for ``async`` converters."""
+
+    async def __call__(self, value: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = await self.converter(value)
+        except ValueError:
+            self.recorder.record(
+                self.alias, self.parameter, perf_counter() - start, True
+            )
+            raise
+        self.recorder.record(
+            self.alias, self.parameter, perf_counter() - start, False
+        )
+        return result
+
+
+def instrument(
+    converter: Callable,
+    recorder: Recorder,
+    alias: Hashable,
+    parameter: Tuple[str, str],
+) -> Instrumented:
+    """Wrap a converter so that its conversions are recorded.
+
+    ``async`` converters are wrapped in an ``async`` converter.
+    """
+    cls = _AsyncInstrumented if is_async(converter) else Instrumented
+    return cls(converter, recorder, alias, parameter)
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Generic, Optional
+
+from .exceptions import ConversionError
+from .typevars import T
+
+_MISSING = object()
+
+
+class Lazy(Generic[T]):
+    """An argument that is only converted when it is first accessed.
+
+    Decorated functions receive lazy arguments for parameters annotated
+    with ``Lazy[...]`` (e.g. ``amount: Lazy[Decimal]``), or listed in
+    the ``lazy`` option of :func:`~limier.decorators.converted`.
+    Calls that never access them pay no conversion cost.
+
+    The converted value, or the conversion error, is memoized.
+
+    Parameters
+    ----------
+    converter : callable or ``Converter``
+    value : any
+        The value to convert.
+    name : str
+        The name of the parameter, used to report errors.
+
+    Example
+    -------
+    >>> @converted
+    ... def pay(amount: Lazy[Decimal], dry_run: bool = False):
+    ...     if dry_run:
+    ...         return None  # `amount` is not converted.
+    ...     return amount.value
+    >>> pay("oops", dry_run="yes")
+    >>> pay("oops")
+    ConversionError: {'amount': "[<class 'decimal.ConversionSyntax'>]"}
+    """
+
+    __slots__ = ("converter", "raw", "name", "_result", "_error")
+
+    def __init__(self, converter: Callable, value: Any, name: str):
+        self.converter = converter
+        self.raw = value
+        self.name = name
+        self._result: Any = _MISSING
+        self._error: Optional[ValueError] = None
+
+    @property
+    def value(self) -> T:
+        """The converted value.
+
+        Raises
+        ------
+        ConversionError:
+            If the value fails to convert.
+        """
+        result = self._result
+        if result is not _MISSING:
+            return result
+        if self._error is None:
+            try:
+                result = self._result = self.converter(self.raw)
+                return result
+            except ValueError as exc:
+                self._error = exc.with_traceback(None)
+        raise ConversionError(**{self.name: self._error})
+
+    def __call__(self) -> T:
+        return self.value
+
+    @property
+    def converted(self) -> bool:
+        """Whether the value was accessed and converted successfully."""
+        return self._result is not _MISSING
+
+    def __repr__(self) -> str:
+        state = repr(self._result) if self.converted else "..."
+        return f"{type(self).__name__}({self.name}={state})"
@@ -1,35 +1,261 @@
-from functools import reduce, partial
-from typing import Any, Dict, Hashable, List, Union, Callable
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Optional, Union
 
-from .aliases import ALIASES
-from .converters import Converter, Transform
+from .converters import (
+    BYTES_TYPES,
+    Cached,
+    Chain,
+    Converter,
+    for_bytes,
+    fuse,
+)
+from .generics import compile_annotation
+from .instrumentation import Recorder
 
 
 _UNSPECIFIED = object()
 
 
+class _Variant:
+    """Key of a converter registered for a specific input type."""
+
+    __slots__ = ("alias", "input_type")
+
+    def __init__(self, alias: Hashable, input_type: type):
+        self.alias = alias
+        self.input_type = input_type
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, _Variant)
+            and self.alias == other.alias
+            and self.input_type is other.input_type
+        )
+
+    def __hash__(self) -> int:
+        return hash((_Variant, self.alias, self.input_type))
+
+
+def _normalize(input_type: Optional[type]) -> Optional[type]:
+    # All bytes-like types share the same variants.
+    if input_type is not None and issubclass(input_type, BYTES_TYPES):
+        return bytes
+    return input_type
+
+
+class _Snapshot:
+    """Immutable version of the aliases of a registry."""
+
+    __slots__ = ("aliases", "version", "compiled")
+
+    def __init__(self, aliases: Dict[Hashable, Converter], version: int):
+        # Never modified once published.
+        self.aliases = aliases
+        self.version = version
+        # Converters compiled from `typing` annotations, by annotation.
+        # This is a cache: entries are only added.
+        self.compiled: Dict[Hashable, Converter] = {}
+
+
 class Registry:
-    """A registry of converter aliases."""
+    """A registry of converter aliases.
+
+    Aliases are published as immutable snapshots: lookups read the current
+    snapshot without locking, and modifications swap in a new snapshot
+    at once. Functions decorated with a registry that is not frozen
+    pick up modifications on their next call.
+
+    Parameters
+    ----------
+    parent : Registry, optional
+        A registry to derive aliases from. Aliases are shared with
+        the parent until either registry is modified (copy-on-write).
+        The recorder of the parent, if any, is also used.
+
+    Attributes
+    ----------
+    recorder : Recorder or None
+        See :meth:`instrument`.
+    """
+
+    _shared: Optional["Registry"] = None
+    _global: Optional["Registry"] = None
+
+    def __init__(self, parent: "Registry" = None):
+        if parent is None:
+            self._snapshot = _Snapshot({}, 0)
+        else:
+            # Compiled annotations resolve their members using the
+            # registry that compiled them, so they are not shared.
+            current = parent._snapshot
+            self._snapshot = _Snapshot(current.aliases, current.version)
+        # Serializes modifications. Lookups do not use it.
+        self._lock = threading.Lock()
+        self._frozen = False
+        self.recorder: Optional[Recorder] = (
+            None if parent is None else parent.recorder
+        )
+
+    @classmethod
+    def shared(cls) -> "Registry":
+        """Return the shared default registry.
+
+        This registry is built on first use, and is frozen.
+        It has converter aliases defined in the ``aliases`` module.
 
-    def __init__(self):
-        self._aliases: Dict[Hashable, Converter] = {}
+        Returns
+        -------
+        registry : Registry
+        """
+        if Registry._shared is None:
+            # pylint: disable=import-outside-toplevel
+            from .aliases import ALIASES, BYTES_ALIASES
+
+            registry = Registry()
+            registry._publish(ALIASES)
+            for alias, converter in BYTES_ALIASES.items():
+                registry.converter(converter, alias=alias, input_type=bytes)
+            registry.freeze()
+            Registry._shared = registry
+        return Registry._shared
+
+    @classmethod
+    def global_registry(cls) -> "Registry":
+        """Return the registry modified by module-level helpers.
+
+        This is the registry of ``limier.converter``, ``limier.cache``,
+        etc. It is derived from :meth:`shared` on first use, and from then
+        on, it is also the registry used by default, see :meth:`current`.
+
+        Returns
+        -------
+        registry : Registry
+        """
+        if Registry._global is None:
+            Registry._global = Registry.default()
+        return Registry._global
+
+    @classmethod
+    def current(cls) -> "Registry":
+        """Return the registry used when none is given.
+
+        This is the :meth:`global_registry` if module-level helpers
+        were used, e.g. to register a converter, and :meth:`shared`
+        otherwise. Functions decorated with :meth:`shared` do not pick up
+        modifications: use the helpers before decorating functions.
+
+        Returns
+        -------
+        registry : Registry
+        """
+        if Registry._global is not None:
+            return Registry._global
+        return Registry.shared()
 
     @classmethod
     def default(cls) -> "Registry":
         """Build and return the default registry.
 
         This registry has convert aliases defined in the ``aliases`` module.
+        It is derived from :meth:`shared`, which makes it cheap to build.
+
+        Returns
+        -------
+        registry : Registry
+        """
+        return cls(parent=Registry.shared())
+
+    def __reduce_ex__(self, protocol):
+        # The shared registry is unpickled as the shared registry
+        # of the receiving process.
+        if self is Registry._shared:
+            return (Registry.shared, ())
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        state["_snapshot"] = self._snapshot.aliases
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._snapshot = _Snapshot(state["_snapshot"], 0)
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Number that changes each time the aliases are modified."""
+        return self._snapshot.version
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry can no longer be modified."""
+        return self._frozen
+
+    def freeze(self) -> "Registry":
+        """Prevent further modifications to the registry.
+
+        Use :meth:`derive` to build a modifiable copy.
+
+        Returns
+        -------
+        registry : Registry
+            The registry itself.
+        """
+        self._frozen = True
+        return self
+
+    def instrument(self, recorder: Recorder = None) -> Recorder:
+        """Record statistics about conversions of functions decorated
+        from now on with this registry.
+
+        Instrumentation is applied when decorating, so that functions
+        decorated while it is disabled do not pay for it.
+        This is allowed on frozen registries.
+
+        Parameters
+        ----------
+        recorder : Recorder, optional
+            Defaults to a new ``Recorder``.
+
+        Returns
+        -------
+        recorder : Recorder
+        """
+        if recorder is None:
+            recorder = Recorder()
+        self.recorder = recorder
+        return recorder
+
+    def derive(self) -> "Registry":
+        """Build a copy-on-write copy of the registry.
 
         Returns
         -------
         registry : Registry
         """
-        registry = cls()
-        for alias, converter in ALIASES.items():
-            registry.converter(converter, alias=alias)
-        return registry
+        return type(self)(parent=self)
 
-    def converter(self, func: Callable = None, alias: Hashable = _UNSPECIFIED):
+    def _publish(self, updates: Dict[Hashable, Converter]):
+        # Publish a new snapshot of the aliases, with `updates` applied.
+        # Compiled annotations may use the converters being modified,
+        # so they are compiled again for the new snapshot.
+        with self._lock:
+            if self._frozen:
+                raise TypeError("cannot modify a frozen registry")
+            current = self._snapshot
+            aliases = dict(current.aliases)
+            aliases.update(updates)
+            self._snapshot = _Snapshot(aliases, current.version + 1)
+
+    def converter(
+        self,
+        func: Callable = None,
+        alias: Hashable = _UNSPECIFIED,
+        input_type: type = None,
+    ):
         """Add a new converter.
 
         This can be used as a decorator or as a regular function.
@@ -37,40 +263,116 @@ class Registry:
         Parameters
         ----------
         func : callable or ``Converter``
+            Chains are registered in their fused form, see
+            :func:`~limier.converters.fuse`.
         alias : hashable (str, function, tuple, etc.), optional
             Defaults to the name of ``func``.
+        input_type : type, optional
+            If given, ``func`` is only used for values of this type.
+            See :meth:`get`.
+
+        Raises
+        ------
+        TypeError:
+            If the registry is frozen.
         """
         if func is None:
-            return partial(self.converter, alias=alias)
+            return partial(self.converter, alias=alias, input_type=input_type)
 
         if alias is _UNSPECIFIED:
             alias = func.__name__
 
-        self._aliases[alias] = func
+        input_type = _normalize(input_type)
+        key = alias if input_type is None else _Variant(alias, input_type)
+        self._publish({key: fuse(func)})
 
         return func
 
-    def get(self, alias: Hashable) -> Converter:
+    def __contains__(self, alias: Hashable) -> bool:
+        return alias in self._snapshot.aliases
+
+    def get(self, alias: Hashable, input_type: type = None) -> Converter:
         """Retrieve the converter that corresponds to an alias.
 
         Parameters
         ----------
         alias : hashable (str, function, tuple, etc.)
+        input_type : type, optional
+            The type of values that the converter will receive.
+            A converter registered for this type is preferred. For
+            bytes-like types (``bytes``, ``bytearray``, ``memoryview``),
+            the ``for_bytes()`` variant of the converter is used otherwise.
 
         Returns
         -------
         converter : Converter
+            ``typing`` annotations which are not registered as aliases,
+            e.g. ``Optional[int]`` or ``List[int]``, are compiled into
+            a converter once, see
+            :func:`~limier.generics.compile_annotation`.
             This is the `alias` itself if no converter is
             registered for `alias`.
         """
-        return self._aliases.get(alias, alias)
+        snapshot = self._snapshot
+        input_type = _normalize(input_type)
+        if input_type is not None:
+            try:
+                return snapshot.aliases[_Variant(alias, input_type)]
+            except KeyError:
+                pass
+        converter = snapshot.aliases.get(alias, _UNSPECIFIED)
+        if converter is _UNSPECIFIED:
+            converter = self._compile(snapshot, alias)
+        if input_type is bytes:
+            return for_bytes(converter)
+        return converter
+
+    def _compile(self, snapshot: _Snapshot, alias: Hashable) -> Converter:
+        try:
+            return snapshot.compiled[alias]
+        except KeyError:
+            pass
+        converter = compile_annotation(alias, self.get)
+        if converter is None:
+            return alias
+        # Assigned at once, so that concurrent lookups are safe.
+        snapshot.compiled[alias] = converter
+        return converter
+
+    def cache(
+        self,
+        *aliases: Hashable,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+    ):
+        """Add caching to the converters of the given aliases.
+
+        Converters are wrapped in a :class:`~limier.converters.Cached`
+        converter. Functions decorated afterwards use the cached converters.
+
+        Parameters
+        ----------
+        *aliases : hashable
+        maxsize : int, optional
+        ttl : float, optional
+            See :class:`~limier.converters.Cached`.
+        """
+        updates: Dict[Hashable, Converter] = {}
+        for alias in aliases:
+            converter = self.get(alias)
+            if not isinstance(converter, Cached):
+                updates[alias] = Cached(converter, maxsize=maxsize, ttl=ttl)
+        if updates:
+            self._publish(updates)
 
     def chain(
         self, *aliases_or_converters: Union[Hashable, Converter]
-    ) -> Transform:
+    ) -> Converter:
         """Chain converters into a single one.
 
         The input converters can also be given by alias.
+        Recognized stages are fused, e.g. ``chain(int, Bounds(min=0))``
+        returns ``Int(min=0)``, see :func:`~limier.converters.fuse`.
 
         Parameters
         ----------
@@ -78,15 +380,8 @@ class Registry:
 
         Returns
         -------
-        chained : Transform
+        chained : Chain or fused converter
         """
-        converters: List[Converter] = [
-            self.get(value) for value in aliases_or_converters
-        ]
-
-        def convert(value: str) -> Any:
-            return reduce(
-                lambda val, converter: converter(val), converters, value
-            )
-
-        return Transform(convert)
+        return fuse(
+            Chain(*(self.get(value) for value in aliases_or_converters))
+        )
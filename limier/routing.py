@@ -0,0 +1,466 @@
+import re
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote_plus
+
+from .compiler import Plan
+from .converters import BYTES_TYPES, Converter, _Required
+from .exceptions import ConversionError, InvalidValue
+from .generics import sequence_annotation
+from .lazy import Lazy
+from .registry import Registry
+
+# Matches `{name}` and `{name:alias}` in path templates.
+_PARAMETER = re.compile(r"\{(\w+)(?::(\w+))?\}")
+
+# Built-ins which can be used by name in templates. Other built-ins
+# (e.g. `eval` or `open`) must not be applied to paths.
+_BUILTINS = {
+    func.__name__: func
+    for func in (int, float, complex, str, bool, bin, oct, range)
+}
+
+
+def _resolve(registry: Registry, alias: str) -> Converter:
+    # Aliases in templates are names: either of a registered alias (e.g.
+    # a converter registered with `@registry.converter`), or of an allowed
+    # built-in (e.g. `int`), which is then looked up in the registry.
+    if alias in registry:
+        return registry.get(alias)
+    try:
+        return registry.get(_BUILTINS[alias])
+    except KeyError:
+        raise ValueError(f"unknown converter alias: '{alias}'") from None
+
+
+def _check_literal(template: str, text: str):
+    # Placeholders that are not matched by `_PARAMETER` would otherwise
+    # be matched literally.
+    if "{" in text or "}" in text:
+        raise ValueError(f"invalid parameter in template: {template!r}")
+
+
+class PathTemplate:
+    """A URL path template with typed parameters.
+
+    The template is compiled into a single regular expression, and the
+    converters of its parameters are resolved once using the registry.
+
+    Parameters
+    ----------
+    template : str
+        A path with parameters written as ``{name}`` or ``{name:alias}``.
+        A parameter matches any non-empty string without a ``/``.
+        Parameters without an alias are passed as strings.
+    registry : Registry, optional
+        Defaults to ``Registry.current()``.
+
+    Example
+    -------
+    >>> template = PathTemplate("/users/{id:int}/files/{name}")
+    >>> template.match("/users/12/files/notes.txt")
+    {'id': 12, 'name': 'notes.txt'}
+    >>> template.match("/users")
+    None
+    """
+
+    def __init__(self, template: str, registry: Registry = None):
+        if registry is None:
+            registry = Registry.current()
+
+        self.template = template
+        self.converters: Dict[str, Converter] = {}
+        parts: List[str] = []
+        names: Set[str] = set()
+        position = 0
+
+        for match in _PARAMETER.finditer(template):
+            name, alias = match.groups()
+            if name in names:
+                raise ValueError(f"duplicate parameter: '{name}'")
+            names.add(name)
+            literal = template[position : match.start()]
+            _check_literal(template, literal)
+            parts.append(re.escape(literal))
+            parts.append(f"(?P<{name}>[^/]+)")
+            if alias is not None:
+                self.converters[name] = _resolve(registry, alias)
+            position = match.end()
+
+        _check_literal(template, template[position:])
+        parts.append(re.escape(template[position:]))
+        self.pattern = re.compile("".join(parts))
+
+        first = _PARAMETER.search(template)
+        self.prefix: str = template if first is None else template[
+            : first.start()
+        ]
+
+    def match(self, path: str) -> Optional[Dict[str, Any]]:
+        """Match a path and convert its parameters.
+
+        Parameters
+        ----------
+        path : str
+
+        Returns
+        -------
+        params : dict or None
+            The converted parameters, or ``None`` if the path does not
+            match the template.
+
+        Raises
+        ------
+        ConversionError:
+            If the path matches but some parameters fail to convert.
+        """
+        match = self.pattern.fullmatch(path)
+        if match is None:
+            return None
+
+        params = match.groupdict()
+        errors = {}
+        for name, converter in self.converters.items():
+            try:
+                params[name] = converter(params[name])
+            except ValueError as exc:
+                errors[name] = exc.with_traceback(None)
+
+        if errors:
+            raise ConversionError(**errors)
+
+        return params
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.template!r})"
+
+
+class _Node:
+    """Node of the trie of static path segments."""
+
+    __slots__ = ("children", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.routes: List[Tuple[int, PathTemplate, Any]] = []
+
+
+class RouteTable:
+    """Index of path templates for fast lookup.
+
+    Templates are stored in a trie keyed by the complete segments of their
+    static prefix, so that only templates whose prefix is compatible with
+    the requested path are tried.
+
+    Parameters
+    ----------
+    registry : Registry, optional
+        Used to compile templates given as strings.
+        Defaults to ``Registry.current()``.
+
+    Example
+    -------
+    >>> routes = RouteTable()
+    >>> routes.add("/users/{id:int}", "user")
+    >>> routes.add("/users/{id:int}/files/{name}", "file")
+    >>> routes.match("/users/12/files/notes.txt")
+    ('file', {'id': 12, 'name': 'notes.txt'})
+    """
+
+    def __init__(self, registry: Registry = None):
+        if registry is None:
+            registry = Registry.current()
+        self.registry = registry
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, template: Any, value: Any = None) -> PathTemplate:
+        """Add a route.
+
+        Routes are tried in the order they were added.
+
+        Parameters
+        ----------
+        template : str or PathTemplate
+        value : any, optional
+            The object returned along with parameters when the route
+            matches, e.g. an endpoint. Defaults to the template.
+
+        Returns
+        -------
+        template : PathTemplate
+        """
+        if not isinstance(template, PathTemplate):
+            template = PathTemplate(template, registry=self.registry)
+        if value is None:
+            value = template
+
+        # Only complete segments can be indexed.
+        segments = template.prefix.split("/")[:-1]
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+        node.routes.append((self._count, template, value))
+        self._count += 1
+
+        return template
+
+    def match(self, path: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Find the first route that matches a path.
+
+        Routes whose parameters fail to convert are skipped.
+
+        Parameters
+        ----------
+        path : str
+
+        Returns
+        -------
+        route : tuple or None
+            The value of the route and the converted parameters,
+            or ``None`` if no route matches.
+
+        Raises
+        ------
+        ConversionError:
+            If some routes match the path but none of them could
+            convert its parameters. The error of the first one is raised.
+        """
+        candidates = list(self._root.routes)
+        node = self._root
+        for segment in path.split("/")[:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            candidates += node.routes
+        candidates.sort(key=lambda route: route[0])
+
+        error: Optional[ConversionError] = None
+        for _, template, value in candidates:
+            try:
+                params = template.match(path)
+            except ConversionError as exc:
+                if error is None:
+                    error = exc
+                continue
+            if params is not None:
+                return value, params
+
+        if error is not None:
+            raise error
+        return None
+
+
+class QueryParser:
+    """A parser of query strings into the arguments of a function.
+
+    Query strings are parsed in a single pass, without building the
+    intermediate lists of :func:`urllib.parse.parse_qs`: names and values
+    are only percent-decoded if they contain ``%`` or ``+``, and names
+    which are not parameters of the function are skipped.
+    The converters of the parameters are resolved once using the registry.
+
+    Parameters whose annotation is a sequence, e.g. ``List[int]``, collect
+    the values of repeated names. For other parameters, the last value
+    is used. Unannotated parameters are passed as strings, and so are
+    unknown names if the function accepts ``**kwargs``.
+
+    Parameters
+    ----------
+    func : callable
+        The function whose signature is used. The ``raw`` function of
+        functions decorated with :func:`~limier.decorators.converted`
+        is called instead of the decorated function, so that arguments
+        are not converted twice: their converters (and their defaults,
+        if ``typed``) are used instead of the registry.
+    registry : Registry, optional
+        Defaults to ``Registry.current()``. Not used for decorated
+        functions.
+    keep_blank_values : bool, optional
+        Whether names with empty values (e.g. ``"page="``) are parsed, as
+        in :func:`urllib.parse.parse_qs`. By default, they are skipped.
+    separator : str, optional
+        Separator of the fields of query strings.
+
+    Raises
+    ------
+    TypeError:
+        If some parameters are lazy, or if ``func`` was decorated with
+        an ``input_type`` other than ``str``.
+
+    Example
+    -------
+    >>> def search(q: str, page: int = 1, tag: List[str] = ()):
+    ...     return q, page, tag
+    >>> parser = QueryParser(search)
+    >>> parser.parse("q=caf%C3%A9&page=2&tag=a&tag=b")
+    {'q': 'café', 'page': 2, 'tag': ['a', 'b']}
+    >>> parser("q=tea")
+    ('tea', 1, ())
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        registry: Registry = None,
+        keep_blank_values: bool = False,
+        separator: str = "&",
+    ):
+        if registry is None:
+            registry = Registry.current()
+
+        self.func = getattr(func, "raw", func)
+        self.keep_blank_values = keep_blank_values
+        self.separator = separator
+        self.registry = registry
+        # The plan of decorated functions, whose converters are reused.
+        self._plan: Optional[Plan] = getattr(func, "__limier_plan__", None)
+        self._resolve()
+
+    def _resolve(self):
+        # Converters by parameter name, `None` for unannotated parameters.
+        converters: Dict[str, Optional[Converter]] = {}
+        repeated: Set[str] = set()
+        required: List[str] = []
+        extra = False
+
+        plan = self._plan
+        if plan is not None and plan.input_type not in (None, str):
+            raise TypeError(
+                "query values are strings, not "
+                f"{getattr(plan.input_type, '__name__', plan.input_type)}"
+            )
+
+        for name, param in signature(self.func).parameters.items():
+            if param.kind is Parameter.VAR_KEYWORD:
+                extra = True
+                continue
+            if param.kind in (
+                Parameter.POSITIONAL_ONLY,
+                Parameter.VAR_POSITIONAL,
+            ):
+                continue
+            annotation = param.annotation
+            if getattr(annotation, "__origin__", None) is Lazy or (
+                plan is not None and name in plan.lazy
+            ):
+                raise TypeError(f"lazy parameter in query: '{name}'")
+            sequence = sequence_annotation(annotation)
+            if annotation is Parameter.empty:
+                converters[name] = None
+            elif plan is not None:
+                # Converters of sequences also accept the collected lists.
+                converters[name] = plan.converters[name]
+            elif sequence is None:
+                converters[name] = self.registry.get(annotation)
+            else:
+                # Collected values are never `None`, even if optional.
+                converters[name] = self.registry.get(sequence)
+            if sequence is not None:
+                repeated.add(name)
+            if param.default is Parameter.empty:
+                required.append(name)
+
+        self.converters = converters
+        self.repeated = repeated
+        self.required = required
+        self.extra = extra
+        # Defaults converted when decorating, with `typed`.
+        self.defaults: Dict[str, Any] = dict(plan.defaults) if plan else {}
+
+    def parse(self, query: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse and convert the arguments in a query string.
+
+        Parameters
+        ----------
+        query : str or bytes-like
+            Without the leading ``?``. Bytes are decoded as UTF-8.
+
+        Returns
+        -------
+        arguments : dict
+            The converted arguments, by name. Parameters which are
+            not in the query are left out, so that they take their
+            default values.
+
+        Raises
+        ------
+        ConversionError:
+            If some arguments fail to convert, or required ones are missing.
+        """
+        if isinstance(query, BYTES_TYPES):
+            query = str(query, "utf-8", "replace")
+
+        plan = self._plan
+        if (
+            plan is not None
+            and plan.registry is not None
+            and plan.registry._snapshot  # pylint: disable=protected-access
+            is not plan.snapshot
+        ):
+            # The registry of the decorated function was modified:
+            # plan it again, as its wrapper would.
+            self._plan = plan.refresh().__limier_plan__
+            self._resolve()
+
+        converters = self.converters
+        repeated = self.repeated
+        keep_blank_values = self.keep_blank_values
+        extra = self.extra
+        arguments: Dict[str, Any] = {}
+
+        for field in query.split(self.separator):
+            name, _, value = field.partition("=")
+            if not name or not (value or keep_blank_values):
+                continue
+            if "%" in name or "+" in name:
+                name = unquote_plus(name)
+            if name not in converters and not extra:
+                continue
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+            if name in repeated:
+                try:
+                    arguments[name].append(value)
+                except KeyError:
+                    arguments[name] = [value]
+            else:
+                arguments[name] = value
+
+        # Values are converted once parsed, so that values which are
+        # replaced by a repeated name are not converted.
+        errors = {}
+        for name, value in arguments.items():
+            converter = converters.get(name)
+            if converter is None:
+                continue
+            try:
+                arguments[name] = converter(value)
+            except ValueError as exc:
+                errors[name] = exc.with_traceback(None)
+
+        for name in self.required:
+            if name not in arguments:
+                errors[name] = InvalidValue(_Required, None)
+
+        if errors:
+            raise ConversionError(**errors)
+
+        for name, default in self.defaults.items():
+            arguments.setdefault(name, default)
+
+        return arguments
+
+    def __call__(self, query: Union[str, bytes]) -> Any:
+        """Call the function with the arguments in a query string.
+
+        See :meth:`parse`.
+        """
+        return self.func(**self.parse(query))
+
+    def __repr__(self) -> str:
+        name = getattr(self.func, "__qualname__", repr(self.func))
+        return f"{type(self).__name__}({name})"
@@ -0,0 +1,193 @@
+"""Compact containers of accepted values, for use with ``OneOf``.
+
+Python sets are fast but use a lot of memory per value. The containers
+in this module trade a logarithmic lookup for a compact representation.
+"""
+import mmap
+import os
+from array import array
+from typing import Any, Iterable, Iterator, List, Union
+
+# Size of the chunks of mapped files that are scanned at once.
+_CHUNK = 1 << 20
+
+
+def _encode(value: Any) -> Any:
+    # Key of a value in containers of strings, which store UTF-8 bytes.
+    # The order of UTF-8 bytes is the order of code points.
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+class SortedValues:
+    """Immutable container of values with binary search lookups.
+
+    Integers that fit in 64 bits are packed in an ``array``. Strings are
+    packed as a single UTF-8 buffer and an ``array`` of offsets. Strings
+    are also found when looked up as bytes-like values.
+
+    Parameters
+    ----------
+    values : iterable
+        Either integers or strings.
+
+    Example
+    -------
+    >>> ids = SortedValues(range(0, 1000000, 2))
+    >>> 42 in ids
+    True
+    >>> slugs = OneOf.using(SortedValues(["acme", "globex"]))
+    """
+
+    def __init__(self, values: Iterable[Union[int, str]]):
+        unique = sorted(set(values))
+        self._strings = bool(unique) and isinstance(unique[0], str)
+        if self._strings:
+            encoded = [value.encode() for value in unique]
+            self._buffer = b"".join(encoded)
+            self._offsets = array("Q", [0])
+            for item in encoded:
+                self._offsets.append(self._offsets[-1] + len(item))
+            self._length = len(encoded)
+        else:
+            try:
+                self._items: Any = array("q", unique)
+            except OverflowError:
+                self._items = unique
+            self._length = len(unique)
+
+    def _item(self, index: int) -> Any:
+        if self._strings:
+            start = self._offsets[index]
+            return self._buffer[start : self._offsets[index + 1]]
+        return self._items[index]
+
+    def __contains__(self, value: Any) -> bool:
+        if self._strings:
+            value = _encode(value)
+            if not isinstance(value, bytes):
+                return False
+        lo, hi = 0, self._length
+        try:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                item = self._item(mid)
+                if item == value:
+                    return True
+                if item < value:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        except TypeError:
+            # Not comparable with the values, e.g. a string among integers.
+            return False
+        return False
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._length):
+            item = self._item(index)
+            yield item.decode() if self._strings else item
+
+
+class MappedValues:
+    """Container of strings stored in a memory-mapped file.
+
+    The file holds sorted, unique UTF-8 lines, as written by :meth:`write`.
+    Lookups use a binary search over the mapped file, so that the values
+    are not loaded in memory, and processes that map the same file share
+    its pages. Strings are also found when looked up as bytes-like values.
+
+    Parameters
+    ----------
+    path : str
+
+    Example
+    -------
+    >>> MappedValues.write("tenants.txt", ["acme", "globex"])
+    >>> tenants = OneOf.using(MappedValues("tenants.txt"))
+    >>> # Later, after replacing the file (e.g. using `os.replace`):
+    >>> tenants.reload()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._open()
+
+    def _open(self):
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                mapped: Any = b""
+            else:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # `mmap.count()` is not available before Python 3.13.
+        length = sum(
+            mapped[start : start + _CHUNK].count(b"\n")
+            for start in range(0, len(mapped), _CHUNK)
+        )
+        if len(mapped) and mapped[-1:] != b"\n":
+            length += 1
+        # Swapped in a single assignment, so that concurrent lookups
+        # see either the old or the new file.
+        self._state = (mapped, length)
+
+    @staticmethod
+    def write(path: str, values: Iterable[str]):
+        """Write values to a file in the format expected by this class.
+
+        Parameters
+        ----------
+        path : str
+        values : iterable of str
+            Must not contain newlines.
+        """
+        lines: List[bytes] = sorted({_encode(value) for value in values})
+        if any(b"\n" in line or not line for line in lines):
+            raise ValueError("values must be non-empty and without newlines")
+        with open(path, "wb") as file:
+            file.write(b"\n".join(lines))
+            if lines:
+                file.write(b"\n")
+
+    def reload(self):
+        """Map the file again, e.g. after it has been replaced."""
+        self._open()
+
+    def __contains__(self, value: Any) -> bool:
+        key = _encode(value)
+        if not isinstance(key, bytes):
+            return False
+        mapped, _ = self._state
+        lo, hi = 0, len(mapped)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            newline = mapped.rfind(b"\n", lo, mid)
+            start = lo if newline == -1 else newline + 1
+            end = mapped.find(b"\n", start, hi)
+            if end == -1:
+                end = hi
+            line = mapped[start:end]
+            if line == key:
+                return True
+            if line < key:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def __len__(self) -> int:
+        return self._state[1]
+
+    def __iter__(self) -> Iterator[str]:
+        mapped, _ = self._state
+        for line in bytes(mapped).splitlines():
+            yield line.decode()
+
+    def __reduce__(self):
+        # Other processes map the file themselves.
+        return (type(self), (self.path,))
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
+
+from .exceptions import ConversionError, RowConversionError
+from .registry import Registry
+
+
+class Stream:
+    """Lazily convert rows and call a function on each of them.
+
+    Rows are only consumed as the stream is iterated, so that memory usage
+    does not depend on the number of rows. Rows that fail to convert are
+    skipped and reported through a side channel.
+
+    This is also available as ``converted.stream``.
+
+    Parameters
+    ----------
+    func : callable
+        A function decorated with ``@converted``, or a function to
+        decorate using ``registry``.
+    rows : iterable
+        Each row is either a mapping of keyword arguments, or
+        a sequence of positional arguments.
+    registry : Registry, optional
+        Only used if ``func`` is not decorated yet.
+        Defaults to ``Registry.current()``.
+    fail_fast : bool, optional
+        If ``True``, the first row that fails to convert raises
+        a ``RowConversionError``. Defaults to ``False``.
+    on_error : callable, optional
+        Called with each ``RowConversionError`` when ``fail_fast`` is
+        ``False``. Defaults to appending the error to ``errors``.
+        Pass a callback to keep memory usage constant when many
+        rows may fail.
+
+    Attributes
+    ----------
+    errors : list of RowConversionError
+        Errors collected when no ``on_error`` callback is given.
+
+    Example
+    -------
+    >>> def add(x: int, y: int):
+    ...     return x + y
+    >>> stream = Stream(add, [("1", "2"), {"x": "foo", "y": "1"}])
+    >>> list(stream)
+    [3]
+    >>> [error.index for error in stream.errors]
+    [1]
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        rows: Iterable[Any],
+        registry: Registry = None,
+        fail_fast: bool = False,
+        on_error: Optional[Callable[[RowConversionError], Any]] = None,
+    ):
+        if not hasattr(func, "__limier_plan__"):
+            # pylint: disable=import-outside-toplevel
+            from .decorators import converted
+
+            func = converted(func, registry=registry)
+        self.func = func
+        self.rows = rows
+        self.fail_fast = fail_fast
+        self.errors: List[RowConversionError] = []
+        self.on_error = self.errors.append if on_error is None else on_error
+
+    def __iter__(self) -> Iterator[Any]:
+        func = self.func
+        for index, row in enumerate(self.rows):
+            try:
+                if isinstance(row, Mapping):
+                    result = func(**row)
+                else:
+                    result = func(*row)
+            except ConversionError as exc:
+                error = RowConversionError(index, exc.causes)
+                if self.fail_fast:
+                    raise error from exc
+                self.on_error(error)
+                continue
+            yield result
@@ -0,0 +1,49 @@
+from contextvars import ContextVar, Token
+from typing import Optional
+
+# Fraction of calls that are still converted in the current context,
+# or `None` if the context is not trusted.
+TRUSTED: ContextVar[Optional[float]] = ContextVar(
+    "limier_trusted", default=None
+)
+
+
+class trusted:  # pylint: disable=invalid-name
+    """Context in which callers are trusted to pass converted values.
+
+    Functions decorated with ``@converted(bypass=True)`` skip conversions
+    when they are called in this context, including from ``asyncio`` tasks
+    created in it. Other functions are not affected.
+
+    Parameters
+    ----------
+    sample : float, optional
+        Fraction of calls which are still converted, between 0 and 1,
+        e.g. to detect callers that pass unexpected values.
+        Defaults to 0.
+
+    Example
+    -------
+    >>> @converted(bypass=True)
+    ... def add(x: int, y: int):
+    ...     return x + y
+    >>> with trusted():
+    ...     add(1, 2)  # Not converted.
+    3
+    """
+
+    def __init__(self, sample: float = 0.0):
+        if not 0 <= sample <= 1:
+            raise ValueError(
+                f"`sample` must be between 0 and 1, got {sample}"
+            )
+        self.sample = sample
+        self._tokens: list = []
+
+    def __enter__(self) -> "trusted":
+        self._tokens.append(TRUSTED.set(self.sample))
+        return self
+
+    def __exit__(self, *args):
+        token: Token = self._tokens.pop()
+        TRUSTED.reset(token)
@@ -7,7 +7,8 @@ import os
 from setuptools import find_packages, setup
 
 DEPENDENCIES = []
-EXCLUDE_FROM_PACKAGES = ["contrib", "docs", "tests*"]
+EXTRAS = {"numpy": ["numpy"]}
+EXCLUDE_FROM_PACKAGES = ["benchmarks*", "contrib", "docs", "tests*"]
 CURDIR = os.path.abspath(os.path.dirname(__file__))
 
 with open(os.path.join(CURDIR, "README.md"), "r") as f:
@@ -41,7 +42,8 @@ setup(
     scripts=[],
     zip_safe=False,
     install_requires=DEPENDENCIES,
-    python_requires=">=3.6",
+    extras_require=EXTRAS,
+    python_requires=">=3.7",
     # license and classifier list:
     # https://pypi.org/pypi?%%3Aaction=list_classifiers
     license="License :: OSI Approved :: MIT License",
@@ -49,7 +51,6 @@ setup(
         "Operating System :: OS Independent",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
     ],
 )
@@ -0,0 +1,62 @@
+import asyncio
+import inspect
+
+import pytest
+from limier import converted, ConversionError
+
+
+async def slow_int(value) -> int:
+    await asyncio.sleep(0.05)
+    return int(value)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_coroutine_function():
+    @converted
+    async def add(x: int, y: int = 0):
+        return x + y
+
+    assert inspect.iscoroutinefunction(add)
+    assert run(add("1", "2")) == 3
+
+
+def test_async_converters_run_concurrently():
+    @converted
+    async def add(x: slow_int, y: slow_int, z: slow_int):
+        return x + y + z
+
+    loop = asyncio.new_event_loop()
+    start = loop.time()
+    assert loop.run_until_complete(add("1", "2", "3")) == 6
+    assert loop.time() - start < 0.12
+    loop.close()
+
+
+def test_errors_are_aggregated():
+    @converted
+    async def add(x: slow_int, y: int, z: slow_int):
+        return x + y + z
+
+    with pytest.raises(ConversionError) as ctx:
+        run(add("foo", "bar", "3"))
+    assert set(ctx.value.errors) == {"x", "y"}
+
+
+def test_async_converter_on_sync_function():
+    with pytest.raises(TypeError):
+
+        @converted
+        def f(x: slow_int):
+            pass
+
+
+def test_typed_async_converter():
+    @converted(typed=True)
+    async def f(x: slow_int = "1"):
+        return x
+
+    assert run(f()) == 1
+    assert run(f(2)) == 2
@@ -0,0 +1,64 @@
+import pytest
+from limier import converted, convert_many, get, Equiv, Filter, OneOf
+
+
+def test_convert_many_builtin():
+    values, errors = convert_many(int, ["1", "2", "foo"])
+    assert values == [1, 2, None]
+    assert list(errors) == [2]
+
+
+def test_convert_many_filter():
+    values, errors = convert_many(get(str.isdigit), ["1", "a", "2"])
+    assert values == ["1", None, "2"]
+    assert errors == {1: "'a' does not satisfy 'isdigit'"}
+
+
+def test_convert_many_one_of():
+    values, errors = OneOf("a", "b").convert_many(["a", "c"])
+    assert values == ["a", None]
+    assert list(errors) == [1]
+
+
+def test_convert_many_equiv():
+    values, errors = get(bool).convert_many(["yes", "no", "maybe", "yes"])
+    assert values == [True, False, None, True]
+    assert errors == {2: "no equivalent for 'maybe'"}
+
+
+@pytest.mark.parametrize(
+    "converter, values",
+    [
+        (OneOf("1", "2"), [1, "1"]),
+        (OneOf(1, 2), ["1", "2"]),
+        (Filter(str.isdigit), ["1", 2]),
+        (Equiv({"1": True}), [1, "1"]),
+    ],
+)
+def test_convert_many_is_consistent_with_scalar_calls(converter, values):
+    expected_values, expected_errors = [], []
+    for index, value in enumerate(values):
+        try:
+            expected_values.append(converter(value))
+        except ValueError:
+            expected_values.append(None)
+            expected_errors.append(index)
+        except TypeError:
+            with pytest.raises(TypeError):
+                converter.convert_many(values)
+            return
+    converted_values, errors = converter.convert_many(values)
+    assert converted_values == expected_values
+    assert list(errors) == expected_errors
+
+
+def test_batch():
+    @converted.batch
+    def total(x: int, y: int, scale=1):
+        return (sum(x) + sum(y)) * scale
+
+    assert total(["1", "2"], ["3", "4"]) == (10, {})
+    result, errors = total(["1", "2", "foo"], ["3", "4", "5"], scale=2)
+    assert result == 20
+    assert list(errors) == [2]
+    assert list(errors[2]) == ["x"]
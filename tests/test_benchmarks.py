@@ -0,0 +1,16 @@
+from benchmarks.cases import get_cases
+from benchmarks.runner import REFERENCE, compare, report
+
+
+def test_cases_run():
+    for case in get_cases().values():
+        case()
+
+
+def test_compare():
+    baseline = {REFERENCE: 100.0, "a": 200.0, "b": 300.0}
+    current = {REFERENCE: 50.0, "a": 100.0, "b": 300.0, "c": 1.0}
+    regressions = compare(baseline, current, threshold=1.25)
+    assert [regression.name for regression in regressions] == ["b"]
+    assert regressions[0].ratio == 2.0
+    assert "vs base" in report(baseline, current)
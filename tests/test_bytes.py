@@ -0,0 +1,91 @@
+import pytest
+from limier import (
+    Chain,
+    ConversionError,
+    OneOf,
+    Range,
+    Registry,
+    converted,
+    for_bytes,
+)
+
+
+def test_regex():
+    converter = for_bytes(Range())
+    assert converter(b"1:3") == range(1, 3)
+    assert converter(memoryview(b"/1:3")[1:]) == range(1, 3)
+    with pytest.raises(ValueError):
+        converter(b"foo")
+
+
+def test_equiv():
+    converter = Registry.shared().get(bool, input_type=memoryview)
+    assert converter(b"yes") is True
+    assert converter(memoryview(b"no")) is False
+    with pytest.raises(ValueError):
+        converter(b"maybe")
+
+
+def test_filter_and_one_of():
+    registry = Registry.shared()
+    isdigit = registry.get(str.isdigit, input_type=bytes)
+    assert isdigit(b"12") == b"12"
+    assert isdigit(memoryview(b"12")) is not None
+    with pytest.raises(ValueError, match="isdigit"):
+        isdigit(b"1a")
+    one_of = OneOf("a", "b").for_bytes()
+    assert one_of(memoryview(b"a")) is not None
+    with pytest.raises(ValueError):
+        one_of(b"c")
+
+
+@pytest.mark.parametrize(
+    "test", [getattr(str, name) for name in dir(str) if name.startswith("is")]
+)
+def test_str_filter_aliases(test):
+    converter = Registry.shared().get(test, input_type=bytes)
+
+    @converted(input_type=bytes)
+    def f(x: test):
+        return x
+
+    # `bytes` methods only consider ASCII characters.
+    for value in ("abc", "ABC", "Abc", "123", " ", "a b", "x_1"):
+        encoded = value.encode()
+        if test(value):
+            assert converter(encoded) == encoded
+            assert f(memoryview(encoded)) == encoded
+        else:
+            with pytest.raises(ValueError):
+                converter(encoded)
+    with pytest.raises(ValueError):
+        converter(b"\xff")
+
+
+def test_chain():
+    converter = Chain(Registry.shared().get(str.isdigit), int).for_bytes()
+    assert converter(memoryview(b"12")) == 12
+
+
+def test_registered_variant():
+    registry = Registry.default()
+    registry.converter(bytes.upper, alias="upper", input_type=bytes)
+    registry.converter(str.upper, alias="upper")
+    assert registry.get("upper", input_type=memoryview) is bytes.upper
+    assert registry.get("upper") is str.upper
+
+
+def test_converted():
+    @converted(input_type=memoryview)
+    def f(x: int, flag: bool, name: str, r: range):
+        return x, flag, name, r
+
+    path = memoryview(b"12/yes/caf\xc3\xa9/1:2")
+    assert f(path[0:2], path[3:6], path[7:12], path[13:]) == (
+        12,
+        True,
+        "café",
+        range(1, 2),
+    )
+    with pytest.raises(ConversionError):
+        f(path[3:6], path[0:2], b"", path[7:12])
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import warnings
+
+import pytest
+from limier import Cached, Registry, converted
+
+
+def test_cached_hits_and_misses():
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return int(value) * 2
+
+    cached = Cached(double)
+    assert cached("2") == 4
+    assert cached("2") == 4
+    assert calls == ["2"]
+    assert cached.cache_info().hits == 1
+    assert cached.cache_info().misses == 1
+
+
+def test_failures_are_cached():
+    calls = []
+
+    def fail(value):
+        calls.append(value)
+        raise ValueError("nope")
+
+    cached = Cached(fail)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="nope"):
+            cached("x")
+    assert calls == ["x"]
+
+
+def test_eviction():
+    cached = Cached(int, maxsize=2)
+    for value in ("1", "2", "1", "3"):
+        cached(value)
+    info = cached.cache_info()
+    assert info.currsize == 2
+    assert info.evictions == 1
+    cached("1")
+    assert cached.cache_info().hits == 2
+
+
+def test_ttl():
+    cached = Cached(int, ttl=0)
+    cached("1")
+    cached("1")
+    assert cached.cache_info().misses == 2
+
+
+def test_unhashable_values_bypass_cache():
+    cached = Cached(len)
+    assert cached([1, 2]) == 2
+    assert cached.cache_info().currsize == 0
+
+
+def test_threads():
+    cached = Cached(int, maxsize=8)
+
+    def work():
+        for index in range(200):
+            assert cached(str(index % 16)) == index % 16
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cached.cache_info()
+    assert info.hits + info.misses == 800
+    assert info.currsize <= 8
+
+
+def test_registry_cache():
+    registry = Registry.default()
+    registry.cache(range, maxsize=16)
+    assert isinstance(registry.get(range), Cached)
+
+    @converted(registry=registry)
+    def f(r: range):
+        return r
+
+    assert f("1:3") == f("1:3") == range(1, 3)
+    assert registry.get(range).cache_info().hits == 1
+
+
+def test_async_converters():
+    calls = []
+
+    async def slow(value):
+        calls.append(value)
+        await asyncio.sleep(0)
+        return int(value)
+
+    registry = Registry.default()
+    registry.converter(slow)
+    registry.cache("slow")
+    cached = registry.get("slow")
+
+    @converted(registry=registry)
+    async def f(x: "slow"):
+        return x
+
+    async def main():
+        return [await f("1"), await f("1"), await f("2")]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert asyncio.run(main()) == [1, 1, 2]
+        with pytest.raises(ValueError):
+            asyncio.run(cached("x"))
+        with pytest.raises(ValueError):
+            asyncio.run(cached("x"))
+    assert calls == ["1", "2", "x"]
+    assert cached.cache_info().hits == 2
@@ -0,0 +1,43 @@
+import decimal
+
+import pytest
+from limier import Chain, Filter, Transform, chain, get
+
+
+def positive(value: int) -> int:
+    if value < 0:
+        raise ValueError("Expected positive value")
+    return value
+
+
+def test_chain():
+    converter = chain(int, positive)
+    assert converter("2") == 2
+    with pytest.raises(ValueError, match="positive"):
+        converter("-2")
+
+
+def test_nested_chains_are_flattened():
+    inner = chain(str.strip, int)
+    converter = chain(inner, positive)
+    assert converter.stages == (str.strip, int, positive)
+    assert converter(" 3 ") == 3
+
+
+def test_fused_filters_report_the_failing_filter():
+    converter = Chain(get(str.isalnum), get(str.islower), str.upper)
+    assert converter("abc1") == "ABC1"
+    with pytest.raises(ValueError, match="islower"):
+        converter("Abc")
+    with pytest.raises(ValueError, match="isalnum"):
+        converter("a-b")
+
+
+def test_transform_errors_are_translated():
+    converter = Chain(
+        Transform(decimal.Decimal, raised_if_invalid=decimal.InvalidOperation),
+        Filter(lambda value: value > 0),
+    )
+    assert converter("1.5") == decimal.Decimal("1.5")
+    with pytest.raises(ValueError):
+        converter("oops")
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from limier import codecache, converted
+
+
+@pytest.fixture
+def directory(tmp_path):
+    codecache.enable(str(tmp_path))
+    codecache._memory.clear()
+    yield tmp_path
+    codecache.disable()
+    codecache._memory.clear()
+
+
+def add(x: int, y: int):
+    return x + y
+
+
+def test_code_is_stored(directory):
+    assert converted(add)("1", "2") == 3
+    assert len(list(directory.glob("*.code"))) == 1
+
+
+def test_code_is_loaded(directory, monkeypatch):
+    converted(add)
+    codecache._memory.clear()
+
+    def fail(*args):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(codecache, "compile", fail, raising=False)
+    assert converted(add)("1", "2") == 3
+
+
+def test_corrupted_code_is_compiled_again(directory):
+    converted(add)
+    codecache._memory.clear()
+    (path,) = directory.glob("*.code")
+    path.write_bytes(b"garbage")
+    assert converted(add)("1", "2") == 3
+
+
+def test_code_is_shared_in_memory():
+    code = codecache.compile_source("x = 1\n", "<test>")
+    assert codecache.compile_source("x = 1\n", "<test>") is code
+    assert codecache.compile_source("x = 1\n", "<other>") is not code
+
+
+def test_command_line(tmp_path):
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "module.py").write_text(
+        textwrap.dedent(
+            """
+            from limier import converted
+
+            @converted
+            def mul(x: int, y: float):
+                return x * y
+            """
+        )
+    )
+    cache = tmp_path / "cache"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), root]))
+    env.pop("LIMIER_CACHE_DIR", None)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "error",
+            "-m",
+            "limier.codecache",
+            "--directory",
+            str(cache),
+            "package",
+        ],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    assert "Imported 2 modules, cached 1 new code objects" in result.stdout
+    assert result.stderr == ""
+    assert len(os.listdir(cache)) == 1
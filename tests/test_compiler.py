@@ -0,0 +1,57 @@
+import pytest
+from limier import converted, ConversionError
+
+
+@converted
+def everything(a: int, b=1, *args: tuple, c: int, d: float = 2.0, **kwargs):
+    return a, b, args, c, d, kwargs
+
+
+def test_parameter_layout():
+    assert everything("1", c="3") == (1, 1, (), 3, 2.0, {})
+    assert everything("1", 2, 3, c="3", d="4", e=5) == (
+        1,
+        2,
+        (3,),
+        3,
+        4.0,
+        {"e": 5},
+    )
+
+
+def test_binding_errors_are_type_errors():
+    with pytest.raises(TypeError):
+        everything("1")
+    with pytest.raises(TypeError):
+        everything(c=1)
+
+
+def test_errors_are_aggregated():
+    with pytest.raises(ConversionError) as ctx:
+        everything("foo", c="bar", d="0.5")
+    assert set(ctx.value.errors) == {"a", "c"}
+
+
+def test_parameter_named_like_internals():
+    @converted
+    def f(exc: int, wrapper: int = 0):
+        return exc + wrapper
+
+    assert f("1", "2") == 3
+
+
+@pytest.mark.parametrize("typed", [False, True])
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_parameters_named_like_builtins(typed, fail_fast):
+    @converted(typed=typed, fail_fast=fail_fast)
+    def f(isinstance: int, ValueError: int = "2"):
+        return isinstance, ValueError
+
+    assert f("1") == (1, 2)
+    with pytest.raises(ConversionError):
+        f("x")
+
+
+def test_metadata_is_preserved():
+    assert everything.__name__ == "everything"
+    assert everything.__wrapped__ is not None
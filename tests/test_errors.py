@@ -0,0 +1,67 @@
+import decimal
+
+import pytest
+from limier import (
+    Cached,
+    ConversionError,
+    InvalidValue,
+    OneOf,
+    Transform,
+    chain,
+    converted,
+)
+
+
+class CountingOneOf(OneOf):
+    formatted = 0
+
+    def get_failure_message(self, value):
+        CountingOneOf.formatted += 1
+        return super().get_failure_message(value)
+
+
+def test_messages_are_formatted_when_read():
+    CountingOneOf.formatted = 0
+    one_of = CountingOneOf("a", "b")
+
+    @converted
+    def f(x: one_of):
+        return x
+
+    with pytest.raises(ConversionError) as ctx:
+        f("c")
+    assert CountingOneOf.formatted == 0
+    assert isinstance(ctx.value.causes["x"], InvalidValue)
+    assert "got 'c'" in ctx.value.errors["x"]
+    assert "got 'c'" in str(ctx.value)
+    assert CountingOneOf.formatted == 1
+
+
+def test_translated_messages():
+    to_decimal = Transform(
+        decimal.Decimal, raised_if_invalid=decimal.InvalidOperation
+    )
+    for converter in (to_decimal, chain(to_decimal), Cached(to_decimal)):
+        for _ in range(2):
+            with pytest.raises(ValueError) as ctx:
+                converter("oops")
+            assert "ConversionSyntax" in str(ctx.value)
+
+
+def test_fail_fast():
+    calls = []
+
+    def tracked(value) -> int:
+        calls.append(value)
+        return int(value)
+
+    @converted(fail_fast=True)
+    def f(x: tracked, y: tracked):
+        return x + y
+
+    assert f("1", "2") == 3
+    calls.clear()
+    with pytest.raises(ConversionError) as ctx:
+        f("foo", "bar")
+    assert list(ctx.value.errors) == ["x"]
+    assert calls == ["foo"]
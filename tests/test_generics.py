@@ -0,0 +1,118 @@
+import pickle
+import sys
+import typing
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+import pytest
+from limier import ConversionError, Registry, converted
+
+# Python 3.8+
+Literal = getattr(typing, "Literal", None)
+
+
+@pytest.mark.parametrize(
+    "annotation, value, output",
+    [
+        (Optional[int], "1", 1),
+        (Optional[int], None, None),
+        (Optional[int], "null", None),
+        (Union[int, float], "1", 1),
+        (Union[int, float], "1.5", 1.5),
+        (Union[str, int], "1", "1"),
+        (List[int], ["1", "2"], [1, 2]),
+        (List[int], ("1", "2"), [1, 2]),
+        (List[bool], ["yes", "no"], [True, False]),
+        (List[Any], ["1"], ["1"]),
+        (Sequence[float], ["1.5"], [1.5]),
+        (FrozenSet[int], ["1", "1"], frozenset({1})),
+        (Tuple[int, ...], ["1", "2"], (1, 2)),
+        (Tuple[int, str], ["1", "a"], (1, "a")),
+        (Dict[str, int], {"a": "1"}, {"a": 1}),
+        (Dict[int, List[int]], {"1": ["2"]}, {1: [2]}),
+        (Optional[List[int]], ["1"], [1]),
+    ],
+)
+def test_annotations(annotation, value, output):
+    @converted
+    def f(x: annotation):
+        return x
+
+    assert f(value) == output
+
+
+@pytest.mark.parametrize(
+    "annotation, value, message",
+    [
+        (Optional[int], "foo", "expected one of int, None, got 'foo'"),
+        (
+            List[int],
+            ["1", "foo"],
+            "[1]: invalid literal for int() with base 10: 'foo'",
+        ),
+        (List[int], "12", "expected a sequence, got '12'"),
+        (Dict[str, List[int]], {"a": ["b"]}, "['a'][0]: "),
+        (Tuple[int, int], ["1"], "expected a sequence of 2 items"),
+    ],
+)
+def test_errors(annotation, value, message):
+    @converted
+    def f(x: annotation):
+        return x
+
+    with pytest.raises(ConversionError) as ctx:
+        f(value)
+    assert ctx.value.errors["x"].startswith(message)
+
+
+@pytest.mark.skipif(Literal is None, reason="requires typing.Literal")
+def test_literal():
+    @converted
+    def f(x: Literal["a", 1]):
+        return x
+
+    assert (f("a"), f("1"), f(1)) == ("a", 1, 1)
+    with pytest.raises(ConversionError) as ctx:
+        f("c")
+    assert ctx.value.errors["x"] == "no equivalent for 'c'"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10")
+def test_builtin_annotations():
+    @converted
+    def f(x: int | None, y: list[int]):
+        return x, y
+
+    assert f("1", ["2"]) == (1, [2])
+
+
+def test_compiled_once():
+    registry = Registry.shared()
+    assert registry.get(List[int]) is registry.get(List[int])
+
+
+def test_registered_alias_is_preferred():
+    registry = Registry.default()
+    registry.converter(len, alias=List[str])
+    assert registry.get(List[str]) is len
+
+
+def test_members_use_registry_aliases():
+    registry = Registry.default()
+    compiled = registry.get(List[str])
+    registry.converter(str.upper, alias=str)
+    assert registry.get(List[str]) is not compiled
+    assert registry.get(List[str])(["a"]) == ["A"]
+
+
+def test_typed():
+    @converted(typed=True)
+    def f(x: List[int], y: Optional[int] = None):
+        return x, y
+
+    assert f(["1"]) == ([1], None)
+
+
+def test_picklable():
+    converter = Registry.shared().get(Dict[str, Optional[List[int]]])
+    converter = pickle.loads(pickle.dumps(converter))
+    assert converter({"a": ["1"], "b": None}) == {"a": [1], "b": None}
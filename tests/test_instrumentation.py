@@ -0,0 +1,99 @@
+import asyncio
+import pickle
+
+import pytest
+from limier import ConversionError, Recorder, Registry, converted
+from limier.instrumentation import Instrumented, instrument
+
+
+def add(x: int, y: int = 0):
+    return x + y
+
+
+def test_disabled_by_default():
+    wrapper = converted(add)
+    assert not any(
+        isinstance(converter, Instrumented)
+        for converter in wrapper.__limier_plan__.converters.values()
+    )
+
+
+def test_recorder():
+    recorder = Recorder()
+    wrapper = converted(add, recorder=recorder)
+    wrapper("1", "2")
+    with pytest.raises(ConversionError):
+        wrapper("foo")
+
+    snapshot = recorder.snapshot()
+    assert snapshot.aliases[int].calls == 4
+    assert snapshot.aliases[int].failures == 1
+    stats = snapshot.parameters[("add", "x")]
+    assert (stats.calls, stats.failures) == (2, 1)
+    assert stats.total >= stats.p99 >= stats.p50 >= 0
+
+    recorder.reset()
+    assert recorder.snapshot().aliases == {}
+
+
+def test_registry_instrumentation_and_hooks():
+    registry = Registry.default()
+    recorder = registry.instrument()
+    seen = []
+    recorder.add_hook(lambda *args: seen.append(args))
+
+    @converted(registry=registry)
+    def f(x: bool):
+        return x
+
+    f("yes")
+    assert [(alias, param, failed) for alias, param, _, failed in seen] == [
+        (bool, (f.__qualname__, "x"), False)
+    ]
+
+
+def test_picklable():
+    registry = Registry.default()
+    registry.instrument().record(int, ("f", "x"), 0.5, False)
+    registry = pickle.loads(pickle.dumps(registry))
+    assert registry.recorder.snapshot().aliases[int].calls == 1
+
+    converter = instrument(int, registry.recorder, int, ("f", "x"))
+    converter = pickle.loads(pickle.dumps(converter))
+    assert converter("1") == 1
+    assert converter.recorder.snapshot().aliases[int].calls == 2
+
+
+@pytest.mark.parametrize("exception", [ValueError, RuntimeError])
+def test_failing_hooks_do_not_affect_conversions(exception, caplog):
+    recorder = Recorder()
+    seen = []
+
+    @recorder.add_hook
+    def exporter(*args):
+        raise exception("exporter down")
+
+    recorder.add_hook(lambda *args: seen.append(args))
+
+    @converted(recorder=recorder)
+    def f(x: int):
+        return x
+
+    assert f("1") == 1
+    assert len(seen) == 1
+    assert "instrumentation hook" in caplog.text
+    assert recorder.snapshot().parameters[(f.__qualname__, "x")].calls == 1
+
+
+def test_async_converter():
+    async def slow(value) -> int:
+        return int(value)
+
+    recorder = Recorder()
+
+    @converted(recorder=recorder)
+    async def f(x: slow):
+        return x
+
+    assert asyncio.run(f("1")) == 1
+    assert recorder.snapshot().aliases[slow].calls == 1
@@ -0,0 +1,66 @@
+import decimal
+
+import pytest
+from limier import ConversionError, Lazy, converted
+
+
+def test_lazy_annotation():
+    calls = []
+
+    def counted(value) -> int:
+        calls.append(value)
+        return int(value)
+
+    @converted
+    def f(x: Lazy[counted], use: bool = "no"):
+        return x.value + x() if use else x
+
+    lazy = f("1")
+    assert isinstance(lazy, Lazy)
+    assert calls == []
+    assert f("1", use="yes") == 2
+    assert calls == ["1"]
+
+
+def test_lazy_option():
+    @converted(lazy={"amount"})
+    def f(amount: decimal.Decimal, count: int):
+        return amount, count
+
+    amount, count = f("oops", "2")
+    assert count == 2
+    assert amount.raw == "oops"
+    assert not amount.converted
+    for _ in range(2):
+        with pytest.raises(ConversionError) as ctx:
+            amount.value
+        assert set(ctx.value.errors) == {"amount"}
+
+
+def test_unused_arguments_are_not_converted():
+    @converted(typed=True)
+    def f(x: Lazy[int] = "foo"):
+        return "ok"
+
+    assert f() == "ok"
+    assert f("bar") == "ok"
+
+
+@pytest.mark.parametrize("lazy", [{"y"}, {"z"}])
+def test_invalid_lazy_parameters(lazy):
+    def f(x: int, y):
+        pass
+
+    with pytest.raises(TypeError):
+        converted(f, lazy=lazy)
+
+
+def test_async_converters_cannot_be_lazy():
+    async def conv(value):
+        return value
+
+    async def f(x: Lazy[conv]):
+        pass
+
+    with pytest.raises(TypeError):
+        converted(f)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from limier import ConversionError, converted
+
+
+class Account:
+    rate = 2
+
+    def __init__(self, balance: int = 0):
+        self.balance = balance
+
+    @converted
+    def deposit(self, amount: int, *, note: str = ""):
+        self.balance += amount
+        return self.balance, note
+
+    @classmethod
+    @converted
+    def scaled(cls, amount: int):
+        return cls(amount * cls.rate)
+
+    @converted
+    @classmethod
+    def opened(cls, amount: int):
+        return cls(amount)
+
+    @staticmethod
+    @converted
+    def parse(amount: int):
+        return amount
+
+    @converted
+    @staticmethod
+    def check(amount: int):
+        return amount > 0
+
+    @converted
+    async def fetch(self, amount: int):
+        await asyncio.sleep(0)
+        return self.balance + amount
+
+
+def test_method():
+    account = Account()
+    assert account.deposit("10", note=1) == (10, "1")
+    with pytest.raises(ConversionError) as ctx:
+        account.deposit("foo")
+    assert set(ctx.value.errors) == {"amount"}
+
+
+def test_self_is_not_converted():
+    plan = Account.deposit.__limier_plan__
+    assert "self" not in plan.converters
+
+
+@pytest.mark.parametrize("name", ["scaled", "opened"])
+def test_classmethod(name):
+    account = getattr(Account, name)("2")
+    assert isinstance(account, Account)
+    assert account.balance in (2, 4)
+    assert getattr(Account(), name)("2").balance == account.balance
+
+
+@pytest.mark.parametrize("name", ["parse", "check"])
+def test_staticmethod(name):
+    assert getattr(Account, name)("2") in (2, True)
+    assert getattr(Account(), name)("2") in (2, True)
+    with pytest.raises(ConversionError):
+        getattr(Account, name)("foo")
+
+
+def test_async_method():
+    assert asyncio.run(Account(1).fetch("2")) == 3
@@ -0,0 +1,134 @@
+import decimal
+import math
+import pickle
+
+import pytest
+from limier import (
+    Bounds,
+    Chain,
+    DecimalRange,
+    Float,
+    Int,
+    Registry,
+    Transform,
+    chain,
+    converted,
+    for_bytes,
+    fuse,
+)
+
+
+def test_int():
+    to_port = Int(min=1, max=65535)
+    assert to_port("8000") == 8000
+    assert to_port(1) == 1
+    with pytest.raises(ValueError, match="between 1 and 65535, got '0'"):
+        to_port("0")
+    with pytest.raises(ValueError, match="invalid literal"):
+        to_port("foo")
+    assert Int(base=16)("ff") == 255
+
+
+def test_float():
+    assert Float(min=0)("1.5") == 1.5
+    with pytest.raises(ValueError, match=">= 0"):
+        Float(min=0)("-1")
+    assert math.isnan(Float(min=0)("nan"))
+    with pytest.raises(ValueError, match="expected a number"):
+        Float(allow_nan=False)("nan")
+
+
+def test_decimal_range():
+    to_price = DecimalRange(min=0, allow_nan=False)
+    assert to_price("9.99") == decimal.Decimal("9.99")
+    for value in ("-1", "nan", "foo"):
+        with pytest.raises(ValueError):
+            to_price(value)
+    assert DecimalRange(max=1)("NaN").is_nan()
+
+
+def test_bytes():
+    assert for_bytes(Int(max=10))(memoryview(b"10")) == 10
+    assert for_bytes(Float())(bytearray(b"1.5")) == 1.5
+    assert for_bytes(DecimalRange())(b"1.5") == decimal.Decimal("1.5")
+
+
+@pytest.mark.parametrize(
+    "stages, expected",
+    [
+        ((int, Bounds(min=0)), Int(min=0)),
+        ((int, Bounds(min=0), Bounds(min=-1, max=9)), Int(min=0, max=9)),
+        ((bin, Bounds(max=3)), Int(max=3, base=2)),
+        ((float, Bounds(0, 1)), Float(0, 1, allow_nan=False)),
+        ((Int(min=0, max=5), Bounds(max=10)), Int(min=0, max=5)),
+        (
+            (decimal.Decimal, Bounds(min=0)),
+            DecimalRange(min=0, allow_nan=False),
+        ),
+        (
+            (Float(allow_nan=False), Bounds(max=1)),
+            Float(max=1, allow_nan=False),
+        ),
+    ],
+)
+def test_chains_are_fused(stages, expected):
+    fused = chain(*stages)
+    assert type(fused) is type(expected)
+    assert fused.__reduce__() == expected.__reduce__()
+
+
+@pytest.mark.parametrize(
+    "stages, value",
+    [
+        ((float, Bounds(0, 1)), "nan"),
+        ((float, Bounds(min=0)), "nan"),
+        ((float, Bounds()), "nan"),
+        ((Float(), Bounds(max=1)), "nan"),
+        ((decimal.Decimal, Bounds(min=0)), "NaN"),
+        ((Registry.shared().get(decimal.Decimal), Bounds(max=1)), "NaN"),
+        ((DecimalRange(), Bounds()), "NaN"),
+    ],
+)
+def test_fused_chains_handle_nan_as_chains(stages, value):
+    def outcome(converter):
+        try:
+            result = converter(value)
+        except (ValueError, ArithmeticError):
+            return "rejected"
+        return "nan" if result != result else result
+
+    assert outcome(chain(*stages)) == outcome(Chain(*stages))
+
+
+def test_partially_fused_chain():
+    fused = chain(str.strip, int, Bounds(min=0))
+    assert isinstance(fused, Chain)
+    assert fused.stages == (str.strip, fused.stages[1])
+    assert fused(" 1 ") == 1
+
+
+def test_unrecognized_chains_are_kept():
+    converter = Chain(int, abs)
+    assert fuse(converter) is converter
+    converter = Chain(Transform(int, raised_if_invalid=TypeError), Bounds())
+    assert fuse(converter) is converter
+
+
+def test_registered_chains_are_fused():
+    registry = Registry.default()
+    registry.converter(Chain(int, Bounds(min=0)), alias="positive")
+    assert isinstance(registry.get("positive"), Int)
+
+    @converted(registry=registry)
+    def f(x: "positive"):
+        return x
+
+    assert f("1") == 1
+
+
+@pytest.mark.parametrize(
+    "converter", [Bounds(0, 1), Int(0, 1, 2), Float(0, 1), DecimalRange(0)]
+)
+def test_picklable(converter):
+    restored = pickle.loads(pickle.dumps(converter))
+    assert restored.__reduce__() == converter.__reduce__()
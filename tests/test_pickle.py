@@ -0,0 +1,87 @@
+import decimal
+import pickle
+from typing import List
+
+import pytest
+from limier import (
+    Cached,
+    ConversionError,
+    RowConversionError,
+    Equiv,
+    Filter,
+    OneOf,
+    Range,
+    Regex,
+    RegexSet,
+    Registry,
+    Transform,
+    chain,
+    for_bytes,
+    parallel_convert,
+)
+
+CONVERTERS = [
+    Filter(str.isdigit),
+    Transform(decimal.Decimal, raised_if_invalid=decimal.InvalidOperation),
+    OneOf("a", "b"),
+    Equiv({("yes", "y"): True}),
+    Regex(r"\w+"),
+    Range(),
+    RegexSet(Range(), Regex(r"\d+")),
+    Cached(int),
+    chain(str.strip, int),
+    for_bytes(OneOf("a")),
+    for_bytes(Filter(str.isdigit)),
+]
+
+
+@pytest.mark.parametrize("converter", CONVERTERS)
+def test_converters_are_picklable(converter):
+    assert pickle.loads(pickle.dumps(converter)) is not None
+
+
+def test_round_trip_behaves_the_same():
+    for converter, value in [(OneOf("a"), "a"), (chain(str.strip, int), " 1")]:
+        assert pickle.loads(pickle.dumps(converter))(value) == converter(value)
+
+
+@pytest.mark.parametrize(
+    "converter, value",
+    [
+        (Filter(str.isdigit), "a"),
+        (OneOf("a", "b"), "c"),
+        (Equiv({("yes", "y"): True}), "no"),
+        (Regex(r"\d+"), "a"),
+        (Transform(int), "a"),
+        (Registry.shared().get(List[int]), ["1", "a"]),
+    ],
+)
+def test_conversion_errors_are_picklable(converter, value):
+    with pytest.raises(ValueError) as ctx:
+        converter(value)
+    error = ConversionError(x=ctx.value)
+    loaded = pickle.loads(pickle.dumps(error))
+    assert loaded.errors == error.errors
+    assert repr(loaded.causes["x"]) == repr(ctx.value)
+    assert repr(ctx.value) == f"{type(ctx.value).__name__}({str(ctx.value)!r})"
+
+
+def test_row_conversion_errors_are_picklable():
+    loaded = pickle.loads(pickle.dumps(RowConversionError(3, {"x": "bad"})))
+    assert (loaded.index, loaded.errors) == (3, {"x": "bad"})
+
+
+def test_registries_are_picklable():
+    assert pickle.loads(pickle.dumps(Registry.shared())) is Registry.shared()
+    registry = Registry.default()
+    registry.converter(str.upper, alias="upper")
+    assert pickle.loads(pickle.dumps(registry)).get("upper") is str.upper
+
+
+def test_parallel_convert():
+    values = [str(index) for index in range(100)] + ["foo"]
+    converted, errors = parallel_convert(
+        chain(str.strip, int), values, workers=2, chunksize=7
+    )
+    assert converted == list(range(100)) + [None]
+    assert list(errors) == [100]
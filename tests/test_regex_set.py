@@ -0,0 +1,43 @@
+import re
+
+import pytest
+from limier import Range, Regex, RegexSet
+
+
+class Slug(Regex):
+    pattern = r"(?P<head>[a-z]+)-(\d+)$"
+
+    def convert(self, match):
+        return match.group("head"), int(match.group(2)), match.groups()
+
+
+def test_dispatch():
+    converter = RegexSet(Range(), Slug(), Regex(r"[A-Z]+", flags=re.I))
+    assert converter("1:3") == range(1, 3)
+    assert converter("ab-12") == ("ab", 12, ("ab", "12"))
+    assert converter("abc") == "abc"
+
+
+def test_first_matching_converter_wins():
+    converter = RegexSet(Regex(r"\d"), Range())
+    assert converter("1:3") == "1:3"
+
+
+def test_no_match():
+    with pytest.raises(ValueError, match="did not match any of"):
+        RegexSet(Range(), Slug())("?")
+
+
+def test_duplicate_group_names():
+    with pytest.raises(ValueError):
+        RegexSet(Slug(), Slug())
+
+
+def test_global_inline_flags():
+    regex_set = RegexSet(Regex(r"(?i)abc$"), Regex(r"(?s)(?m)x.y$"), Range())
+    assert regex_set("ABC") == "ABC"
+    assert regex_set("x\ny") == "x\ny"
+    assert regex_set("1..3") == range(1, 3)
+    with pytest.raises(ValueError):
+        regex_set("abd")
+    assert RegexSet(Regex(rb"(?i)abc"))(b"ABC") == b"ABC"
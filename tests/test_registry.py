@@ -0,0 +1,169 @@
+import decimal
+import pickle
+import subprocess
+import sys
+import threading
+
+import limier
+import pytest
+from limier import Cached, Registry, converted
+
+
+def test_shared_registry_is_frozen():
+    shared = Registry.shared()
+    assert shared is Registry.shared()
+    assert shared.frozen
+    with pytest.raises(TypeError):
+        shared.converter(int, alias="int")
+
+
+def test_default_registries_are_independent():
+    first = Registry.default()
+    second = Registry.default()
+    first.converter(str.upper, alias="upper")
+    assert "upper" in first
+    assert "upper" not in second
+    assert "upper" not in Registry.shared()
+    assert first.get(bool) is Registry.shared().get(bool)
+
+
+def test_derive_copies_on_write():
+    parent = Registry()
+    parent.converter(int, alias="number")
+    child = parent.derive()
+    parent.converter(float, alias="number")
+    child.converter(str, alias="text")
+    assert child.get("number") is int
+    assert parent.get("number") is float
+    assert "text" not in parent
+
+
+def test_decorations_share_the_default_registry():
+    @converted
+    def f(x: bool):
+        return x
+
+    assert f("yes") is True
+
+
+def test_module_level_helpers_apply_to_decorators(monkeypatch):
+    monkeypatch.setattr(Registry, "_global", None)
+    assert Registry.current() is Registry.shared()
+
+    limier.cache(decimal.Decimal)
+    assert Registry.current() is Registry.global_registry()
+
+    @converted
+    def f(x: decimal.Decimal):
+        return x
+
+    assert isinstance(f.__limier_plan__.converters["x"], Cached)
+
+    limier.converter(str.upper, alias="upper")
+
+    @converted
+    def g(x: "upper"):
+        return x
+
+    assert g("a") == "A"
+    assert limier.get("upper") is str.upper
+    assert "upper" not in Registry.shared()
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, time; start = time.perf_counter(); import limier; "
+        "elapsed = time.perf_counter() - start; "
+        "assert limier.Registry._shared is None; "
+        "assert limier.Registry._global is None; "
+        "assert 'limier.aliases' not in sys.modules; "
+        "assert 'numpy' not in sys.modules; "
+        "assert 'asyncio' not in sys.modules; "
+        "assert 'concurrent.futures.process' not in sys.modules; "
+        "assert elapsed < 0.5, elapsed"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_modifications_publish_a_new_version():
+    registry = Registry.default()
+    version = registry.version
+    registry.converter(int, alias="number")
+    assert registry.version == version + 1
+    registry.cache("number")
+    assert registry.version == version + 2
+
+
+def test_decorated_functions_pick_up_modifications():
+    registry = Registry.default()
+    registry.converter(int, alias="number")
+
+    @converted(registry=registry)
+    def f(x: "number", *args, y: "number" = "0", **kwargs):
+        return x, args, y, kwargs
+
+    assert f("1", "2", y="3", z="4") == (1, ("2",), 3, {"z": "4"})
+    registry.converter(float, alias="number")
+    assert f("1", "2", y="3", z="4") == (1.0, ("2",), 3.0, {"z": "4"})
+    assert f("1") == (1.0, (), 0.0, {})
+
+
+def test_modifications_apply_to_typed_defaults():
+    registry = Registry.default()
+    registry.converter(int, alias="number")
+
+    @converted(registry=registry, typed=True)
+    def f(x: "number" = "5"):
+        return x
+
+    assert f() == 5
+
+    def not_five(value):
+        if value == "5":
+            raise ValueError("five")
+        return int(value)
+
+    registry.converter(not_five, alias="number")
+    with pytest.raises(limier.ConversionError) as ctx:
+        f()
+    assert ctx.value.errors == {"x": "five"}
+    assert f("3") == 3
+
+
+def test_frozen_registries_are_not_watched():
+    @converted
+    def f(x: int):
+        return x
+
+    assert f.__limier_plan__.registry is None
+    assert "_limier_registry" not in f.__limier_plan__.source()
+
+
+def test_concurrent_lookups_and_modifications():
+    registry = Registry.default()
+    registry.converter(int, alias="number")
+
+    @converted(registry=registry)
+    def f(x: "number"):
+        return x
+
+    def read():
+        for _ in range(2000):
+            assert f("1") in (1, 1.0)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for index in range(200):
+        registry.converter(float if index % 2 else int, alias="number")
+    for thread in threads:
+        thread.join()
+
+
+def test_registry_is_picklable():
+    registry = Registry.default()
+    registry.converter(int, alias="number")
+    restored = pickle.loads(pickle.dumps(registry))
+    assert restored.get("number") is int
+    restored.converter(float, alias="number")
+    assert registry.get("number") is int
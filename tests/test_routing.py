@@ -0,0 +1,164 @@
+from typing import List, Optional, Set
+
+import pytest
+from limier import (
+    ConversionError,
+    Lazy,
+    PathTemplate,
+    QueryParser,
+    Registry,
+    RouteTable,
+    converted,
+)
+
+
+@pytest.fixture(name="registry")
+def fixture_registry():
+    registry = Registry.default()
+
+    @registry.converter
+    def slug(value: str) -> str:
+        if not value.replace("-", "").isalnum():
+            raise ValueError(f"not a slug: '{value}'")
+        return value
+
+    return registry
+
+
+def test_path_template(registry):
+    template = PathTemplate("/users/{id:int}/files/{name:slug}", registry)
+    assert template.prefix == "/users/"
+    assert template.match("/users/12/files/my-notes") == {
+        "id": 12,
+        "name": "my-notes",
+    }
+    assert template.match("/users/12") is None
+    with pytest.raises(ConversionError) as ctx:
+        template.match("/users/foo/files/a.b")
+    assert set(ctx.value.errors) == {"id", "name"}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "/{x:nope}",
+        "/run/{x:eval}",
+        "/run/{x:exec}",
+        "/{x:open}",
+        "/{x:__import__}",
+        "/{id:str.isdigit}",
+        "/{id",
+        "/id}",
+    ],
+)
+def test_invalid_template(template):
+    with pytest.raises(ValueError):
+        PathTemplate(template)
+
+
+def test_route_table(registry):
+    routes = RouteTable(registry)
+    routes.add("/", "home")
+    routes.add("/users/{id:int}", "user")
+    routes.add("/users/{name:slug}", "user_by_name")
+    routes.add("/users/{id:int}/files/{name}", "file")
+    routes.add("/{page}", "page")
+    assert len(routes) == 5
+
+    assert routes.match("/") == ("home", {})
+    assert routes.match("/users/12") == ("user", {"id": 12})
+    assert routes.match("/users/bob") == ("user_by_name", {"name": "bob"})
+    assert routes.match("/users/1/files/a.txt") == (
+        "file",
+        {"id": 1, "name": "a.txt"},
+    )
+    assert routes.match("/about") == ("page", {"page": "about"})
+    assert routes.match("/users/1/other") is None
+
+
+def test_route_table_conversion_error(registry):
+    routes = RouteTable(registry)
+    routes.add("/users/{id:int}")
+    with pytest.raises(ConversionError):
+        routes.match("/users/bob")
+
+
+def search(q: str, page: int = 1, tag: List[str] = (), ids: Set[int] = None):
+    return q, page, tag, ids
+
+
+@pytest.mark.parametrize(
+    "query, arguments",
+    [
+        ("q=a", {"q": "a"}),
+        ("q=a&page=2&q=b", {"q": "b", "page": 2}),
+        ("q=caf%C3%A9+au+lait", {"q": "café au lait"}),
+        ("q=a&tag=x&tag=y", {"q": "a", "tag": ["x", "y"]}),
+        ("q=a&ids=1&ids=2&ids=1", {"q": "a", "ids": {1, 2}}),
+        ("q=a&other=1&&page=", {"q": "a"}),
+        ("%71=a", {"q": "a"}),
+        (b"q=caf%C3%A9&page=3", {"q": "café", "page": 3}),
+        (memoryview(b"q=\xc3\xa9"), {"q": "é"}),
+    ],
+)
+def test_query_parser(query, arguments):
+    assert QueryParser(search).parse(query) == arguments
+
+
+def test_query_parser_errors():
+    with pytest.raises(ConversionError) as ctx:
+        QueryParser(search).parse("page=x&ids=1&ids=y")
+    assert ctx.value.errors == {
+        "q": "this field is required",
+        "page": "invalid literal for int() with base 10: 'x'",
+        "ids": "[1]: invalid literal for int() with base 10: 'y'",
+    }
+
+
+def test_query_parser_options(registry):
+    def find(name: "slug", limit: Optional[List[int]] = None, **extra):
+        return name, limit, extra
+
+    parser = QueryParser(find, registry, keep_blank_values=True)
+    assert parser("name=a-b&limit=1&utm=x&empty=") == (
+        "a-b",
+        [1],
+        {"utm": "x", "empty": ""},
+    )
+    assert QueryParser(find, registry, separator=";")("name=a;limit=2") == (
+        "a",
+        [2],
+        {},
+    )
+
+
+def test_query_parser_lazy():
+    def f(x: Lazy[int]):
+        return x
+
+    with pytest.raises(TypeError):
+        QueryParser(f)
+
+
+def test_query_parser_decorated(registry):
+    @converted(registry=registry, typed=True)
+    def find(name: "slug", page: int = "1", tags: List[str] = ()):
+        return name, page, tags
+
+    parser = QueryParser(find)
+    assert parser("name=a-b&tags=x&tags=y") == ("a-b", 1, ["x", "y"])
+    with pytest.raises(ConversionError):
+        parser("name=a+b")
+
+    registry.converter(str.upper, alias="slug")
+    assert parser("name=a+b") == ("A B", 1, [])
+
+
+@pytest.mark.parametrize("options", [{"lazy": ["x"]}, {"input_type": bytes}])
+def test_query_parser_unsupported_options(options):
+    @converted(**options)
+    def f(x: int):
+        return x
+
+    with pytest.raises(TypeError):
+        QueryParser(f)
@@ -0,0 +1,126 @@
+import os
+import pickle
+
+import pytest
+from limier import (
+    ConversionError,
+    MappedValues,
+    OneOf,
+    SortedValues,
+    converted,
+    for_bytes,
+)
+
+
+def test_sorted_integers():
+    values = SortedValues(range(0, 1000, 2))
+    assert len(values) == 500
+    assert 42 in values
+    assert 43 not in values
+    assert -2 not in values
+    assert "42" not in values
+    assert list(values)[:3] == [0, 2, 4]
+
+
+def test_sorted_strings():
+    values = SortedValues(["globex", "acme", "initech", "acme", "é"])
+    assert len(values) == 4
+    assert "acme" in values
+    assert "é" in values
+    assert "acm" not in values
+    assert b"globex" in values
+    assert memoryview(b"initech") in values
+    assert 1 not in values
+    assert list(values) == ["acme", "globex", "initech", "é"]
+
+
+def test_sorted_empty():
+    values = SortedValues([])
+    assert len(values) == 0
+    assert "a" not in values
+
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path):
+    path = str(tmp_path / "values.txt")
+    MappedValues.write(path, ["globex", "acme", "initech", "umbrella"])
+    return path
+
+
+def test_mapped(path):
+    values = MappedValues(path)
+    assert len(values) == 4
+    for value in ("acme", "globex", "initech", "umbrella", b"acme"):
+        assert value in values
+    for value in ("", "a", "acmee", "hooli", "zzz", 1):
+        assert value not in values
+    assert list(values) == ["acme", "globex", "initech", "umbrella"]
+
+
+def test_mapped_empty(tmp_path):
+    path = str(tmp_path / "empty.txt")
+    MappedValues.write(path, [])
+    values = MappedValues(path)
+    assert len(values) == 0
+    assert "a" not in values
+
+
+def test_mapped_rejects_newlines(tmp_path):
+    with pytest.raises(ValueError):
+        MappedValues.write(str(tmp_path / "values.txt"), ["a\nb"])
+
+
+def test_mapped_is_picklable(path):
+    values = pickle.loads(pickle.dumps(MappedValues(path)))
+    assert "acme" in values
+
+
+def test_one_of_using_container(path):
+    tenants = OneOf.using(MappedValues(path))
+
+    @converted
+    def get_tenant(name: tenants):
+        return name
+
+    assert get_tenant("acme") == "acme"
+    with pytest.raises(ConversionError):
+        get_tenant("hooli")
+    assert for_bytes(tenants)(b"acme") == b"acme"
+
+
+def test_one_of_reload(path):
+    tenants = OneOf.using(MappedValues(path))
+    new = path + ".new"
+    MappedValues.write(new, ["hooli"])
+    os.replace(new, path)
+    assert tenants("acme") == "acme"
+    tenants.reload()
+    assert tenants("hooli") == "hooli"
+    with pytest.raises(ValueError):
+        tenants("acme")
+
+    tenants.reload({"acme"})
+    assert tenants("acme") == "acme"
+
+
+def test_one_of_reload_bytes_variant(path):
+    tenants = OneOf("acme")
+
+    @converted(input_type=bytes)
+    def get(tenant: tenants):
+        return tenant
+
+    assert get(b"acme") == b"acme"
+    tenants.reload({"hooli"})
+    assert get(memoryview(b"hooli")) == b"hooli"
+    with pytest.raises(ConversionError):
+        get(b"acme")
+
+    tenants.reload(MappedValues(path))
+    assert get(b"acme") == b"acme"
+    assert for_bytes(tenants) is for_bytes(tenants)
+
+
+def test_large_one_of_failure_message():
+    message = str(pytest.raises(ValueError, OneOf(*range(100)), -1).value)
+    assert message == "expected one of 100 values, got '-1'"
@@ -0,0 +1,40 @@
+import pytest
+from limier import RowConversionError, converted
+
+
+def add(x: int, y: int = 0):
+    return x + y
+
+
+def test_stream():
+    rows = [("1", "2"), {"x": "3"}, ("foo", "bar"), {"x": "4", "y": "x"}]
+    stream = converted.stream(add, rows)
+    assert list(stream) == [3, 3]
+    assert [error.index for error in stream.errors] == [2, 3]
+    assert set(stream.errors[0].errors) == {"x", "y"}
+
+
+def test_stream_is_lazy():
+    def rows():
+        yield ("1",)
+        raise RuntimeError("consumed too far")
+
+    iterator = iter(converted.stream(converted(add), rows()))
+    assert next(iterator) == 1
+
+
+def test_fail_fast():
+    stream = converted.stream(add, [("1",), ("foo",), ("2",)], fail_fast=True)
+    iterator = iter(stream)
+    assert next(iterator) == 1
+    with pytest.raises(RowConversionError) as ctx:
+        next(iterator)
+    assert ctx.value.index == 1
+
+
+def test_on_error():
+    seen = []
+    stream = converted.stream(add, [("foo",)], on_error=seen.append)
+    assert list(stream) == []
+    assert [error.index for error in seen] == [0]
+    assert stream.errors == []
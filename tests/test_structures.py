@@ -0,0 +1,172 @@
+import pickle
+import threading
+import time
+from dataclasses import InitVar, dataclass, field
+from typing import ClassVar, List, NamedTuple, Optional
+
+import pytest
+from limier import (
+    ConversionError,
+    InvalidFields,
+    Registry,
+    Structure,
+    converted,
+)
+
+
+@dataclass
+class Address:
+    zip: int
+    city: str = "Paris"
+
+
+class Point(NamedTuple):
+    x: int
+    y: int = 0
+
+
+class Tag:
+    __slots__ = ("name", "weight")
+    name: str
+    weight: float
+
+
+@dataclass
+class User:
+    name: str
+    address: Address
+    tags: List[Tag] = field(default_factory=list)
+    location: Optional[Point] = None
+    friends: List["User"] = field(default_factory=list)
+
+
+@converted
+def create(user: User):
+    return user
+
+
+def test_nested():
+    user = create(
+        {
+            "name": "alice",
+            "address": {"zip": "75001"},
+            "tags": [{"name": "admin", "weight": "0.5"}],
+            "location": {"x": "1"},
+            "friends": [{"name": "bob", "address": {"zip": 1000}}],
+            "unknown": "ignored",
+        }
+    )
+    assert user.address == Address(75001)
+    assert user.tags[0].name == "admin"
+    assert user.tags[0].weight == 0.5
+    assert user.location == Point(1, 0)
+    assert user.friends[0].name == "bob"
+    assert user.friends[0].tags == []
+
+
+def test_instances_are_passed_as_is():
+    user = User("alice", Address(75001))
+    assert create(user) is user
+
+
+def test_errors_are_path_qualified():
+    with pytest.raises(ConversionError) as ctx:
+        create(
+            {
+                "address": {"zip": "foo"},
+                "tags": [{"name": "admin"}],
+                "friends": [{"name": "bob", "address": "nowhere"}],
+            }
+        )
+    assert ctx.value.errors == {
+        "user.name": "this field is required",
+        "user.address.zip": "invalid literal for int() with base 10: 'foo'",
+        "user.tags[0].weight": "this field is required",
+        "user.friends[0].address": "expected a mapping, got 'nowhere'",
+    }
+
+
+def test_init_vars():
+    @dataclass
+    class Scaled:
+        value: int
+        unit: ClassVar[str] = "m"
+        scale: InitVar[int] = 1
+
+        def __post_init__(self, scale):
+            self.value *= scale
+
+    to_scaled = Structure(Scaled)
+    assert to_scaled({"value": "2", "scale": "3", "unit": "x"}).value == 6
+    assert to_scaled({"value": "2"}).value == 2
+    with pytest.raises(InvalidFields) as ctx:
+        to_scaled({"value": "2", "scale": "x"})
+    assert set(ctx.value.errors) == {"scale"}
+
+
+def test_inherited_slots():
+    class Weighted(Tag):
+        __slots__ = ("unit",)
+        unit: str
+
+    tag = Structure(Weighted)({"name": "a", "weight": "1", "unit": "kg"})
+    assert (tag.name, tag.weight, tag.unit) == ("a", 1.0, "kg")
+    with pytest.raises(InvalidFields) as ctx:
+        Structure(Weighted)({"unit": "kg"})
+    assert set(ctx.value.errors) == {"name", "weight"}
+
+
+@dataclass
+class Settings:
+    active: bool
+    flags: List[bool]
+
+
+def test_booleans_are_passed_as_is():
+    to_settings = Structure(Settings)
+    settings = to_settings({"active": True, "flags": [False, "yes"]})
+    assert settings == Settings(True, [False, True])
+    with pytest.raises(InvalidFields):
+        to_settings({"active": 1, "flags": []})
+
+
+def test_direct_use():
+    to_point = Structure(Point)
+    assert to_point({"x": "1", "y": "2"}) == Point(1, 2)
+    with pytest.raises(InvalidFields) as ctx:
+        to_point({"x": "a", "y": "b"})
+    assert set(ctx.value.errors) == {"x", "y"}
+
+
+def test_uses_registry():
+    registry = Registry.default()
+    registry.converter(lambda value: value.upper(), alias=str)
+    to_address = registry.get(Address)
+    assert to_address({"zip": 1, "city": "lyon"}).city == "LYON"
+
+
+def test_picklable():
+    to_user = pickle.loads(pickle.dumps(Registry.shared().get(User)))
+    assert to_user({"name": "a", "address": {"zip": "1"}}).address.zip == 1
+
+
+def test_first_use_from_several_threads():
+    to_user = Structure(User)
+    compile_ = to_user._compile
+
+    def slow_compile():
+        time.sleep(0.1)
+        return compile_()
+
+    to_user._compile = slow_compile
+    results = []
+
+    def convert():
+        results.append(to_user({"name": "a", "address": {"zip": "1"}}))
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [user.address.zip for user in results] == [1, 1, 1, 1]
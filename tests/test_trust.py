@@ -0,0 +1,88 @@
+import asyncio
+import decimal
+import threading
+
+import pytest
+from limier import ConversionError, Lazy, converted, trusted
+
+
+@converted(bypass=True, typed=True)
+def add(x: int, y: int = "2"):
+    return x, y
+
+
+@converted
+def strict(x: int):
+    return x
+
+
+def test_raw():
+    assert add.raw("1", "2") == ("1", "2")
+    assert strict.raw("1") == "1"
+
+
+def test_trusted_context():
+    with trusted():
+        assert add("1") == ("1", 2)
+        assert strict("1") == 1
+        with trusted(sample=1):
+            assert add("1") == (1, 2)
+        assert add("1") == ("1", 2)
+    assert add("1") == (1, 2)
+    with pytest.raises(ConversionError):
+        add("foo")
+
+
+def test_lazy_arguments():
+    @converted(bypass=True, lazy=["fee"])
+    def pay(amount: Lazy[decimal.Decimal], fee: int = "1"):
+        return amount.value, fee.value
+
+    with trusted():
+        assert pay("1.5") == (decimal.Decimal("1.5"), 1)
+        with pytest.raises(ConversionError):
+            pay("oops")
+
+
+def test_untyped_defaults_are_passed_as_declared():
+    @converted(bypass=True)
+    def f(x: int = "5"):
+        return x
+
+    assert f() == 5
+    with trusted():
+        assert f() == "5"
+
+
+def test_sampling():
+    with trusted(sample=0.5):
+        results = {add("1")[0] for _ in range(200)}
+    assert results == {1, "1"}
+
+
+def test_context_is_scoped():
+    results = []
+    with trusted():
+        thread = threading.Thread(target=lambda: results.append(add("1")))
+        thread.start()
+        thread.join()
+    # Threads do not inherit the context of the thread that started them.
+    assert results == [(1, 2)]
+
+
+def test_async():
+    @converted(bypass=True)
+    async def f(x: int):
+        return x
+
+    async def main():
+        with trusted():
+            return await f("1")
+
+    assert asyncio.run(main()) == "1"
+
+
+@pytest.mark.parametrize("sample", [-0.1, 1.5])
+def test_invalid_sample(sample):
+    with pytest.raises(ValueError):
+        trusted(sample=sample)
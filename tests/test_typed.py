@@ -0,0 +1,71 @@
+import decimal
+
+import pytest
+from limier import (
+    Bounds,
+    ConversionError,
+    Int,
+    Transform,
+    chain,
+    converted,
+)
+
+
+def test_defaults_are_converted_once():
+    calls = []
+
+    def counted(value) -> int:
+        calls.append(value)
+        return int(value)
+
+    @converted(typed=True)
+    def f(x: counted = "1"):
+        return x
+
+    assert calls == ["1"]
+    assert f() == 1
+    assert f() == 1
+    assert calls == ["1"]
+    assert f("2") == 2
+    assert calls == ["1", "2"]
+
+
+def test_typed_values_skip_the_converter():
+    calls = []
+
+    def counted(value) -> int:
+        calls.append(value)
+        return int(value)
+
+    @converted(typed=True)
+    def f(x: counted, y: float, z: Transform(decimal.Decimal)):
+        return x, y, z
+
+    # Only type constructors are skipped, not functions returning the type.
+    assert f(1, 2.5, decimal.Decimal(1)) == (1, 2.5, 1)
+    assert calls == [1]
+    assert f("1", "2.5", "1") == (1, 2.5, 1)
+    assert calls == [1, "1"]
+
+
+@pytest.mark.parametrize(
+    "converter", [Int(min=0), chain(int, Bounds(min=0)), Bounds(min=0)]
+)
+def test_validating_converters_are_not_skipped(converter):
+    @converted(typed=True)
+    def f(x: converter):
+        return x
+
+    assert f(5) == 5
+    with pytest.raises(ConversionError):
+        f(-5)
+
+
+def test_invalid_default_fails_on_call():
+    @converted(typed=True)
+    def f(x: int = "foo"):
+        return x
+
+    with pytest.raises(ConversionError):
+        f()
+    assert f(1) == 1